@@ -9,6 +9,8 @@ import os
 from .client import Firecrawl, AsyncFirecrawl, FirecrawlApp, AsyncFirecrawlApp
 from .v2.watcher import Watcher
 from .v2.watcher_async import AsyncWatcher
+from .v2.monitor import JobHandle, JobMonitor
+from .v2.monitor_async import AsyncJobHandle, AsyncJobMonitor
 from .v1 import (
     V1FirecrawlApp,
     AsyncV1FirecrawlApp,
@@ -79,6 +81,10 @@ __all__ = [
     'AsyncFirecrawlApp',
     'Watcher',
     'AsyncWatcher',
+    'JobMonitor',
+    'AsyncJobMonitor',
+    'JobHandle',
+    'AsyncJobHandle',
     'V1FirecrawlApp',
     'AsyncV1FirecrawlApp',
     'V1JsonConfig',
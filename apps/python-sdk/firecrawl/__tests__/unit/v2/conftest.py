@@ -0,0 +1,66 @@
+"""
+Shared builders for the v2 unit tests.
+
+Tests get them through fixtures: ``raw_document(i)`` is result document ``i`` as the
+API returns it, ``raw_documents(start, end)`` a range of them, and
+``status_routes(transport, path, pages)`` scripts a finished job's status pages on a
+``MockTransport``.
+"""
+
+import pytest
+
+
+def build_raw_document(i=0, metadata=None, **fields):
+    """
+    Result document ``i`` with the API's camelCase keys.
+
+    ``metadata`` entries are merged into the default metadata; other keyword arguments
+    add or replace top-level keys. A ``None`` value removes the key.
+    """
+    document = {
+        "markdown": f"# {i}",
+        "rawHtml": f"<p>{i}</p>",
+        "metadata": {"sourceURL": f"https://example.com/{i}", "statusCode": "200", "customTag": i},
+    }
+    document["metadata"].update(metadata or {})
+    document.update(fields)
+    document["metadata"] = {key: value for key, value in document["metadata"].items() if value is not None}
+    return {key: value for key, value in document.items() if value is not None}
+
+
+def add_status_routes(transport, path, pages, status="completed"):
+    """
+    Route the status ``pages`` (lists of documents) of job ``path`` on ``transport``.
+
+    Follow-up pages are chained through ``next`` links with ``skip`` offsets; the
+    counters follow the number of documents, and a ``limit=0`` counters-only page is
+    routed as well.
+    """
+    total = sum(len(docs) for docs in pages)
+    counters = {"success": True, "status": status, "completed": total, "total": total, "creditsUsed": total}
+    skip = 0
+    for index, docs in enumerate(pages):
+        following = skip + len(docs)
+        next_url = f"https://api.firecrawl.dev/v1{path[3:]}?skip={following}" if index + 1 < len(pages) else None
+        page_path = path if index == 0 else f"/v1{path[3:]}?skip={skip}"
+        transport.add("GET", page_path, json={**counters, "next": next_url, "data": docs})
+        skip = following
+    transport.add("GET", f"{path}?limit=0", json={**counters, "data": []})
+
+
+@pytest.fixture
+def raw_document():
+    return build_raw_document
+
+
+@pytest.fixture
+def raw_documents():
+    def build(start, end, **fields):
+        return [build_raw_document(i, **fields) for i in range(start, end)]
+
+    return build
+
+
+@pytest.fixture
+def status_routes():
+    return add_status_routes
@@ -14,10 +14,12 @@ from firecrawl.v2.types import (
     Document, 
     DocumentMetadata
 )
-from firecrawl.v2.methods.crawl import get_crawl_status, _fetch_all_pages
-from firecrawl.v2.methods.batch import get_batch_scrape_status, _fetch_all_batch_pages
+from firecrawl.v2.methods.crawl import get_crawl_status, _fetch_all_pages, iter_crawl_documents
+from firecrawl.v2.methods.batch import get_batch_scrape_status, _fetch_all_batch_pages, iter_batch_documents
 from firecrawl.v2.methods.aio.crawl import get_crawl_status as get_crawl_status_async, _fetch_all_pages_async
+from firecrawl.v2.methods.aio.crawl import iter_crawl_documents as iter_crawl_documents_async
 from firecrawl.v2.methods.aio.batch import get_batch_scrape_status as get_batch_scrape_status_async, _fetch_all_batch_pages_async
+from firecrawl.v2.methods.aio.batch import iter_batch_documents as iter_batch_documents_async
 
 
 class TestPaginationConfig:
@@ -565,6 +567,282 @@ class TestAsyncPagination:
         assert self.mock_client.get.call_count == 2
 
 
+class TestAsyncDocumentIterators:
+    """Test the async document iterators with page prefetch."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.sample_doc = {
+            "url": "https://example.com",
+            "markdown": "# Test Content",
+            "metadata": {"title": "Test Page"}
+        }
+
+    def _page(self, docs, next_url=None, status_code=200):
+        response = Mock()
+        response.status_code = status_code
+        response.json.return_value = {
+            "success": True,
+            "status": "completed",
+            "next": next_url,
+            "data": docs,
+        }
+        return response
+
+    @pytest.mark.asyncio
+    async def test_prefetches_next_page_while_consumer_processes(self):
+        """The next page is requested before the consumer finishes the current one."""
+        import asyncio
+
+        requested = []
+        pages = {
+            "/v2/crawl/c1": self._page([self.sample_doc], "https://api.firecrawl.dev/v1/crawl/c1?skip=1"),
+            "https://api.firecrawl.dev/v1/crawl/c1?skip=1": self._page([self.sample_doc], "https://api.firecrawl.dev/v1/crawl/c1?skip=2"),
+            "https://api.firecrawl.dev/v1/crawl/c1?skip=2": self._page([self.sample_doc]),
+        }
+
+        async def get(url, timeout=None):
+            requested.append(url)
+            return pages[url]
+
+        client = Mock()
+        client.get = get
+
+        documents = iter_crawl_documents_async(client, "c1", prefetch=2)
+        first = await documents.__anext__()
+        assert isinstance(first, Document)
+        # Give the background fetcher a chance to run ahead of the consumer
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert len(requested) == 3
+
+        rest = [doc async for doc in documents]
+        assert len(rest) == 2
+
+    @pytest.mark.asyncio
+    async def test_max_results_and_early_close(self):
+        """Stopping early cancels the background fetcher."""
+        client = AsyncMock()
+        client.get.side_effect = [
+            self._page([self.sample_doc, self.sample_doc], "https://api.firecrawl.dev/v1/batch/scrape/b1?skip=2"),
+            self._page([self.sample_doc, self.sample_doc], "https://api.firecrawl.dev/v1/batch/scrape/b1?skip=4"),
+            self._page([self.sample_doc, self.sample_doc]),
+        ]
+
+        documents = [
+            doc async for doc in iter_batch_documents_async(client, "b1", PaginationConfig(max_results=3))
+        ]
+
+        assert len(documents) == 3
+        client.get.assert_any_call("/v2/batch/scrape/b1", timeout=None)
+
+    @pytest.mark.asyncio
+    async def test_first_page_error_raises(self):
+        """Errors on the first page surface to the consumer."""
+        client = AsyncMock()
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {"success": False, "error": "Job not found"}
+        client.get.return_value = response
+
+        with pytest.raises(Exception, match="Job not found"):
+            [doc async for doc in iter_crawl_documents_async(client, "c1")]
+
+    @pytest.mark.asyncio
+    async def test_failed_follow_up_page_ends_iteration(self):
+        """A failing follow-up page ends the iteration with the documents seen so far."""
+        client = AsyncMock()
+        client.get.side_effect = [
+            self._page([self.sample_doc], "https://api.firecrawl.dev/v1/crawl/c1?skip=1"),
+            self._page([], status_code=500),
+        ]
+
+        documents = [doc async for doc in iter_crawl_documents_async(client, "c1")]
+
+        assert len(documents) == 1
+        assert client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stops_when_cursor_does_not_advance(self):
+        """The background fetcher does not re-request a next link that keeps the same cursor."""
+        client = AsyncMock()
+        client.get.side_effect = [
+            self._page([self.sample_doc], "https://api.firecrawl.dev/v1/crawl/c1?skip=1"),
+            self._page([], "https://api.firecrawl.dev/v1/crawl/c1?skip=1"),
+            self._page([], "https://api.firecrawl.dev/v1/crawl/c1?skip=1"),
+        ]
+
+        documents = [doc async for doc in iter_crawl_documents_async(client, "c1")]
+
+        assert len(documents) == 1
+        assert client.get.call_count == 2
+
+
+class FakeListing:
+    """Status endpoint of a finished job listing ``total`` results, cutting pages at ``cap`` results like the size cap."""
+
+    def __init__(self, total, cap=None, status="completed", fail_at=None):
+        self.total = total
+        self.cap = cap
+        self.status = status
+        self.fail_at = fail_at
+        self.urls = []
+
+    def get(self, url, timeout=None):
+        from urllib.parse import parse_qs, urlparse
+
+        self.urls.append(url)
+        query = parse_qs(urlparse(url).query)
+        skip = int(query.get("skip", ["0"])[0])
+        limit = int(query.get("limit", ["100"])[0])
+        response = Mock()
+        response.ok = True
+        response.status_code = 200
+        if self.fail_at is not None and skip == self.fail_at:
+            response.ok = False
+            response.status_code = 500
+            return response
+        count = min(limit, self.cap or limit, max(0, self.total - skip))
+        end = skip + count
+        next_url = None
+        if end < self.total:
+            next_url = f"https://api.firecrawl.dev/v1/crawl/c1?skip={end}" + (f"&limit={query['limit'][0]}" if "limit" in query else "")
+        response.json.return_value = {
+            "success": True,
+            "status": self.status,
+            "completed": self.total,
+            "total": self.total,
+            "next": next_url,
+            "data": [{"markdown": str(i), "metadata": {"sourceURL": f"https://example.com/{i}"}} for i in range(skip, end)],
+        }
+        return response
+
+    async def aget(self, url, timeout=None):
+        return self.get(url, timeout=timeout)
+
+
+class TestParallelPagination:
+    """Test concurrent page fetching for finished jobs."""
+
+    def _urls(self, documents):
+        return [doc.metadata.source_url for doc in documents]
+
+    def _expected(self, count):
+        return [f"https://example.com/{i}" for i in range(count)]
+
+    def test_fetches_offsets_concurrently_in_order(self):
+        """All pages are requested with explicit offsets and reassembled in listing order."""
+        listing = FakeListing(total=450)
+        client = Mock()
+        client.get.side_effect = listing.get
+
+        result = get_crawl_status(client, "c1", PaginationConfig(max_concurrent_pages=4))
+
+        assert self._urls(result.data) == self._expected(450)
+        assert sorted(listing.urls[1:]) == sorted(
+            f"https://api.firecrawl.dev/v1/crawl/c1?skip={skip}&limit={min(100, 450 - skip)}"
+            for skip in (100, 200, 300, 400)
+        )
+
+    def test_fills_pages_cut_short_by_size_cap(self):
+        """A short page is continued from its next offset within its slot."""
+        listing = FakeListing(total=250, cap=40)
+        client = Mock()
+        client.get.side_effect = listing.get
+
+        result = get_batch_scrape_status(client, "c1", PaginationConfig(max_concurrent_pages=3))
+
+        assert self._urls(result.data) == self._expected(250)
+
+    def test_respects_max_results_and_max_pages(self):
+        """max_results and max_pages bound the pages requested."""
+        listing = FakeListing(total=1000)
+        client = Mock()
+        client.get.side_effect = listing.get
+
+        result = get_crawl_status(client, "c1", PaginationConfig(max_concurrent_pages=4, max_results=250))
+        assert self._urls(result.data) == self._expected(250)
+        assert len(listing.urls) == 3
+
+        listing.urls.clear()
+        result = get_crawl_status(client, "c1", PaginationConfig(max_concurrent_pages=4, max_pages=2))
+        assert len(result.data) == 300
+        assert len(listing.urls) == 3
+
+    def test_failed_page_ends_results(self):
+        """Results stop at a failed page, like sequential pagination."""
+        listing = FakeListing(total=400, fail_at=200)
+        client = Mock()
+        client.get.side_effect = listing.get
+
+        result = get_crawl_status(client, "c1", PaginationConfig(max_concurrent_pages=4))
+
+        assert self._urls(result.data) == self._expected(200)
+
+    def test_running_job_follows_next_links(self):
+        """Jobs that are still running are paginated sequentially."""
+        listing = FakeListing(total=250, status="scraping")
+        client = Mock()
+        client.get.side_effect = listing.get
+
+        result = get_crawl_status(client, "c1", PaginationConfig(max_concurrent_pages=4))
+
+        assert len(result.data) == 250
+        assert listing.urls[1:] == [
+            "https://api.firecrawl.dev/v1/crawl/c1?skip=100",
+            "https://api.firecrawl.dev/v1/crawl/c1?skip=200",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_async_fetches_offsets_concurrently(self):
+        """The async status helpers fetch pages concurrently too."""
+        listing = FakeListing(total=330, cap=70)
+        client = AsyncMock()
+        client.get.side_effect = listing.aget
+
+        crawl = await get_crawl_status_async(client, "c1", PaginationConfig(max_concurrent_pages=3))
+        batch = await get_batch_scrape_status_async(client, "c1", PaginationConfig(max_concurrent_pages=3, page_size=50))
+
+        assert self._urls(crawl.data) == self._expected(330)
+        assert self._urls(batch.data) == self._expected(330)
+
+
+    @pytest.mark.asyncio
+    async def test_async_iterator_keeps_prefetch_requests_in_flight(self):
+        """The async document iterator requests a finished job's pages by offset, prefetch at a time."""
+        import asyncio
+
+        listing = FakeListing(total=450, cap=70)
+        in_flight = peak = 0
+
+        async def get(url, timeout=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return listing.get(url)
+
+        client = AsyncMock()
+        client.get.side_effect = get
+
+        documents = [doc async for doc in iter_crawl_documents_async(client, "c1", prefetch=3)]
+
+        assert self._urls(documents) == self._expected(450)
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_async_iterator_stops_at_failed_offset_page(self):
+        """A failed page ends the async iteration with the documents before it."""
+        listing = FakeListing(total=400, fail_at=200)
+        client = AsyncMock()
+        client.get.side_effect = listing.aget
+
+        documents = [doc async for doc in iter_batch_documents_async(client, "c1", prefetch=4)]
+
+        assert self._urls(documents) == self._expected(200)
+
+
 class TestPaginationEdgeCases:
     """Test pagination edge cases and error conditions."""
     
@@ -667,5 +945,118 @@ class TestPaginationEdgeCases:
         assert self.mock_client.get.call_count == 2
 
 
+class TestDocumentIterators:
+    """Test the streaming document iterators."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_client = Mock()
+        self.sample_doc = {
+            "url": "https://example.com",
+            "markdown": "# Test Content",
+            "metadata": {"title": "Test Page"}
+        }
+
+    def _page(self, docs, next_url=None):
+        response = Mock()
+        response.ok = True
+        response.json.return_value = {
+            "success": True,
+            "status": "completed",
+            "completed": 4,
+            "total": 4,
+            "next": next_url,
+            "data": docs,
+        }
+        return response
+
+    def test_iter_crawl_documents_fetches_pages_lazily(self):
+        """Pages are requested only as the iterator is consumed."""
+        self.mock_client.get.side_effect = [
+            self._page([self.sample_doc, self.sample_doc], "https://api.firecrawl.dev/v1/crawl/c1?skip=2"),
+            self._page([self.sample_doc, self.sample_doc]),
+        ]
+
+        documents = iter_crawl_documents(self.mock_client, "c1", request_timeout=3)
+        assert self.mock_client.get.call_count == 0
+
+        first = next(documents)
+        assert isinstance(first, Document)
+        assert self.mock_client.get.call_count == 1
+        self.mock_client.get.assert_called_with("/v2/crawl/c1", timeout=3)
+
+        assert len(list(documents)) == 3
+        assert self.mock_client.get.call_count == 2
+        self.mock_client.get.assert_called_with("https://api.firecrawl.dev/v1/crawl/c1?skip=2", timeout=3)
+
+    def test_iter_crawl_documents_max_results(self):
+        """max_results stops the iteration without fetching further pages."""
+        self.mock_client.get.side_effect = [
+            self._page([self.sample_doc, self.sample_doc], "https://api.firecrawl.dev/v1/crawl/c1?skip=2"),
+            self._page([self.sample_doc, self.sample_doc], "https://api.firecrawl.dev/v1/crawl/c1?skip=4"),
+        ]
+
+        documents = list(iter_crawl_documents(self.mock_client, "c1", PaginationConfig(max_results=3)))
+
+        assert len(documents) == 3
+        assert self.mock_client.get.call_count == 2
+
+    def test_iter_crawl_documents_max_pages_and_auto_paginate(self):
+        """max_pages counts follow-up pages; auto_paginate=False yields the first page only."""
+        self.mock_client.get.side_effect = [
+            self._page([self.sample_doc], "https://api.firecrawl.dev/v1/crawl/c1?skip=1"),
+            self._page([self.sample_doc], "https://api.firecrawl.dev/v1/crawl/c1?skip=2"),
+        ]
+        assert len(list(iter_crawl_documents(self.mock_client, "c1", PaginationConfig(max_pages=1)))) == 2
+
+        self.mock_client.get.reset_mock()
+        self.mock_client.get.side_effect = [
+            self._page([self.sample_doc], "https://api.firecrawl.dev/v1/crawl/c1?skip=1"),
+        ]
+        assert len(list(iter_crawl_documents(self.mock_client, "c1", PaginationConfig(auto_paginate=False)))) == 1
+        assert self.mock_client.get.call_count == 1
+
+    def test_iter_crawl_documents_first_page_error(self):
+        """A failing first page raises like get_crawl_status."""
+        response = Mock()
+        response.ok = True
+        response.json.return_value = {"success": False, "error": "Job not found"}
+        self.mock_client.get.return_value = response
+
+        with pytest.raises(Exception, match="Job not found"):
+            list(iter_crawl_documents(self.mock_client, "c1"))
+
+    def test_iter_batch_documents_stops_on_failed_page(self):
+        """A failing follow-up page ends the iteration with the documents seen so far."""
+        failed = Mock()
+        failed.ok = False
+        failed.status_code = 500
+        self.mock_client.get.side_effect = [
+            self._page([self.sample_doc, "https://example.com"], "https://api.firecrawl.dev/v1/batch/scrape/b1?skip=2"),
+            failed,
+        ]
+
+        documents = list(iter_batch_documents(self.mock_client, "b1"))
+
+        assert len(documents) == 1
+        self.mock_client.get.assert_any_call("/v2/batch/scrape/b1", timeout=None)
+
+
+    def test_iter_crawl_documents_stops_when_cursor_does_not_advance(self):
+        """A running job returning the same next link ends the iteration instead of re-requesting it."""
+        stalled = self._page([], "https://api.firecrawl.dev/v1/crawl/c1?skip=1")
+        stalled.json.return_value["status"] = "scraping"
+        self.mock_client.get.side_effect = [
+            self._page([self.sample_doc], "https://api.firecrawl.dev/v1/crawl/c1?skip=1"),
+            stalled,
+            stalled,
+        ]
+
+        documents = list(iter_crawl_documents(self.mock_client, "c1"))
+
+        assert len(documents) == 1
+        assert self.mock_client.get.call_count == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
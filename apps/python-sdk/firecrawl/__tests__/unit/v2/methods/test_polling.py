@@ -0,0 +1,153 @@
+import asyncio
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.methods.batch import wait_for_batch_completion
+from firecrawl.v2.methods.crawl import wait_for_crawl_completion
+from firecrawl.v2.utils.polling import next_skip, status_endpoint
+from firecrawl.v2.utils.transport import MockTransport
+
+
+class FakeJob:
+    """Status endpoint of a job finishing ``step`` documents per caught-up poll, served in pages of two."""
+
+    def __init__(self, path, total=5, page_size=2, step=1):
+        self.path = path
+        self.total = total
+        self.step = step
+        self.page_size = page_size
+        self.available = 0
+        self.served = []
+
+    def __call__(self, request):
+        parsed = urlparse(request.url)
+        if parsed.path[3:] != self.path[3:]:
+            return None
+        query = parse_qs(parsed.query)
+        skip = int(query.get("skip", ["0"])[0])
+        limit = int(query["limit"][0]) if "limit" in query else self.page_size
+        if skip == 0 or skip >= self.available:
+            # A poll that is not paging through existing results observes more finished documents
+            self.available = min(self.total, self.available + self.step)
+        status = "completed" if self.available == self.total else "scraping"
+        docs = [f"https://example.com/{i}" for i in range(skip, min(self.available, skip + limit))]
+        self.served.extend(docs)
+        end = skip + len(docs)
+        next_url = None
+        if status != "completed" or end < self.available:
+            next_url = f"https://api.firecrawl.dev/v1{self.path[3:]}?skip={end}"
+        return {
+            "success": True,
+            "status": status,
+            "completed": self.available,
+            "total": self.total,
+            "creditsUsed": self.available,
+            "data": [{"markdown": d, "metadata": {"sourceURL": d}} for d in docs],
+            "next": next_url,
+        }
+
+
+def _urls(job):
+    return [doc.metadata.source_url for doc in job.data]
+
+
+class TestPollingHelpers:
+    def test_status_endpoint(self):
+        assert status_endpoint("/v2/crawl/c1") == "/v2/crawl/c1"
+        assert status_endpoint("/v2/crawl/c1", skip=0, limit=0) == "/v2/crawl/c1?limit=0"
+        assert status_endpoint("/v2/crawl/c1", skip=4) == "/v2/crawl/c1?skip=4"
+
+    def test_next_skip(self):
+        assert next_skip(None) is None
+        assert next_skip("https://api.firecrawl.dev/v1/crawl/c1?skip=10&limit=5") == 10
+        assert next_skip("https://api.firecrawl.dev/v1/crawl/c1") is None
+
+
+class TestWaitForCrawlCompletion:
+    def test_incremental_downloads_each_document_once(self):
+        job = FakeJob("/v2/crawl/c1")
+        client = FirecrawlClient(api_key="key", transport=MockTransport(job))
+
+        result = wait_for_crawl_completion(client.http_client, "c1", poll_interval=0, poll_mode="incremental")
+
+        assert result.status == "completed"
+        assert result.next is None
+        assert _urls(result) == [f"https://example.com/{i}" for i in range(5)]
+        assert sorted(job.served) == sorted(set(job.served))
+
+    def test_counters_polls_without_documents_then_downloads_once(self):
+        job = FakeJob("/v2/crawl/c1")
+        transport = MockTransport(job)
+        client = FirecrawlClient(api_key="key", transport=transport)
+
+        result = wait_for_crawl_completion(client.http_client, "c1", poll_interval=0, poll_mode="counters")
+
+        assert result.status == "completed"
+        assert len(result.data) == 5
+        assert len(job.served) == 5
+        polls = [r.target for r in transport.requests if r.target.endswith("limit=0")]
+        assert len(polls) == 5
+
+    def test_full_mode_refetches_pages(self):
+        job = FakeJob("/v2/crawl/c1")
+        client = FirecrawlClient(api_key="key", transport=MockTransport(job))
+
+        result = wait_for_crawl_completion(client.http_client, "c1", poll_interval=0)
+
+        assert len(result.data) == 5
+        assert len(job.served) > 5
+
+    def test_incremental_timeout(self):
+        job = FakeJob("/v2/crawl/c1", step=0)
+        client = FirecrawlClient(api_key="key", transport=MockTransport(job))
+
+        with pytest.raises(TimeoutError, match="did not complete within 0 seconds"):
+            wait_for_crawl_completion(client.http_client, "c1", poll_interval=0.01, timeout=0, poll_mode="incremental")
+
+    def test_rejects_unknown_mode(self):
+        client = FirecrawlClient(api_key="key", transport=MockTransport())
+        with pytest.raises(ValueError, match="poll_mode"):
+            wait_for_crawl_completion(client.http_client, "c1", poll_mode="delta")
+
+
+class TestWaitForBatchCompletion:
+    def test_incremental_downloads_each_document_once(self):
+        job = FakeJob("/v2/batch/scrape/b1", total=3)
+        client = FirecrawlClient(api_key="key", transport=MockTransport(job))
+
+        result = wait_for_batch_completion(client.http_client, "b1", poll_interval=0, poll_mode="incremental")
+
+        assert result.status == "completed"
+        assert result.credits_used == 3
+        assert _urls(result) == [f"https://example.com/{i}" for i in range(3)]
+        assert len(job.served) == 3
+
+
+class TestAsyncWaitCrawl:
+    def test_incremental_downloads_each_document_once(self):
+        job = FakeJob("/v2/crawl/c1")
+
+        async def run():
+            client = AsyncFirecrawlClient(api_key="key", transport=MockTransport(job))
+            return await client.wait_crawl("c1", poll_interval=0, poll_mode="incremental")
+
+        result = asyncio.run(run())
+
+        assert _urls(result) == [f"https://example.com/{i}" for i in range(5)]
+        assert len(job.served) == 5
+
+    def test_batch_counters(self):
+        job = FakeJob("/v2/batch/scrape/b1", total=3)
+
+        async def run():
+            client = AsyncFirecrawlClient(api_key="key", transport=MockTransport(job))
+            return await client.wait_batch_scrape("b1", poll_interval=0, poll_mode="counters")
+
+        result = asyncio.run(run())
+
+        assert result.status == "completed"
+        assert len(result.data) == 3
+        assert len(job.served) == 3
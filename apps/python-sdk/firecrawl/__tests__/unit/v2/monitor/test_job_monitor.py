@@ -0,0 +1,237 @@
+import asyncio
+import threading
+from urllib.parse import urlparse
+
+import pytest
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.monitor import JobMonitor
+from firecrawl.v2.monitor_async import AsyncJobMonitor
+from firecrawl.v2.utils.error_handler import UnauthorizedError
+from firecrawl.v2.utils.polling import AdaptivePollScheduler
+from firecrawl.v2.utils.transport import MockTransport, TransportResponse
+
+FAST = AdaptivePollScheduler(min_interval=0.001, max_interval=0.01, initial_interval=0.001)
+
+
+class FakeServer:
+    """Status endpoints for crawl, batch and extract jobs finishing after ``polls`` status checks."""
+
+    def __init__(self, polls=3, status="completed"):
+        self.polls = polls
+        self.status = status
+        self.checks = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def _progress(self, job_id):
+        with self._lock:
+            self.checks[job_id] = self.checks.get(job_id, 0) + 1
+            return min(self.checks[job_id], self.polls)
+
+    def __call__(self, request):
+        parsed = urlparse(request.url)
+        parts = parsed.path.strip("/").split("/")
+        job_id = parts[-1]
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if parts[1] == "extract":
+                done = self._progress(job_id) >= self.polls
+                return {"success": True, "id": job_id, "status": self.status if done else "processing", "data": {"id": job_id}}
+            if parsed.query == "limit=0":
+                completed = self._progress(job_id)
+                status = self.status if completed >= self.polls else "scraping"
+                return {"success": True, "status": status, "completed": completed, "total": self.polls}
+            return {
+                "success": True,
+                "status": self.status,
+                "completed": self.polls,
+                "total": self.polls,
+                "data": [{"markdown": job_id, "metadata": {"sourceURL": f"https://example.com/{job_id}"}}],
+                "next": None,
+            }
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class TestJobMonitor:
+    def test_completes_futures_for_many_jobs(self):
+        server = FakeServer()
+        client = FirecrawlClient(api_key="key", transport=MockTransport(server))
+
+        with JobMonitor(client, scheduler=FAST, max_concurrent_polls=4) as monitor:
+            futures = {f"c{i}": monitor.watch(f"c{i}", kind="crawl") for i in range(30)}
+            futures["b1"] = monitor.watch("b1", kind="batch")
+            futures["e1"] = monitor.watch("e1", kind="extract")
+            results = {job_id: future.result(timeout=10) for job_id, future in futures.items()}
+
+        assert results["c7"].status == "completed"
+        assert results["c7"].data[0].markdown == "c7"
+        assert results["b1"].data[0].markdown == "b1"
+        assert results["e1"].data == {"id": "e1"}
+        assert all(server.checks[job_id] == 3 for job_id in futures)
+        assert server.max_in_flight <= 4
+        assert len(monitor) == 0
+
+    def test_failed_jobs_resolve_with_their_status(self):
+        client = FirecrawlClient(api_key="key", transport=MockTransport(FakeServer(polls=1, status="failed")))
+
+        with JobMonitor(client, scheduler=FAST) as monitor:
+            assert monitor.watch("c1").result(timeout=5).status == "failed"
+
+    def test_watching_twice_returns_the_same_future(self):
+        server = FakeServer(polls=2)
+        client = FirecrawlClient(api_key="key", transport=MockTransport(server))
+
+        with JobMonitor(client, scheduler=FAST) as monitor:
+            first = monitor.watch("c1")
+            second = monitor.watch("c1")
+            first.result(timeout=5)
+
+        assert first is second
+        assert server.checks["c1"] == 2
+
+    def test_poll_errors_are_set_on_the_future(self):
+        transport = MockTransport()
+        transport.add("GET", "/v2/crawl/c1", response=TransportResponse.from_json({"success": False, "error": "bad key"}, 401))
+        client = FirecrawlClient(api_key="key", transport=transport)
+
+        with JobMonitor(client, scheduler=FAST) as monitor:
+            with pytest.raises(UnauthorizedError):
+                monitor.watch("c1").result(timeout=5)
+
+    def test_timeout(self):
+        client = FirecrawlClient(api_key="key", transport=MockTransport(FakeServer(polls=10**6)))
+
+        with JobMonitor(client, scheduler=FAST) as monitor:
+            with pytest.raises(TimeoutError, match="crawl job c1 did not complete within 0.05 seconds"):
+                monitor.watch("c1", timeout=0.05).result(timeout=5)
+
+    def test_cancelled_future_stops_polling(self):
+        server = FakeServer(polls=10**6)
+        client = FirecrawlClient(api_key="key", transport=MockTransport(server))
+        slow = AdaptivePollScheduler(min_interval=0.05, max_interval=0.05, initial_interval=0.05)
+
+        with JobMonitor(client, scheduler=slow) as monitor:
+            future = monitor.watch("c1")
+            assert future.cancel()
+            threading.Event().wait(0.2)
+            assert len(monitor) == 0
+            checks = server.checks.get("c1", 0)
+
+        assert checks <= 1
+
+    def test_close_cancels_pending_futures(self):
+        client = FirecrawlClient(api_key="key", transport=MockTransport(FakeServer(polls=10**6)))
+        monitor = JobMonitor(client, scheduler=FAST)
+        future = monitor.watch("c1")
+
+        monitor.close()
+
+        assert future.cancelled()
+        with pytest.raises(RuntimeError, match="closed"):
+            monitor.watch("c2")
+
+    def test_rejects_unknown_kind(self):
+        with JobMonitor(FirecrawlClient(api_key="key", transport=MockTransport())) as monitor:
+            with pytest.raises(ValueError, match="kind"):
+                monitor.watch("x1", kind="map")
+
+
+class TestAsyncJobMonitor:
+    def test_completes_futures_for_many_jobs(self):
+        server = FakeServer()
+
+        async def run():
+            client = AsyncFirecrawlClient(api_key="key", transport=MockTransport(server))
+            async with AsyncJobMonitor(client, scheduler=FAST, max_concurrent_polls=4) as monitor:
+                futures = [monitor.watch(f"c{i}") for i in range(20)]
+                futures.append(monitor.watch("e1", kind="extract"))
+                assert monitor.watch("c0") is futures[0]
+                return await asyncio.wait_for(asyncio.gather(*futures), 10)
+
+        results = asyncio.run(run())
+
+        assert [job.data[0].markdown for job in results[:20]] == [f"c{i}" for i in range(20)]
+        assert results[20].status == "completed"
+        assert server.checks["c3"] == 3
+
+    def test_close_cancels_pending_futures(self):
+        async def run():
+            client = AsyncFirecrawlClient(api_key="key", transport=MockTransport(FakeServer(polls=10**6)))
+            monitor = AsyncJobMonitor(client, scheduler=FAST)
+            future = monitor.watch("c1")
+            await asyncio.sleep(0.02)
+            await monitor.close()
+            return future
+
+        assert asyncio.run(run()).cancelled()
+
+    def test_timeout(self):
+        async def run():
+            client = AsyncFirecrawlClient(api_key="key", transport=MockTransport(FakeServer(polls=10**6)))
+            async with AsyncJobMonitor(client, scheduler=FAST) as monitor:
+                await monitor.watch("b1", kind="batch", timeout=0.05)
+
+        with pytest.raises(TimeoutError, match="batch job b1"):
+            asyncio.run(run())
+
+
+def _submit_transport(server):
+    transport = MockTransport(server)
+    transport.add("POST", "/v2/crawl", json={"success": True, "id": "c1", "url": "https://api.firecrawl.dev/v2/crawl/c1"})
+    transport.add("POST", "/v2/batch/scrape", json={"success": True, "id": "b1", "url": "https://api.firecrawl.dev/v2/batch/scrape/b1"})
+    transport.add("POST", "/v2/extract", json={"success": True, "id": "e1"})
+    transport.add("DELETE", "/v2/crawl/c1", json={"status": "cancelled"})
+    return transport
+
+
+class TestSubmit:
+    def test_handles_complete_in_the_background(self):
+        client = FirecrawlClient(api_key="key", transport=_submit_transport(FakeServer()))
+        client._job_monitor = JobMonitor(client, scheduler=FAST)
+        callbacks = []
+
+        with client:
+            crawl = client.submit_crawl("https://example.com", limit=5)
+            batch = client.submit_batch_scrape(["https://example.com"], formats=["markdown"])
+            extract = client.submit_extract(["https://example.com"], prompt="title")
+            crawl.add_done_callback(callbacks.append)
+
+            assert crawl.result(timeout=5).data[0].markdown == "c1"
+            assert batch.result(timeout=5).status == "completed"
+            assert extract.result(timeout=5).data == {"id": "e1"}
+            assert crawl.done() and callbacks == [crawl]
+            assert (crawl.id, crawl.kind, batch.kind) == ("c1", "crawl", "batch")
+
+    def test_cancel_cancels_the_job(self):
+        server = FakeServer(polls=10**6)
+        transport = _submit_transport(server)
+        client = FirecrawlClient(api_key="key", transport=transport)
+
+        with client:
+            handle = client.submit_crawl("https://example.com")
+            assert handle.cancel() is True
+            assert handle.future.cancelled()
+            assert handle.cancel() is False
+
+        assert [r.method for r in transport.requests if r.target == "/v2/crawl/c1"] == ["DELETE"]
+
+    def test_async_handles(self):
+        async def run():
+            client = AsyncFirecrawlClient(api_key="key", transport=_submit_transport(FakeServer()))
+            client._job_monitor = AsyncJobMonitor(client, scheduler=FAST)
+            async with client:
+                crawl = await client.submit_crawl("https://example.com")
+                extract = await client.submit_extract(["https://example.com"], prompt="title")
+                return await crawl, await extract.result(timeout=5)
+
+        crawl, extract = asyncio.run(run())
+
+        assert crawl.data[0].markdown == "c1"
+        assert extract.status == "completed"
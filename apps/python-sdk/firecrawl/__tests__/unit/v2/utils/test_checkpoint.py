@@ -0,0 +1,109 @@
+import asyncio
+from unittest.mock import Mock
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from firecrawl.v2.methods.aio.crawl import iter_crawl_documents as iter_crawl_documents_async
+from firecrawl.v2.methods.crawl import iter_crawl_documents
+from firecrawl.v2.utils.checkpoint import Checkpoint, FileCheckpointStore, SQLiteCheckpointStore
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "file":
+        return FileCheckpointStore(str(tmp_path / "checkpoints.json"))
+    return SQLiteCheckpointStore(str(tmp_path / "checkpoints.db"))
+
+
+class Listing:
+    """Completed job with ``total`` results served two per page; ``fail_at`` skips raise like a dropped connection."""
+
+    def __init__(self, total=6, fail_at=None):
+        self.total = total
+        self.fail_at = fail_at
+        self.urls = []
+
+    def get(self, url, timeout=None):
+        self.urls.append(url)
+        skip = int(parse_qs(urlparse(url).query).get("skip", ["0"])[0])
+        if skip == self.fail_at:
+            raise ConnectionError("connection reset")
+        end = min(skip + 2, self.total)
+        response = Mock()
+        response.ok = True
+        response.status_code = 200
+        response.json.return_value = {
+            "success": True,
+            "status": "completed",
+            "next": f"https://api.firecrawl.dev/v1/crawl/c1?skip={end}" if end < self.total else None,
+            "data": [{"markdown": str(i), "metadata": {"sourceURL": f"https://example.com/{i}"}} for i in range(skip, end)],
+        }
+        return response
+
+    async def aget(self, url, timeout=None):
+        return self.get(url, timeout)
+
+
+def _client(listing, asynchronous=False):
+    client = Mock()
+    client.get = listing.aget if asynchronous else listing.get
+    return client
+
+
+class TestCheckpointStores:
+    def test_save_load_delete(self, store):
+        assert store.load("job") is None
+        store.save("job", Checkpoint("https://api.firecrawl.dev/v1/crawl/job?skip=4", 4))
+        store.save("other", Checkpoint("https://api.firecrawl.dev/v1/crawl/other?skip=2", 2))
+        assert store.load("job") == Checkpoint("https://api.firecrawl.dev/v1/crawl/job?skip=4", 4)
+        store.delete("job")
+        store.delete("missing")
+        assert store.load("job") is None
+        assert store.load("other").documents == 2
+
+    def test_persists_across_instances(self, store):
+        store.save("job", Checkpoint("https://api.firecrawl.dev/v1/crawl/job?skip=4", 4))
+        reopened = type(store)(store.path)
+        assert reopened.load("job") == Checkpoint("https://api.firecrawl.dev/v1/crawl/job?skip=4", 4)
+
+
+class TestResumableDownload:
+    def test_resumes_after_failure(self, store):
+        seen = []
+        with pytest.raises(ConnectionError):
+            for doc in iter_crawl_documents(_client(Listing(fail_at=4)), "c1", checkpoint_store=store):
+                seen.append(doc.metadata.source_url)
+        assert seen == [f"https://example.com/{i}" for i in range(4)]
+        assert store.load("c1") == Checkpoint("https://api.firecrawl.dev/v1/crawl/c1?skip=4", 4)
+
+        listing = Listing()
+        for doc in iter_crawl_documents(_client(listing), "c1", checkpoint_store=store):
+            seen.append(doc.metadata.source_url)
+
+        assert seen == [f"https://example.com/{i}" for i in range(6)]
+        assert listing.urls == ["https://api.firecrawl.dev/v1/crawl/c1?skip=4"]
+        assert store.load("c1") is None
+
+    def test_partly_consumed_page_is_yielded_again(self, store):
+        documents = iter_crawl_documents(_client(Listing()), "c1", checkpoint_store=store)
+        for _ in range(3):
+            next(documents)
+        documents.close()
+        assert store.load("c1") == Checkpoint("https://api.firecrawl.dev/v1/crawl/c1?skip=2", 2)
+
+        rest = list(iter_crawl_documents(_client(Listing()), "c1", checkpoint_store=store))
+        assert [d.metadata.source_url for d in rest] == [f"https://example.com/{i}" for i in range(2, 6)]
+
+    def test_async_resume(self, store):
+        store.save("c1", Checkpoint("https://api.firecrawl.dev/v1/crawl/c1?skip=2", 2))
+        listing = Listing()
+
+        async def run():
+            return [doc async for doc in iter_crawl_documents_async(_client(listing, True), "c1", checkpoint_store=store)]
+
+        documents = asyncio.run(run())
+
+        assert len(documents) == 4
+        assert listing.urls[0] == "https://api.firecrawl.dev/v1/crawl/c1?skip=2"
+        assert store.load("c1") is None
@@ -0,0 +1,152 @@
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+import requests
+
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.utils.circuit_breaker import CircuitBreaker, endpoint_key
+from firecrawl.v2.utils.error_handler import CircuitOpenError, FirecrawlError
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.retry import RetryPolicy
+
+
+def _response(status_code):
+    response = MagicMock()
+    response.status_code = status_code
+    response.ok = status_code < 400
+    response.headers = {}
+    return response
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch("firecrawl.v2.utils.circuit_breaker.time.monotonic", fake):
+        yield fake
+
+
+class TestCircuitBreaker:
+    @pytest.mark.parametrize(
+        "url,key",
+        [
+            ("https://api.firecrawl.dev/v2/scrape", "scrape"),
+            ("https://api.firecrawl.dev/v1/crawl/abc?skip=10", "crawl"),
+            ("/v2/batch/scrape/xyz", "batch"),
+            ("/v2/extract", "extract"),
+        ],
+    )
+    def test_endpoint_key(self, url, key):
+        assert endpoint_key(url) == key
+
+    def test_opens_after_consecutive_failures(self, clock):
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=10)
+        for _ in range(2):
+            breaker.before_request("crawl")
+            breaker.record_failure("crawl")
+        breaker.record_success("crawl")
+        for _ in range(3):
+            breaker.before_request("crawl")
+            breaker.record_failure("crawl")
+        assert breaker.state("crawl") == "open"
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_request("crawl")
+        assert exc_info.value.endpoint == "crawl"
+        assert isinstance(exc_info.value, FirecrawlError)
+        # Other endpoint families are unaffected
+        breaker.before_request("scrape")
+
+    def test_half_open_probe_closes_on_success(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+        breaker.record_failure("scrape")
+        clock.now += 10
+        assert breaker.state("scrape") == "half_open"
+        breaker.before_request("scrape")
+        # Only one probe at a time
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("scrape")
+        breaker.record_success("scrape")
+        assert breaker.state("scrape") == "closed"
+        breaker.before_request("scrape")
+
+    def test_half_open_probe_failure_reopens(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+        breaker.record_failure("map")
+        clock.now += 10
+        breaker.before_request("map")
+        breaker.record_failure("map")
+        assert breaker.state("map") == "open"
+        clock.now += 5
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("map")
+
+    def test_record_response_uses_failure_statuses(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_response("search", 429)
+        assert breaker.state("search") == "closed"
+        breaker.record_response("search", 503)
+        assert breaker.state("search") == "open"
+
+    def test_shared_is_a_singleton(self):
+        assert CircuitBreaker.shared() is CircuitBreaker.shared()
+
+    @pytest.mark.parametrize("kwargs", [{"failure_threshold": 0}, {"recovery_timeout": 0}, {"half_open_max_calls": 0}])
+    def test_invalid_options(self, kwargs):
+        with pytest.raises(ValueError):
+            CircuitBreaker(**kwargs)
+
+
+class TestCircuitBreakerClients:
+    def test_open_circuit_fails_fast_without_retries(self):
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+        client = HttpClient(
+            "key",
+            "https://api.example.com",
+            retry_policy=RetryPolicy(max_attempts=3, backoff_factor=0, jitter=False),
+            circuit_breaker=breaker,
+        )
+        with patch("firecrawl.v2.utils.http_client.time.sleep"), patch(
+            "firecrawl.v2.utils.http_client.requests.Session.get", return_value=_response(503)
+        ) as mock_get:
+            with pytest.raises(CircuitOpenError):
+                client.get("/v2/crawl/1")
+            assert mock_get.call_count == 2
+            with pytest.raises(CircuitOpenError):
+                client.get("/v2/crawl/2")
+            assert mock_get.call_count == 2
+
+    def test_network_errors_count_as_failures(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        client = HttpClient(
+            "key",
+            "https://api.example.com",
+            retry_policy=RetryPolicy(max_attempts=1),
+            circuit_breaker=breaker,
+        )
+        with patch("firecrawl.v2.utils.http_client.requests.Session.post", side_effect=requests.ConnectionError()):
+            with pytest.raises(requests.ConnectionError):
+                client.post("/v2/scrape", {"url": "https://example.com"})
+        assert breaker.state("scrape") == "open"
+
+    @pytest.mark.asyncio
+    async def test_state_is_shared_between_sync_and_async_transports(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        client = AsyncFirecrawlClient(api_key="key", circuit_breaker=breaker)
+        assert client.http_client.circuit_breaker is breaker
+        client.async_http_client._client = httpx.AsyncClient(
+            base_url="https://api.example.com",
+            transport=httpx.MockTransport(lambda request: httpx.Response(500)),
+        )
+        client.async_http_client.retry_policy = RetryPolicy(max_attempts=1)
+        await client.async_http_client.get("/v2/batch/scrape/1")
+        with pytest.raises(CircuitOpenError):
+            client.http_client.get("/v2/batch/scrape/1")
+        await client.close()
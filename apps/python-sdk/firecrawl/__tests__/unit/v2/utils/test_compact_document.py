@@ -0,0 +1,94 @@
+import json
+import pickle
+import warnings
+
+import pytest
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.utils.documents import CompactDocument, CompactMetadata, build_document
+from firecrawl.v2.utils.spill import SpillingDocumentList
+from firecrawl.v2.utils.transport import MockTransport
+
+
+@pytest.fixture
+def rich_raw_document(raw_document):
+    def build(i=0):
+        language = "".join(["e", "n"])
+        return raw_document(i, metadata={"language": language, "ogTitle": ["a", "b"]}, unknownField=True)
+
+    return build
+
+
+class TestCompactDocument:
+    def test_fields_hold_the_response_values(self, rich_raw_document):
+        doc = CompactDocument.from_api(rich_raw_document())
+
+        assert not hasattr(doc, "__dict__")
+        assert doc.markdown == "# 0"
+        assert doc.raw_html == "<p>0</p>"
+        assert doc.html is None
+        assert isinstance(doc.metadata, CompactMetadata)
+        assert doc.metadata.source_url == "https://example.com/0"
+        assert doc.metadata.status_code == 200
+        assert doc.metadata.og_title == ["a", "b"]
+        assert doc.metadata.og_site_name is None
+        assert doc.metadata.extras == {"customTag": 0}
+        with pytest.raises(AttributeError):
+            doc.unknown_field
+
+    def test_repeated_metadata_values_are_interned(self, rich_raw_document):
+        first, second = CompactDocument.from_api(rich_raw_document(0)), CompactDocument.from_api(rich_raw_document(1))
+
+        assert first.metadata.language is second.metadata.language
+
+    def test_converts_to_full_document(self, rich_raw_document):
+        doc = CompactDocument.from_api(rich_raw_document())
+
+        assert doc.to_document() == build_document(rich_raw_document())
+        assert doc.model_dump() == build_document(rich_raw_document()).model_dump()
+        assert doc.to_dict() == {
+            "markdown": "# 0",
+            "raw_html": "<p>0</p>",
+            "metadata": {
+                "language": "en",
+                "og_title": ["a", "b"],
+                "source_url": "https://example.com/0",
+                "status_code": 200,
+                "customTag": 0,
+            },
+        }
+
+    def test_pickles_and_spills(self, rich_raw_document):
+        doc = CompactDocument.from_api(rich_raw_document())
+
+        assert pickle.loads(pickle.dumps(doc)) == doc
+        compact = [doc, CompactDocument.from_api(rich_raw_document(1))]
+        with SpillingDocumentList(compact, memory_budget=0, result_mode="compact") as documents:
+            assert documents.spilled == 2
+            assert documents[0] == doc
+            assert documents[1].metadata.extras == {"customTag": 1}
+
+    def test_client_compact_mode(self, rich_raw_document, status_routes):
+        transport = MockTransport()
+        status_routes(transport, "/v2/crawl/c1", [[rich_raw_document(0), rich_raw_document(1)]])
+        client = FirecrawlClient(api_key="key", transport=transport, result_mode="compact")
+
+        job = client.get_crawl_status("c1")
+
+        assert all(isinstance(doc, CompactDocument) for doc in job.data)
+        assert [doc.metadata.source_url for doc in job.data] == ["https://example.com/0", "https://example.com/1"]
+
+    def test_compact_jobs_and_search_results_serialize(self, rich_raw_document, status_routes):
+        transport = MockTransport()
+        status_routes(transport, "/v2/crawl/c1", [[rich_raw_document()]])
+        transport.add("POST", "/v2/search", json={"success": True, "data": {"web": [rich_raw_document()]}})
+        client = FirecrawlClient(api_key="key", transport=transport, result_mode="compact")
+        job = client.get_crawl_status("c1")
+        search = client.search("example")
+        expected = [CompactDocument.from_api(rich_raw_document()).to_dict()]
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert job.model_dump()["data"] == expected
+            assert json.loads(job.model_dump_json())["data"] == expected
+            assert json.loads(search.model_dump_json())["web"] == expected
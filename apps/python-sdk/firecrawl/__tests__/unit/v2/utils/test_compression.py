@@ -0,0 +1,96 @@
+import gzip
+import json
+import os
+import zlib
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.utils.compression import (
+    CompressionPolicy,
+    _ordered,
+    httpx_accept_encoding,
+    requests_accept_encoding,
+)
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+
+
+def _payload(n=500):
+    return {"urls": [f"https://example.com/page/{i}" for i in range(n)]}
+
+
+class TestCompressionPolicy:
+    def test_small_bodies_are_left_alone(self):
+        body, encoding = CompressionPolicy(min_size=1024).encode(b'{"url":"https://example.com"}')
+        assert encoding is None
+        assert body == b'{"url":"https://example.com"}'
+
+    def test_gzip_roundtrip(self):
+        raw = json.dumps(_payload()).encode()
+        body, encoding = CompressionPolicy(min_size=0).encode(raw)
+        assert encoding == "gzip"
+        assert len(body) < len(raw)
+        assert gzip.decompress(body) == raw
+
+    def test_deflate_roundtrip(self):
+        raw = json.dumps(_payload()).encode()
+        body, encoding = CompressionPolicy(min_size=0, encoding="deflate").encode(raw)
+        assert encoding == "deflate"
+        assert zlib.decompress(body) == raw
+
+    def test_incompressible_body_sent_raw(self):
+        raw = os.urandom(512)
+        body, encoding = CompressionPolicy(min_size=0).encode(raw)
+        assert encoding is None
+        assert body == raw
+
+    @pytest.mark.parametrize("kwargs", [{"encoding": "zstd"}, {"min_size": -1}, {"level": 0}])
+    def test_invalid_options(self, kwargs):
+        with pytest.raises(ValueError):
+            CompressionPolicy(**kwargs)
+
+    def test_accept_encoding_preference_order(self):
+        assert _ordered(["gzip", "identity", "br", "zstd", "deflate"]) == "zstd, br, gzip, deflate"
+        assert "gzip" in requests_accept_encoding()
+        assert "gzip" in httpx_accept_encoding()
+
+
+class TestCompressedClients:
+    def test_http_client_compresses_large_posts(self):
+        client = HttpClient("key", "https://api.example.com", compression=CompressionPolicy(min_size=1024))
+        with patch("firecrawl.v2.utils.http_client.requests.Session.post") as mock_post:
+            mock_post.return_value.status_code = 200
+            client.post("/v2/batch/scrape", _payload())
+        kwargs = mock_post.call_args[1]
+        assert kwargs["headers"]["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(kwargs["data"]))["urls"][0] == "https://example.com/page/0"
+        assert client._get_session().headers["Accept-Encoding"] == requests_accept_encoding()
+
+    def test_compression_is_opt_in(self):
+        client = FirecrawlClient(api_key="key")
+        with patch("firecrawl.v2.utils.http_client.requests.Session.post") as mock_post:
+            mock_post.return_value.status_code = 200
+            client.http_client.post("/v2/batch/scrape", _payload())
+        assert "Content-Encoding" not in mock_post.call_args[1]["headers"]
+
+    @pytest.mark.asyncio
+    async def test_async_client_compresses_and_decodes(self):
+        seen = {}
+
+        def handler(request):
+            seen["encoding"] = request.headers.get("content-encoding")
+            seen["body"] = json.loads(gzip.decompress(request.content))
+            body = gzip.compress(b'{"success": true}')
+            return httpx.Response(200, content=body, headers={"Content-Encoding": "gzip"})
+
+        client = AsyncHttpClient("key", "https://api.example.com", compression=CompressionPolicy(min_size=1024))
+        assert client._client.headers["Accept-Encoding"] == httpx_accept_encoding()
+        client._client._transport = httpx.MockTransport(handler)
+        response = await client.post("/v2/batch/scrape", _payload())
+        assert response.json() == {"success": True}
+        assert seen["encoding"] == "gzip"
+        assert len(seen["body"]["urls"]) == 500
+        await client.close()
@@ -0,0 +1,109 @@
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.types import Document, DocumentMetadata
+from firecrawl.v2.utils.concurrency import AdaptiveConcurrencyLimiter
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+from firecrawl.v2.utils.retry import RetryPolicy
+
+
+def _document(**metadata):
+    return Document(markdown="# hi", metadata=DocumentMetadata(**metadata))
+
+
+class TestAdaptiveConcurrencyLimiter:
+    def test_additive_increase_per_window(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_concurrency=2, max_concurrency_limit=10)
+        for _ in range(3):
+            limiter.record_response(200)
+        # Roughly one window of successes at a cap of two adds one slot
+        assert limiter.limit == 3
+        for _ in range(6):
+            limiter.record_response(200)
+        assert limiter.limit >= 4
+        assert limiter.max_concurrency == limiter.limit
+
+    def test_increase_stops_at_ceiling(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_concurrency=3, max_concurrency_limit=4)
+        for _ in range(50):
+            limiter.on_success()
+        assert limiter.limit == 4
+
+    def test_429_halves_once_per_cooldown(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_concurrency=16, cooldown=60)
+        limiter.record_response(429)
+        limiter.record_response(429)
+        assert limiter.limit == 8
+
+    def test_decrease_respects_floor(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_concurrency=4, min_concurrency=3, cooldown=0)
+        for _ in range(5):
+            limiter.on_congestion()
+        assert limiter.limit == 3
+
+    def test_queued_document_triggers_decrease(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_concurrency=8, queue_threshold_ms=100)
+        limiter.record_document(_document(concurrency_limited=True, concurrency_queue_duration_ms=50))
+        assert limiter.limit == 8
+        limiter.record_document(_document(concurrency_limited=True, concurrency_queue_duration_ms=500))
+        assert limiter.limit == 4
+
+    def test_limited_flag_without_queue_time(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_concurrency=8)
+        limiter.record_document(_document(concurrency_limited=False))
+        assert limiter.limit == 8
+        limiter.record_document(_document(concurrency_limited=True))
+        assert limiter.limit == 4
+
+    def test_calibration_sets_ceiling(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_concurrency=8, auto_calibrate=True)
+        limiter.set_calibrator(MagicMock(return_value=5))
+        limiter.acquire()
+        limiter.release()
+        assert limiter.max_concurrency_limit == 5
+        assert limiter.limit == 5
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"min_concurrency": 0},
+            {"min_concurrency": 5, "max_concurrency_limit": 4},
+            {"decrease_factor": 1.0},
+            {"increase": 0},
+        ],
+    )
+    def test_invalid_options(self, kwargs):
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(**kwargs)
+
+
+class TestAdaptiveClients:
+    def test_scrape_feeds_document_metadata(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_concurrency=8)
+        client = FirecrawlClient(api_key="key", rate_limiter=limiter)
+        queued = _document(concurrency_limited=True, concurrency_queue_duration_ms=2000)
+        with patch("firecrawl.v2.client.scrape_module.scrape", return_value=queued):
+            client.scrape("https://example.com")
+        assert limiter.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_async_client_backs_off_on_429(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_concurrency=8)
+        client = AsyncHttpClient(
+            "key",
+            "https://api.example.com",
+            retry_policy=RetryPolicy(max_attempts=1),
+            rate_limiter=limiter,
+        )
+        client._client = httpx.AsyncClient(
+            base_url="https://api.example.com",
+            transport=httpx.MockTransport(lambda request: httpx.Response(429)),
+        )
+        response = await client.get("/v2/crawl/1")
+        assert response.status_code == 429
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+        await client.close()
@@ -0,0 +1,150 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from firecrawl.v2.utils.hedging import HedgePolicy, endpoint_family
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+
+
+def _response(status_code=200):
+    response = MagicMock()
+    response.status_code = status_code
+    response.ok = status_code < 400
+    return response
+
+
+def _policy(**kwargs):
+    defaults = dict(initial_delay=0.05, min_delay=0.0, max_extra_load=1.0)
+    defaults.update(kwargs)
+    return HedgePolicy(**defaults)
+
+
+class TestHedgePolicy:
+    def test_endpoint_family_ignores_ids_and_query(self):
+        assert endpoint_family("https://api.firecrawl.dev/v2/crawl/abc?skip=10") == "/v2/crawl"
+        assert endpoint_family("/v2/batch/scrape/xyz") == "/v2/batch"
+
+    def test_initial_delay_until_enough_samples(self):
+        policy = HedgePolicy(initial_delay=2.0, min_samples=3)
+        policy.record_latency("/v2/crawl/1", 0.1)
+        assert policy.delay("/v2/crawl/2") == 2.0
+
+    def test_delay_follows_percentile(self):
+        policy = HedgePolicy(percentile=90, min_samples=10, min_delay=0.0)
+        for i in range(1, 101):
+            policy.record_latency("/v2/crawl/1", i / 100)
+        assert policy.delay("/v2/crawl/x") == pytest.approx(0.91)
+        # Other endpoint families keep their own history
+        assert policy.delay("/v2/batch/x") == policy.initial_delay
+
+    def test_delay_is_clamped(self):
+        policy = HedgePolicy(min_samples=1, max_delay=0.5)
+        policy.record_latency("/v2/crawl/1", 30.0)
+        assert policy.delay("/v2/crawl/1") == 0.5
+
+    def test_extra_load_budget(self):
+        policy = HedgePolicy(max_extra_load=0.5)
+        while policy.try_acquire_hedge():
+            pass
+        assert not policy.try_acquire_hedge()
+        policy.record_request()
+        policy.record_request()
+        assert policy.try_acquire_hedge()
+
+    @pytest.mark.parametrize("kwargs", [{"percentile": 0}, {"max_extra_load": 0}, {"min_delay": 2, "max_delay": 1}])
+    def test_invalid_options(self, kwargs):
+        with pytest.raises(ValueError):
+            HedgePolicy(**kwargs)
+
+
+class TestHedgedHttpClient:
+    def test_slow_primary_is_hedged(self):
+        release = threading.Event()
+        calls = []
+
+        def fake_get(url, **kwargs):
+            calls.append(url)
+            if len(calls) == 1:
+                release.wait(2)
+                return _response(503)
+            return _response(200)
+
+        client = HttpClient("key", "https://api.example.com", hedge_policy=_policy())
+        with patch("firecrawl.v2.utils.http_client.requests.Session.get", side_effect=fake_get):
+            started = time.monotonic()
+            response = client.get("/v2/crawl/1")
+            elapsed = time.monotonic() - started
+        release.set()
+        client.close()
+        assert response.status_code == 200
+        assert len(calls) == 2
+        assert elapsed < 1
+
+    def test_fast_primary_is_not_hedged(self):
+        client = HttpClient("key", "https://api.example.com", hedge_policy=_policy(initial_delay=1.0))
+        with patch("firecrawl.v2.utils.http_client.requests.Session.get", return_value=_response()) as mock_get:
+            client.get("/v2/crawl/1")
+        client.close()
+        assert mock_get.call_count == 1
+
+    def test_primary_is_not_queued_behind_busy_hedge_workers(self):
+        busy = threading.Event()
+        client = HttpClient("key", "https://api.example.com", pool_maxsize=1, hedge_policy=_policy(initial_delay=1.0))
+        for _ in range(2):
+            client._get_executor().submit(busy.wait, 5)
+        with patch("firecrawl.v2.utils.http_client.requests.Session.get", return_value=_response()) as mock_get:
+            started = time.monotonic()
+            client.get("/v2/crawl/1")
+            elapsed = time.monotonic() - started
+        busy.set()
+        client.close()
+        assert mock_get.call_count == 1
+        assert elapsed < 0.5
+
+    def test_exhausted_budget_waits_for_primary(self):
+        policy = _policy(max_extra_load=0.1)
+        while policy.try_acquire_hedge():
+            pass
+
+        def slow_get(url, **kwargs):
+            time.sleep(0.1)
+            return _response()
+
+        client = HttpClient("key", "https://api.example.com", hedge_policy=policy)
+        with patch("firecrawl.v2.utils.http_client.requests.Session.get", side_effect=slow_get) as mock_get:
+            client.get("/v2/crawl/1")
+        client.close()
+        assert mock_get.call_count == 1
+
+    def test_posts_are_never_hedged(self):
+        client = HttpClient("key", "https://api.example.com", hedge_policy=_policy(initial_delay=0.0))
+        with patch("firecrawl.v2.utils.http_client.requests.Session.post", return_value=_response()) as mock_post:
+            client.post("/v2/crawl", {"url": "https://example.com"})
+        assert mock_post.call_count == 1
+        assert client._executor is None
+
+
+class TestHedgedAsyncHttpClient:
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_cancelled(self):
+        calls = 0
+
+        async def handler(request):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(5)
+            return httpx.Response(200, json={"attempt": calls})
+
+        client = AsyncHttpClient("key", "https://api.example.com", hedge_policy=_policy())
+        client._client = httpx.AsyncClient(base_url="https://api.example.com", transport=httpx.MockTransport(handler))
+        started = time.monotonic()
+        response = await client.get("/v2/crawl/1")
+        assert time.monotonic() - started < 1
+        assert response.json() == {"attempt": 2}
+        await client.close()
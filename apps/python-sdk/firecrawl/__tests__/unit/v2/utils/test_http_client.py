@@ -0,0 +1,59 @@
+import pytest
+from unittest.mock import MagicMock, patch
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.utils.http_client import HttpClient
+
+
+def _ok_response():
+    response = MagicMock()
+    response.ok = True
+    response.status_code = 200
+    response.json.return_value = {"success": True}
+    return response
+
+
+class TestHttpClientPooling:
+    def test_session_is_reused_across_requests(self):
+        client = HttpClient("key", "https://api.example.com")
+        with patch("firecrawl.v2.utils.http_client.requests.Session.get", return_value=_ok_response()) as mock_get:
+            client.get("/v2/crawl/1")
+            first = client._session
+            client.get("/v2/crawl/2")
+            assert client._session is first
+            assert mock_get.call_count == 2
+
+    def test_adapter_uses_configured_pool_limits(self):
+        client = HttpClient("key", "https://api.example.com", pool_connections=4, pool_maxsize=32)
+        adapter = client._get_session().get_adapter("https://api.example.com/v2/scrape")
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 32
+        assert adapter.max_retries.total == 0
+
+    def test_idle_session_is_evicted(self):
+        client = HttpClient("key", "https://api.example.com", pool_idle_timeout=30)
+        with patch("firecrawl.v2.utils.http_client.time.monotonic", side_effect=[0.0, 10.0, 100.0]):
+            first = client._get_session()
+            assert client._get_session() is first
+            third = client._get_session()
+        assert third is not first
+
+    def test_close_drops_session(self):
+        client = HttpClient("key", "https://api.example.com")
+        client._get_session()
+        client.close()
+        assert client._session is None
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"pool_connections": 0}, {"pool_maxsize": 0}, {"pool_idle_timeout": 0}],
+    )
+    def test_invalid_pool_options(self, kwargs):
+        with pytest.raises(ValueError):
+            HttpClient("key", "https://api.example.com", **kwargs)
+
+    def test_firecrawl_client_forwards_pool_options(self):
+        client = FirecrawlClient(api_key="key", pool_maxsize=64, pool_idle_timeout=15)
+        assert client.http_client.pool_maxsize == 64
+        assert client.http_client.pool_idle_timeout == 15
+        assert client.config.pool_maxsize == 64
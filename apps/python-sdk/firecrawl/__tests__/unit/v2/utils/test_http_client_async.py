@@ -0,0 +1,50 @@
+import importlib.util
+
+import pytest
+
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+
+
+def _pool(client: AsyncHttpClient):
+    return client._client._transport._pool
+
+
+class TestAsyncHttpClientPooling:
+    def test_keepalive_enabled_by_default(self):
+        client = AsyncHttpClient("key", "https://api.example.com")
+        pool = _pool(client)
+        assert pool._max_connections == 100
+        assert pool._max_keepalive_connections == 20
+        assert pool._keepalive_expiry == 5.0
+
+    def test_custom_limits(self):
+        client = AsyncHttpClient(
+            "key",
+            "https://api.example.com",
+            max_connections=8,
+            max_keepalive_connections=4,
+            keepalive_expiry=30.0,
+        )
+        pool = _pool(client)
+        assert pool._max_connections == 8
+        assert pool._max_keepalive_connections == 4
+        assert pool._keepalive_expiry == 30.0
+
+    def test_async_firecrawl_client_forwards_limits(self):
+        client = AsyncFirecrawlClient(api_key="key", max_connections=16, keepalive_expiry=10.0)
+        pool = _pool(client.async_http_client)
+        assert pool._max_connections == 16
+        assert pool._keepalive_expiry == 10.0
+
+    @pytest.mark.skipif(importlib.util.find_spec("h2") is None, reason="h2 not installed")
+    def test_http2_opt_in(self):
+        client = AsyncHttpClient("key", "https://api.example.com", http2=True)
+        assert client.http2 is True
+        assert _pool(client)._http2 is True
+
+    @pytest.mark.asyncio
+    async def test_close(self):
+        client = AsyncFirecrawlClient(api_key="key")
+        await client.close()
+        assert client.async_http_client._client.is_closed
@@ -0,0 +1,86 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from firecrawl.v2.utils import json_codec
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+from firecrawl.v2.utils.json_codec import JsonCodec, OrjsonCodec, decode_response
+
+
+@pytest.fixture
+def stdlib_codec():
+    json_codec.set_json_codec(JsonCodec())
+    yield
+    json_codec.set_json_codec(None)
+
+
+class TestJsonCodec:
+    def test_stdlib_roundtrip_bytes(self):
+        codec = JsonCodec()
+        payload = {"url": "https://example.com", "text": "héllo"}
+        assert codec.loads(codec.dumps(payload)) == payload
+
+    @pytest.mark.skipif(json_codec.orjson is None, reason="orjson not installed")
+    def test_orjson_is_default_when_installed(self):
+        json_codec.set_json_codec(None)
+        assert json_codec.get_json_codec().name == "orjson"
+
+    @pytest.mark.skipif(json_codec.orjson is None, reason="orjson not installed")
+    def test_orjson_falls_back_for_big_ints(self):
+        assert json.loads(OrjsonCodec().dumps({"n": 2 ** 70})) == {"n": 2 ** 70}
+
+    def test_decode_response_uses_raw_bytes(self):
+        response = MagicMock()
+        response.content = b'{"success": true}'
+        assert decode_response(response) == {"success": True}
+        response.json.assert_not_called()
+
+    def test_decode_response_falls_back_to_json(self):
+        response = MagicMock()
+        response.json.return_value = {"success": True}
+        assert decode_response(response) == {"success": True}
+
+    def test_custom_codec_is_used(self):
+        codec = MagicMock(spec=JsonCodec)
+        codec.loads.return_value = {"via": "custom"}
+        json_codec.set_json_codec(codec)
+        try:
+            assert json_codec.loads(b"{}") == {"via": "custom"}
+        finally:
+            json_codec.set_json_codec(None)
+
+
+class TestClientEncoding:
+    def test_http_client_sends_encoded_body(self, stdlib_codec):
+        client = HttpClient("key", "https://api.example.com")
+        with patch("firecrawl.v2.utils.http_client.requests.Session.post") as mock_post:
+            mock_post.return_value.status_code = 200
+            client.post("/v2/scrape", {"url": "https://example.com"})
+        kwargs = mock_post.call_args[1]
+        assert "json" not in kwargs
+        assert json.loads(kwargs["data"])["url"] == "https://example.com"
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+
+    @pytest.mark.asyncio
+    async def test_async_client_sends_encoded_body(self):
+        seen = {}
+
+        def handler(request):
+            seen["body"] = json.loads(request.content)
+            seen["content_type"] = request.headers["content-type"]
+            return httpx.Response(200, json={"success": True})
+
+        client = AsyncHttpClient("key", "https://api.example.com")
+        client._client = httpx.AsyncClient(
+            base_url="https://api.example.com",
+            headers={"Content-Type": "application/json"},
+            transport=httpx.MockTransport(handler),
+        )
+        response = await client.post("/v2/scrape", {"url": "https://example.com"})
+        assert decode_response(response) == {"success": True}
+        assert seen["body"]["url"] == "https://example.com"
+        assert seen["content_type"] == "application/json"
+        await client.close()
@@ -0,0 +1,124 @@
+import asyncio
+import copy
+import pickle
+
+import pytest
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.types import CrawlJob, Document, DocumentMetadata
+from firecrawl.v2.utils.documents import LazyDocument, build_document
+from firecrawl.v2.utils.transport import MockTransport
+
+
+@pytest.fixture
+def full_raw_document(raw_document):
+    """Raw document ``i`` with a field of every kind the lazy resolver handles."""
+
+    def build(i=0):
+        return raw_document(
+            i,
+            metadata={"ogTitle": ["a", "b"]},
+            changeTracking={"changeStatus": "same"},
+            branding={"colorScheme": "dark", "extra": 1},
+            links=[f"https://example.com/{i}/a"],
+        )
+
+    return build
+
+
+class TestLazyDocument:
+    def test_fields_are_resolved_on_first_access(self, full_raw_document):
+        doc = LazyDocument.from_api(full_raw_document())
+
+        assert isinstance(doc, Document)
+        assert doc.__dict__ == {}
+        assert doc.markdown == "# 0"
+        assert list(doc.__dict__) == ["markdown"]
+
+        assert isinstance(doc.metadata, DocumentMetadata)
+        assert doc.metadata.source_url == "https://example.com/0"
+        assert doc.metadata.status_code == 200
+        assert doc.metadata.og_title == "a, b"
+        assert doc.raw_html == "<p>0</p>"
+        assert doc.change_tracking == {"changeStatus": "same"}
+        assert doc.branding.color_scheme == "dark"
+        assert doc.html is None
+        assert sorted(doc.__dict__) == ["branding", "change_tracking", "html", "markdown", "metadata", "raw_html"]
+
+    def test_matches_eager_document(self, full_raw_document):
+        eager = build_document(full_raw_document())
+        lazy = build_document(full_raw_document(), "lazy")
+
+        assert lazy == eager and eager == lazy
+        assert lazy.model_dump() == eager.model_dump()
+        assert lazy.model_fields_set == eager.model_fields_set
+        assert lazy.metadata_dict == eager.metadata_dict
+        assert repr(lazy) == "Lazy" + repr(eager)
+        assert lazy != build_document(full_raw_document(1), "lazy")
+
+    def test_nested_serialization_resolves_every_field(self, full_raw_document):
+        eager = build_document(full_raw_document())
+        job = CrawlJob(status="completed", completed=1, total=1, data=[LazyDocument.from_api(full_raw_document())])
+
+        assert job.model_dump()["data"][0] == eager.model_dump()
+        assert job.model_dump_json() == CrawlJob(status="completed", completed=1, total=1, data=[eager]).model_dump_json()
+
+    def test_copies_and_pickles_as_complete_documents(self, full_raw_document):
+        eager = build_document(full_raw_document())
+
+        assert pickle.loads(pickle.dumps(LazyDocument.from_api(full_raw_document()))) == eager
+        assert copy.deepcopy(LazyDocument.from_api(full_raw_document())) == eager
+        assert LazyDocument.from_api(full_raw_document()).model_copy() == eager
+        assert dict(LazyDocument.from_api(full_raw_document()))["raw_html"] == "<p>0</p>"
+
+    def test_assignment_overrides_the_raw_value(self):
+        doc = LazyDocument.from_api({"markdown": "raw"})
+        doc.markdown = "edited"
+
+        assert doc.markdown == "edited"
+        assert doc.model_dump(exclude_none=True) == {"markdown": "edited"}
+
+    def test_unknown_attributes_raise(self):
+        with pytest.raises(AttributeError):
+            LazyDocument.from_api({}).not_a_field
+
+
+class TestClientResultMode:
+    def test_crawl_returns_lazy_documents(self, full_raw_document):
+        transport = MockTransport()
+        transport.add("POST", "/v2/crawl", json={"success": True, "id": "c1", "url": "https://example.com"})
+        transport.add(
+            "GET",
+            "/v2/crawl/c1",
+            json={"success": True, "status": "completed", "completed": 2, "total": 2, "data": [full_raw_document(0), full_raw_document(1)]},
+        )
+        client = FirecrawlClient(api_key="key", transport=transport, result_mode="lazy")
+
+        job = client.crawl("https://example.com", poll_interval=0)
+
+        assert all(isinstance(doc, LazyDocument) for doc in job.data)
+        assert [doc.metadata.source_url for doc in job.data] == ["https://example.com/0", "https://example.com/1"]
+
+    def test_async_search_returns_lazy_documents(self, full_raw_document):
+        transport = MockTransport()
+        transport.add(
+            "POST",
+            "/v2/search",
+            json={"success": True, "data": {"web": [full_raw_document(), {"url": "https://example.com", "title": "t"}]}},
+        )
+
+        async def run():
+            client = AsyncFirecrawlClient(api_key="key", transport=transport, result_mode="lazy")
+            return await client.search("example")
+
+        data = asyncio.run(run())
+
+        assert isinstance(data.web[0], LazyDocument)
+        assert data.web[0].markdown == "# 0"
+        assert data.web[1].url == "https://example.com"
+        assert data.model_dump()["web"][0]["raw_html"] == "<p>0</p>"
+
+    def test_rejects_unknown_result_mode(self):
+        with pytest.raises(ValueError, match="result_mode"):
+            FirecrawlClient(api_key="key", transport=MockTransport(), result_mode="eager")
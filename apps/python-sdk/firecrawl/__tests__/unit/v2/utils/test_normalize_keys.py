@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.types import SearchResultImages
+from firecrawl.v2.utils.normalize import (
+    _map_search_result_keys,
+    normalize_document_keys,
+    normalize_payload_keys,
+    snake_case_key,
+)
+from firecrawl.v2.utils.transport import MockTransport
+
+
+class TestSnakeCaseKey:
+    @pytest.mark.parametrize(
+        "key,expected",
+        [
+            ("expiresAt", "expires_at"),
+            ("sourceURL", "source_url"),
+            ("ignoreInvalidURLs", "ignore_invalid_urls"),
+            ("concurrencyQueueDurationMs", "concurrency_queue_duration_ms"),
+            ("credits_used", "credits_used"),
+            ("id", "id"),
+        ],
+    )
+    def test_converts_camel_case(self, key, expected):
+        assert snake_case_key(key) == expected
+
+    def test_results_are_cached(self):
+        assert snake_case_key("tokensUsed") is snake_case_key("tokens" + "Used")
+
+
+class TestNormalizeKeys:
+    def test_document_keys_keep_unknown_keys(self):
+        raw = {
+            "rawHtml": "<p></p>",
+            "metadata": {"ogTitle": "t", "statusCode": "404", "twitterCard": "summary"},
+            "branding": {"colorScheme": "light"},
+        }
+
+        assert normalize_document_keys(raw) == {
+            "raw_html": "<p></p>",
+            "metadata": {"og_title": "t", "status_code": 404, "twitterCard": "summary"},
+            "branding": {"color_scheme": "light"},
+        }
+
+    def test_existing_snake_case_key_wins(self):
+        assert normalize_document_keys({"rawHtml": "camel", "raw_html": "snake"}) == {
+            "rawHtml": "camel",
+            "raw_html": "snake",
+        }
+
+    def test_search_result_keys(self):
+        item = {"imageUrl": "https://example.com/i.png", "imageWidth": 10, "url": "https://example.com"}
+
+        assert _map_search_result_keys(item, "images") == {
+            "image_url": "https://example.com/i.png",
+            "image_width": 10,
+            "url": "https://example.com",
+        }
+        assert _map_search_result_keys(item, "web") == item
+
+    def test_payload_keys_are_added_alongside_originals(self):
+        payload = {"id": "x", "expiresAt": "2024-01-01T00:00:00Z", "creditsUsed": 3}
+
+        assert normalize_payload_keys(payload) == {
+            **payload,
+            "expires_at": "2024-01-01T00:00:00Z",
+            "credits_used": 3,
+        }
+
+
+class TestAsyncPayloads:
+    def test_async_extract_status_and_image_results_are_normalized(self):
+        transport = MockTransport()
+        transport.add(
+            "GET",
+            "/v2/extract/e1",
+            json={"success": True, "status": "completed", "creditsUsed": 2, "tokensUsed": 40},
+        )
+        transport.add(
+            "POST",
+            "/v2/search",
+            json={"success": True, "data": {"images": [{"imageUrl": "https://example.com/i.png", "imageHeight": 5}]}},
+        )
+
+        async def run():
+            client = AsyncFirecrawlClient(api_key="key", transport=transport)
+            return await client.get_extract_status("e1"), await client.search("example", sources=["images"])
+
+        extract, search = asyncio.run(run())
+
+        assert extract.credits_used == 2
+        assert extract.tokens_used == 40
+        assert search.images == [SearchResultImages(image_url="https://example.com/i.png", image_height=5)]
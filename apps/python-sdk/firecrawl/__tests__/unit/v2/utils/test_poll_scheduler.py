@@ -0,0 +1,171 @@
+import asyncio
+
+import pytest
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.methods.crawl import wait_for_crawl_completion
+from firecrawl.v2.methods.extract import wait_extract
+from firecrawl.v2.utils import polling
+from firecrawl.v2.utils.polling import AdaptivePollScheduler, poll_delay
+from firecrawl.v2.utils.transport import MockTransport
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(polling.time, "monotonic", clock.monotonic)
+    return clock
+
+
+class TestPollSession:
+    def test_first_interval_is_initial(self, clock):
+        session = AdaptivePollScheduler(initial_interval=2.0).session()
+        assert session.next_interval(0, 100) == 2.0
+
+    def test_interval_follows_estimated_time_left(self, clock):
+        session = AdaptivePollScheduler(max_interval=100, smoothing=1.0).session()
+        session.next_interval(0, 100)
+        clock.now += 10
+        # 10 documents in 10s leaves 90s; half of that is 45s
+        assert session.next_interval(10, 100) == pytest.approx(45.0)
+        clock.now += 10
+        # Near the end the interval shrinks
+        assert session.next_interval(96, 100) == pytest.approx(0.25)
+
+    def test_interval_is_clamped(self, clock):
+        session = AdaptivePollScheduler(min_interval=1.0, max_interval=5.0, smoothing=1.0).session()
+        session.next_interval(0, 1000)
+        clock.now += 10
+        assert session.next_interval(1, 1000) == 5.0
+        clock.now += 1
+        assert session.next_interval(999, 1000) == 1.0
+
+    def test_backs_off_without_counters(self, clock):
+        session = AdaptivePollScheduler(initial_interval=1.0, backoff=2.0, max_interval=5.0).session()
+        assert [session.next_interval() for _ in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    def test_backs_off_without_progress(self, clock):
+        session = AdaptivePollScheduler(initial_interval=1.0, backoff=2.0).session()
+        session.next_interval(5, 10)
+        clock.now += 1
+        assert session.next_interval(5, 10) == 2.0
+
+    def test_rate_is_smoothed(self, clock):
+        session = AdaptivePollScheduler(max_interval=1000, eta_fraction=1.0, smoothing=0.5).session()
+        session.next_interval(0, 1000)
+        clock.now += 10
+        session.next_interval(100, 1000)  # rate 10/s
+        clock.now += 10
+        # Observed 0/s blends to 5/s: 900 remaining take 180s
+        assert session.next_interval(100, 1000) == pytest.approx(180.0)
+
+    def test_poll_delay_without_session(self):
+        assert poll_delay(2, None, 1, 10) == 2
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"min_interval": 0},
+            {"min_interval": 5, "max_interval": 1},
+            {"eta_fraction": 0},
+            {"backoff": 0.5},
+            {"smoothing": 1.5},
+        ],
+    )
+    def test_rejects_invalid_settings(self, kwargs):
+        with pytest.raises(ValueError):
+            AdaptivePollScheduler(**kwargs)
+
+
+def _crawl_status(completed, total=10):
+    return {
+        "success": True,
+        "status": "completed" if completed == total else "scraping",
+        "completed": completed,
+        "total": total,
+        "creditsUsed": completed,
+        "data": [],
+        "next": None,
+    }
+
+
+class TestAdaptiveWaits:
+    def test_wait_for_crawl_completion_uses_scheduler(self, clock, monkeypatch):
+        monkeypatch.setattr("firecrawl.v2.methods.crawl.time.sleep", clock.sleep)
+        transport = MockTransport()
+        for completed in (0, 2, 4, 10):
+            transport.add("GET", "/v2/crawl/c1", json=_crawl_status(completed), times=1)
+        client = FirecrawlClient(api_key="key", transport=transport)
+        scheduler = AdaptivePollScheduler(min_interval=0.5, max_interval=10, initial_interval=1.0, smoothing=1.0)
+
+        result = wait_for_crawl_completion(client.http_client, "c1", poll_interval=60, poll_scheduler=scheduler)
+
+        assert result.status == "completed"
+        # 2 documents/s with 8 left, then 1 document/s with 6 left: half of the estimated time left
+        assert clock.sleeps == [1.0, pytest.approx(2.0), pytest.approx(3.0)]
+
+    def test_counters_mode_uses_scheduler(self, clock, monkeypatch):
+        monkeypatch.setattr(polling.time, "sleep", clock.sleep)
+        transport = MockTransport()
+        for completed in (0, 5):
+            transport.add("GET", "/v2/crawl/c1?limit=0", json=_crawl_status(completed), times=1)
+        transport.add("GET", "/v2/crawl/c1?limit=0", json=_crawl_status(10))
+        transport.add("GET", "/v2/crawl/c1", json=_crawl_status(10))
+        client = FirecrawlClient(api_key="key", transport=transport)
+
+        wait_for_crawl_completion(
+            client.http_client, "c1", poll_interval=60, poll_mode="counters",
+            poll_scheduler=AdaptivePollScheduler(initial_interval=2.0),
+        )
+
+        assert clock.sleeps[0] == 2.0
+        assert all(0.25 <= s <= 30.0 for s in clock.sleeps)
+
+    def test_wait_extract_backs_off(self, clock, monkeypatch):
+        monkeypatch.setattr("firecrawl.v2.methods.extract.time.sleep", clock.sleep)
+        transport = MockTransport()
+        transport.add("GET", "/v2/extract/e1", json={"success": True, "id": "e1", "status": "processing"}, times=3)
+        transport.add("GET", "/v2/extract/e1", json={"success": True, "id": "e1", "status": "completed", "data": {}})
+        client = FirecrawlClient(api_key="key", transport=transport)
+        scheduler = AdaptivePollScheduler(initial_interval=1.0, backoff=2.0)
+
+        result = wait_extract(client.http_client, "e1", poll_interval=5, poll_scheduler=scheduler)
+
+        assert result.status == "completed"
+        assert clock.sleeps == [1.0, 2.0, 4.0]
+
+    def test_async_wait_crawl_uses_scheduler(self, monkeypatch):
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr("firecrawl.v2.client_async.asyncio.sleep", fake_sleep)
+        transport = MockTransport()
+        transport.add("GET", "/v2/crawl/c1", json=_crawl_status(0), times=2)
+        transport.add("GET", "/v2/crawl/c1", json=_crawl_status(10))
+
+        async def run():
+            client = AsyncFirecrawlClient(api_key="key", transport=transport)
+            return await client.wait_crawl(
+                "c1", poll_interval=60, poll_scheduler=AdaptivePollScheduler(initial_interval=1.0, backoff=2.0)
+            )
+
+        result = asyncio.run(run())
+
+        assert result.status == "completed"
+        assert sleeps == [1.0, 2.0]
@@ -0,0 +1,135 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+from firecrawl.v2.utils.rate_limit import RateLimiter
+
+
+def _ok_response():
+    response = MagicMock()
+    response.ok = True
+    response.status_code = 200
+    return response
+
+
+class TestRateLimiter:
+    def test_burst_then_waits_for_refill(self):
+        limiter = RateLimiter(requests_per_second=20, burst=2)
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.acquire()
+            limiter.release()
+        # Third request waits roughly 1/20s for a token
+        assert time.monotonic() - start >= 0.04
+
+    def test_concurrency_cap_across_threads(self):
+        limiter = RateLimiter(max_concurrency=2)
+        peak = []
+        lock = threading.Lock()
+
+        def worker():
+            limiter.acquire()
+            try:
+                with lock:
+                    peak.append(limiter.in_flight)
+                time.sleep(0.01)
+            finally:
+                limiter.release()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert max(peak) <= 2
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_async_concurrency_cap(self):
+        limiter = RateLimiter(max_concurrency=3)
+        peak = 0
+
+        async def worker():
+            nonlocal peak
+            await limiter.acquire_async()
+            try:
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+            finally:
+                limiter.release()
+
+        await asyncio.gather(*(worker() for _ in range(10)))
+        assert peak == 3
+        assert limiter.in_flight == 0
+
+    def test_auto_calibrate_runs_once(self):
+        limiter = RateLimiter(auto_calibrate=True)
+        calibrator = MagicMock(return_value=5)
+        limiter.set_calibrator(calibrator)
+        limiter.acquire()
+        limiter.release()
+        limiter.acquire()
+        limiter.release()
+        assert limiter.max_concurrency == 5
+        calibrator.assert_called_once()
+
+    def test_calibration_failure_keeps_limits(self):
+        limiter = RateLimiter(max_concurrency=4, auto_calibrate=True)
+        limiter.set_calibrator(MagicMock(side_effect=RuntimeError("down")))
+        limiter.acquire()
+        limiter.release()
+        assert limiter.max_concurrency == 4
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"requests_per_second": 0}, {"burst": 0}, {"max_concurrency": 0}],
+    )
+    def test_invalid_options(self, kwargs):
+        with pytest.raises(ValueError):
+            RateLimiter(**kwargs)
+
+
+class TestRateLimitedClients:
+    def test_http_client_releases_slot(self):
+        limiter = RateLimiter(max_concurrency=1)
+        client = HttpClient("key", "https://api.example.com", rate_limiter=limiter)
+        with patch("firecrawl.v2.utils.http_client.requests.Session.get", return_value=_ok_response()):
+            client.get("/v2/crawl/1")
+            client.get("/v2/crawl/2")
+        assert limiter.in_flight == 0
+
+    def test_http_client_releases_slot_on_error(self):
+        limiter = RateLimiter(max_concurrency=1)
+        client = HttpClient("key", "https://api.example.com", rate_limiter=limiter)
+        with patch("firecrawl.v2.utils.http_client.requests.Session.get", side_effect=ValueError("boom")):
+            with pytest.raises(ValueError):
+                client.get("/v2/crawl/1")
+        assert limiter.in_flight == 0
+
+    def test_firecrawl_client_calibrates_from_concurrency(self):
+        limiter = RateLimiter(auto_calibrate=True)
+        client = FirecrawlClient(api_key="key", rate_limiter=limiter)
+        concurrency = MagicMock(max_concurrency=7)
+        with patch("firecrawl.v2.client.usage_methods.get_concurrency", return_value=concurrency):
+            assert limiter.calibrate() == 7
+        assert client.http_client.rate_limiter is limiter
+
+    @pytest.mark.asyncio
+    async def test_async_http_client_uses_limiter(self):
+        limiter = RateLimiter(max_concurrency=1)
+        client = AsyncHttpClient("key", "https://api.example.com", rate_limiter=limiter)
+        client._client = httpx.AsyncClient(
+            base_url="https://api.example.com",
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"success": True})),
+        )
+        responses = await asyncio.gather(*(client.get(f"/v2/crawl/{i}") for i in range(4)))
+        assert all(r.status_code == 200 for r in responses)
+        assert limiter.in_flight == 0
+        await client.close()
@@ -0,0 +1,161 @@
+import asyncio
+import json
+import warnings
+
+import pytest
+from pydantic import ValidationError
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.types import CrawlJob, Document, SearchData
+from firecrawl.v2.utils.documents import build_document, build_documents
+from firecrawl.v2.utils.normalize import normalize_document_input
+from firecrawl.v2.utils.spill import SpillingDocumentList
+from firecrawl.v2.utils.transport import MockTransport
+
+
+@pytest.fixture
+def branded_raw_document(raw_document):
+    def build(i=0):
+        return raw_document(i, branding={"colorScheme": "dark"})
+
+    return build
+
+
+@pytest.fixture
+def crawl_transport(branded_raw_document, status_routes):
+    """Transport answering crawl ``c1`` with ``pages`` status pages of one document each."""
+
+    def build(pages=1):
+        transport = MockTransport()
+        status_routes(transport, "/v2/crawl/c1", [[branded_raw_document(page)] for page in range(pages)])
+        return transport
+
+    return build
+
+
+class TestBuildDocument:
+    def test_dict_mode_uses_snake_case_keys(self, branded_raw_document):
+        raw = branded_raw_document()
+        doc = build_document(raw, "dict")
+
+        assert doc == {
+            "markdown": "# 0",
+            "raw_html": "<p>0</p>",
+            "metadata": {"source_url": "https://example.com/0", "status_code": 200, "customTag": 0},
+            "branding": {"color_scheme": "dark"},
+        }
+        assert raw == branded_raw_document()
+
+    def test_raw_mode_returns_the_response_dict(self, branded_raw_document):
+        raw = branded_raw_document()
+
+        assert build_document(raw, "raw") is raw
+
+    def test_page_is_validated_like_normalized_documents(self, branded_raw_document):
+        raws = [branded_raw_document(0), "https://example.com", branded_raw_document(1), branded_raw_document(2)]
+
+        documents = build_documents(raws, limit=2)
+
+        assert documents == [Document(**normalize_document_input(branded_raw_document(i))) for i in range(2)]
+        assert documents[1].metadata.status_code == 200
+        assert documents[1].metadata.extras == {"customTag": 1}
+        assert documents[1].branding.color_scheme == "dark"
+        assert raws[0] == branded_raw_document(0)
+
+    def test_constructor_keeps_api_keys_as_extras(self):
+        doc = Document(rawHtml="<p></p>", metadata={"sourceURL": "https://example.com"})
+
+        assert doc.raw_html is None
+        assert doc.metadata.source_url is None
+        assert doc.metadata.extras == {"sourceURL": "https://example.com"}
+
+
+class TestResultMode:
+    def test_client_level_dict_mode_covers_every_page(self, crawl_transport):
+        client = FirecrawlClient(api_key="key", transport=crawl_transport(pages=2), result_mode="dict")
+
+        job = client.get_crawl_status("c1")
+
+        assert job.status == "completed"
+        assert [doc["metadata"]["source_url"] for doc in job.data] == ["https://example.com/0", "https://example.com/1"]
+
+    def test_per_call_mode_overrides_the_client(self, branded_raw_document, crawl_transport):
+        client = FirecrawlClient(api_key="key", transport=crawl_transport())
+
+        raw_job = client.get_crawl_status("c1", result_mode="raw")
+        model_job = client.get_crawl_status("c1")
+
+        assert raw_job.data == [branded_raw_document(0)]
+        assert isinstance(model_job.data[0], Document)
+
+    def test_batch_status_and_search(self, branded_raw_document):
+        transport = MockTransport()
+        transport.add(
+            "GET",
+            "/v2/batch/scrape/b1",
+            json={"success": True, "status": "completed", "completed": 1, "total": 1, "data": [branded_raw_document()]},
+        )
+        transport.add(
+            "POST",
+            "/v2/search",
+            json={"success": True, "data": {"web": [branded_raw_document(), {"url": "https://example.com", "title": "t"}], "images": ["https://example.com/i.png"]}},
+        )
+        client = FirecrawlClient(api_key="key", transport=transport)
+
+        batch = client.get_batch_scrape_status("b1", result_mode="dict")
+        search = client.search("example", result_mode="dict")
+
+        assert batch.data[0]["raw_html"] == "<p>0</p>"
+        assert search.web[0]["raw_html"] == "<p>0</p>"
+        assert search.web[1] == {"url": "https://example.com", "title": "t"}
+        assert search.images == [{"url": "https://example.com/i.png"}]
+
+    def test_async_per_call_mode(self, branded_raw_document, crawl_transport):
+        async def run():
+            client = AsyncFirecrawlClient(api_key="key", transport=crawl_transport(pages=2))
+            return await client.get_crawl_status("c1", result_mode="raw")
+
+        job = asyncio.run(run())
+
+        assert job.data == [branded_raw_document(0), branded_raw_document(1)]
+
+    def test_spilled_dicts_are_read_back_as_dicts(self, branded_raw_document):
+        raws = [branded_raw_document(0), branded_raw_document(1)]
+        with SpillingDocumentList(raws, memory_budget=0, result_mode="raw") as documents:
+            assert documents.spilled == 2
+            assert list(documents) == [branded_raw_document(0), branded_raw_document(1)]
+
+    @pytest.mark.parametrize("mode", ["dict", "raw"])
+    def test_jobs_and_search_results_serialize(self, mode, branded_raw_document, crawl_transport):
+        transport = crawl_transport()
+        transport.add(
+            "POST",
+            "/v2/search",
+            json={"success": True, "data": {"web": [branded_raw_document(), {"url": "https://example.com", "title": "t"}]}},
+        )
+        client = FirecrawlClient(api_key="key", transport=transport, result_mode=mode)
+        job = client.get_crawl_status("c1")
+        search = client.search("example")
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert job.model_dump()["data"] == job.data
+            assert json.loads(job.model_dump_json())["data"] == job.data
+            assert search.model_dump()["web"] == search.web
+            assert json.loads(search.model_dump_json())["web"] == search.web
+
+    def test_job_and_search_fields_stay_strict(self):
+        invalid = {"markdown": "x", "metadata": {"status_code": "abc"}}
+
+        with pytest.raises(ValidationError):
+            CrawlJob(status="completed", completed=1, total=1, data=[invalid])
+        with pytest.raises(ValidationError):
+            SearchData(web=[invalid])
+        assert CrawlJob.model_json_schema()["properties"]["data"]["items"] == {"$ref": "#/$defs/Document"}
+
+    def test_rejects_unknown_per_call_mode(self, crawl_transport):
+        client = FirecrawlClient(api_key="key", transport=crawl_transport())
+
+        with pytest.raises(ValueError, match="result_mode"):
+            client.get_crawl_status("c1", result_mode="fast")
@@ -0,0 +1,129 @@
+import httpx
+import pytest
+import requests
+from unittest.mock import MagicMock, patch
+
+from firecrawl.v2.utils.http_client import HttpClient
+from firecrawl.v2.utils.http_client_async import AsyncHttpClient
+from firecrawl.v2.utils.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+def _response(status_code, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.ok = status_code < 400
+    response.headers = headers or {}
+    return response
+
+
+class TestRetryPolicy:
+    def test_full_jitter_stays_within_ceiling(self):
+        policy = RetryPolicy(backoff_factor=1.0, max_backoff=3.0)
+        for attempt in range(6):
+            assert 0 <= policy.backoff(attempt) <= min(3.0, 2 ** attempt)
+
+    def test_no_jitter_is_deterministic(self):
+        policy = RetryPolicy(backoff_factor=0.5, jitter=False)
+        assert [policy.backoff(a) for a in range(3)] == [0.5, 1.0, 2.0]
+
+    def test_post_does_not_retry_504_by_default(self):
+        policy = RetryPolicy()
+        assert policy.is_retryable_status("GET", 504)
+        assert not policy.is_retryable_status("POST", 504)
+        assert policy.is_retryable_status("POST", 429)
+
+    def test_retry_after_seconds_and_limit(self):
+        policy = RetryPolicy(jitter=False, max_retry_after=10)
+        assert policy.delay_for_response(0, {"Retry-After": "3"}) == 3.0
+        assert policy.delay_for_response(0, {"Retry-After": "30"}) is None
+
+    def test_parse_retry_after_http_date(self):
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("garbage") is None
+        assert parse_retry_after(None) is None
+
+    def test_replace_ignores_none(self):
+        policy = RetryPolicy(max_attempts=5).replace(max_attempts=None, backoff_factor=2.0)
+        assert policy.max_attempts == 5
+        assert policy.backoff_factor == 2.0
+
+
+class TestRetryBudget:
+    def test_budget_exhausts_and_refills_from_requests(self):
+        budget = RetryBudget(ratio=0.5, min_retries_per_second=0, max_tokens=1)
+        assert budget.try_acquire()
+        assert not budget.try_acquire()
+        budget.record_request()
+        budget.record_request()
+        assert budget.try_acquire()
+
+
+class TestHttpClientRetries:
+    def _client(self, **kwargs):
+        policy = RetryPolicy(max_attempts=3, backoff_factor=0, jitter=False)
+        return HttpClient("key", "https://api.example.com", retry_policy=policy, **kwargs)
+
+    @patch("firecrawl.v2.utils.http_client.time.sleep")
+    def test_retries_429_then_succeeds(self, mock_sleep):
+        client = self._client()
+        responses = [_response(429, {"Retry-After": "2"}), _response(200)]
+        with patch("firecrawl.v2.utils.http_client.requests.Session.get", side_effect=responses) as mock_get:
+            result = client.get("/v2/crawl/1")
+        assert result.status_code == 200
+        assert mock_get.call_count == 2
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch("firecrawl.v2.utils.http_client.time.sleep")
+    def test_gives_up_after_max_attempts(self, _):
+        client = self._client()
+        with patch("firecrawl.v2.utils.http_client.requests.Session.get", return_value=_response(503)) as mock_get:
+            result = client.get("/v2/crawl/1")
+        assert result.status_code == 503
+        assert mock_get.call_count == 3
+
+    @patch("firecrawl.v2.utils.http_client.time.sleep")
+    def test_per_call_override(self, _):
+        client = self._client()
+        with patch("firecrawl.v2.utils.http_client.requests.Session.get", return_value=_response(503)) as mock_get:
+            client.get("/v2/crawl/1", retries=1)
+        assert mock_get.call_count == 1
+
+    @patch("firecrawl.v2.utils.http_client.time.sleep")
+    def test_budget_stops_retries(self, _):
+        client = self._client(retry_budget=RetryBudget(ratio=0, min_retries_per_second=0, max_tokens=1))
+        with patch("firecrawl.v2.utils.http_client.requests.Session.get", return_value=_response(502)) as mock_get:
+            client.get("/v2/crawl/1")
+        # One budgeted retry, then the budget is exhausted
+        assert mock_get.call_count == 2
+
+    @patch("firecrawl.v2.utils.http_client.time.sleep")
+    def test_network_errors_are_retried(self, _):
+        client = self._client()
+        side_effect = [requests.ConnectionError("boom"), _response(200)]
+        with patch("firecrawl.v2.utils.http_client.requests.Session.post", side_effect=side_effect) as mock_post:
+            result = client.post("/v2/scrape", {"url": "https://example.com"})
+        assert result.status_code == 200
+        assert mock_post.call_count == 2
+
+
+class TestAsyncHttpClientRetries:
+    @pytest.mark.asyncio
+    async def test_async_retries_on_429(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            return httpx.Response(200, json={"success": True})
+
+        client = AsyncHttpClient(
+            "key",
+            "https://api.example.com",
+            retry_policy=RetryPolicy(backoff_factor=0, jitter=False),
+        )
+        client._client = httpx.AsyncClient(base_url="https://api.example.com", transport=httpx.MockTransport(handler))
+        response = await client.get("/v2/crawl/1")
+        assert response.status_code == 200
+        assert len(calls) == 2
+        await client.close()
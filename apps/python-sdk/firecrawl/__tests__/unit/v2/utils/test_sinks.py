@@ -0,0 +1,140 @@
+import asyncio
+import json
+import sqlite3
+import threading
+
+import pytest
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.utils.sinks import DocumentSink, JsonlSink, ParquetSink, SQLiteSink
+from firecrawl.v2.utils.transport import MockTransport
+
+
+class RecordingSink(DocumentSink):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches = []
+        self.threads = set()
+        self.closed = False
+
+    def _write_batch(self, documents):
+        self.threads.add(threading.current_thread().name)
+        self.batches.append([d["markdown"] for d in documents])
+
+    def _close(self):
+        self.closed = True
+
+
+class TestDocumentSink:
+    def test_batches_on_writer_thread(self, raw_documents):
+        sink = RecordingSink(batch_size=3)
+        sink.write(raw_documents(0, 2))
+        sink.write(raw_documents(2, 4))
+        sink.write(["https://example.com/string"])
+        sink.close()
+
+        assert sink.batches == [["# 0", "# 1", "# 2", "# 3"]]
+        assert sink.threads == {"firecrawl-sink"}
+        assert sink.closed
+        assert sink.written == 4
+
+    def test_flush_writes_partial_batch(self, raw_documents):
+        sink = RecordingSink(batch_size=100)
+        sink.write(raw_documents(0, 2))
+        sink.flush()
+        assert sink.batches == [["# 0", "# 1"]]
+        sink.close()
+
+    def test_writer_errors_are_raised(self, raw_documents):
+        class FailingSink(DocumentSink):
+            def _write_batch(self, documents):
+                raise OSError("disk full")
+
+        sink = FailingSink(batch_size=1)
+        sink.write(raw_documents(0, 1))
+        with pytest.raises(OSError, match="disk full"):
+            sink.flush()
+        sink.close()
+
+    def test_write_after_close(self, raw_documents):
+        sink = RecordingSink()
+        sink.close()
+        with pytest.raises(ValueError):
+            sink.write(raw_documents(0, 1))
+
+
+class TestSinkFormats:
+    def test_jsonl_appends_raw_documents(self, tmp_path, raw_documents):
+        path = tmp_path / "out.jsonl"
+        with JsonlSink(str(path), batch_size=2) as sink:
+            sink.write(raw_documents(0, 3))
+        with JsonlSink(str(path)) as sink:
+            sink.write(raw_documents(3, 4))
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert lines == raw_documents(0, 4)
+
+    def test_sqlite_rows(self, tmp_path, raw_documents):
+        path = tmp_path / "out.db"
+        with SQLiteSink(str(path), table="pages", batch_size=2) as sink:
+            sink.write(raw_documents(0, 3))
+
+        conn = sqlite3.connect(str(path))
+        rows = conn.execute("SELECT url, markdown, metadata, document FROM pages ORDER BY id").fetchall()
+        conn.close()
+        assert [r[0] for r in rows] == [f"https://example.com/{i}" for i in range(3)]
+        assert rows[0][1] == "# 0"
+        assert json.loads(rows[0][2])["sourceURL"] == "https://example.com/0"
+        assert json.loads(rows[0][3]) == {"rawHtml": "<p>0</p>"}
+
+    def test_sqlite_rejects_bad_table_name(self, tmp_path):
+        with pytest.raises(ValueError):
+            SQLiteSink(str(tmp_path / "out.db"), table="pages; DROP TABLE x")
+
+    def test_parquet_row_groups(self, tmp_path, raw_documents):
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "out.parquet"
+        with ParquetSink(str(path), batch_size=2) as sink:
+            sink.write(raw_documents(0, 3))
+
+        table = pq.read_table(str(path))
+        assert table.column("url").to_pylist() == [f"https://example.com/{i}" for i in range(3)]
+        assert pq.ParquetFile(str(path)).num_row_groups == 2
+
+
+class TestClientSinks:
+    def test_crawl_writes_pages_to_sink(self, tmp_path, raw_documents, status_routes):
+        transport = MockTransport()
+        transport.add("POST", "/v2/crawl", json={"success": True, "id": "c1", "url": "https://example.com"})
+        status_routes(transport, "/v2/crawl/c1", [raw_documents(0, 3), raw_documents(3, 5)])
+        client = FirecrawlClient(api_key="key", transport=transport)
+        path = tmp_path / "crawl.jsonl"
+
+        with JsonlSink(str(path)) as sink:
+            job = client.crawl("https://example.com", poll_interval=0, sink=sink)
+            # crawl() returns once every document was written
+            assert len(path.read_text().splitlines()) == 5
+
+        assert job.status == "completed"
+        assert job.total == 5
+        assert job.data == []
+
+    def test_async_batch_scrape_writes_pages_to_sink(self, tmp_path, raw_documents, status_routes):
+        transport = MockTransport()
+        transport.add("POST", "/v2/batch/scrape", json={"success": True, "id": "b1", "url": "https://example.com"})
+        status_routes(transport, "/v2/batch/scrape/b1", [raw_documents(0, 2), raw_documents(2, 5)])
+        path = tmp_path / "batch.db"
+
+        async def run():
+            client = AsyncFirecrawlClient(api_key="key", transport=transport)
+            with SQLiteSink(str(path)) as sink:
+                return await client.batch_scrape(["https://example.com"], poll_interval=0, sink=sink)
+
+        job = asyncio.run(run())
+
+        conn = sqlite3.connect(str(path))
+        count = conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+        conn.close()
+        assert count == 5
+        assert job.data == []
@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.types import Document
+from firecrawl.v2.utils.normalize import normalize_document_input
+from firecrawl.v2.utils.spill import SpillingDocumentList
+from firecrawl.v2.utils.transport import MockTransport
+
+
+@pytest.fixture
+def large_raw_document(raw_document):
+    """Raw document ``i`` with a 1 KB markdown body, so a few of them exceed a small budget."""
+
+    def build(i):
+        return raw_document(i, markdown=f"# {i} " + "x" * 1000, links=[f"https://example.com/{i}/a"])
+
+    return build
+
+
+@pytest.fixture
+def large_document(large_raw_document):
+    def build(i):
+        return Document(**normalize_document_input(large_raw_document(i)))
+
+    return build
+
+
+class TestSpillingDocumentList:
+    def test_spills_oldest_documents_beyond_budget(self, tmp_path, large_document):
+        with SpillingDocumentList(memory_budget=4000, directory=str(tmp_path)) as documents:
+            documents.extend(large_document(i) for i in range(10))
+
+            assert len(documents) == 10
+            assert documents.spilled > 0
+            assert documents.memory_bytes <= 4000
+            assert [doc.markdown.split()[1] for doc in documents] == [str(i) for i in range(10)]
+
+    def test_spilled_documents_round_trip(self, large_document):
+        original = large_document(0)
+        with SpillingDocumentList([original, large_document(1)], memory_budget=0) as documents:
+            assert documents.spilled == 2
+            restored = documents[0]
+
+        assert restored == original
+        assert restored.raw_html == "<p>0</p>"
+        assert restored.metadata_dict["customTag"] == 0
+
+    def test_indexing_and_slicing(self, large_document):
+        with SpillingDocumentList((large_document(i) for i in range(6)), memory_budget=3000) as documents:
+            assert documents[0].links == ["https://example.com/0/a"]
+            assert documents[-1].metadata.source_url == "https://example.com/5"
+            assert [doc.metadata.source_url for doc in documents[1:5:2]] == [
+                "https://example.com/1",
+                "https://example.com/3",
+            ]
+            with pytest.raises(IndexError):
+                documents[6]
+
+    def test_iterates_across_read_chunks(self, monkeypatch, large_document):
+        monkeypatch.setattr("firecrawl.v2.utils.spill._READ_CHUNK", 3)
+        with SpillingDocumentList((large_document(i) for i in range(8)), memory_budget=0) as documents:
+            assert [doc.metadata.source_url for doc in documents] == [f"https://example.com/{i}" for i in range(8)]
+
+    def test_everything_stays_in_memory_within_budget(self, large_document):
+        documents = SpillingDocumentList((large_document(i) for i in range(3)))
+
+        assert documents.spilled == 0
+        assert documents._file is None
+        assert list(documents)[2].markdown.startswith("# 2")
+
+    def test_rejects_negative_budget(self):
+        with pytest.raises(ValueError):
+            SpillingDocumentList(memory_budget=-1)
+
+
+class TestClientMemoryBudget:
+    def test_crawl_returns_spilling_list(self, large_raw_document, status_routes):
+        transport = MockTransport()
+        transport.add("POST", "/v2/crawl", json={"success": True, "id": "c1", "url": "https://example.com"})
+        status_routes(transport, "/v2/crawl/c1", [[large_raw_document(i) for i in range(4)], [large_raw_document(i) for i in range(4, 6)]])
+        client = FirecrawlClient(api_key="key", transport=transport)
+
+        job = client.crawl("https://example.com", poll_interval=0, memory_budget=3000)
+
+        assert isinstance(job.data, SpillingDocumentList)
+        assert job.data.spilled > 0
+        assert len(job.data) == 6
+        assert [doc.metadata.source_url for doc in job.data] == [f"https://example.com/{i}" for i in range(6)]
+        job.data.close()
+
+    def test_crawl_rejects_sink_with_memory_budget(self):
+        client = FirecrawlClient(api_key="key", transport=MockTransport())
+        with pytest.raises(ValueError, match="memory_budget"):
+            client.crawl("https://example.com", sink=object(), memory_budget=1)
+
+    def test_async_batch_scrape_returns_spilling_list(self, large_raw_document, status_routes):
+        transport = MockTransport()
+        transport.add("POST", "/v2/batch/scrape", json={"success": True, "id": "b1", "url": "https://example.com"})
+        status_routes(transport, "/v2/batch/scrape/b1", [[large_raw_document(i) for i in range(3)], [large_raw_document(i) for i in range(3, 6)]])
+
+        async def run():
+            client = AsyncFirecrawlClient(api_key="key", transport=transport)
+            return await client.batch_scrape(["https://example.com"], poll_interval=0, memory_budget=0)
+
+        job = asyncio.run(run())
+
+        assert job.data.spilled == 6
+        assert job.data[4].metadata.source_url == "https://example.com/4"
+        job.data.close()
@@ -0,0 +1,128 @@
+import re
+
+import pytest
+import requests
+
+from firecrawl.v2.client import FirecrawlClient
+from firecrawl.v2.client_async import AsyncFirecrawlClient
+from firecrawl.v2.utils.retry import RetryPolicy
+from firecrawl.v2.utils.transport import (
+    CassetteTransport,
+    MockTransport,
+    TransportResponse,
+    UnmatchedRequestError,
+)
+
+
+def _page(status, docs, next_url=None):
+    return {
+        "success": True,
+        "status": status,
+        "completed": len(docs),
+        "total": len(docs),
+        "creditsUsed": len(docs),
+        "data": [{"markdown": f"# {d}", "metadata": {"sourceURL": d}} for d in docs],
+        "next": next_url,
+    }
+
+
+class TestMockTransport:
+    def test_scripted_crawl_status_with_pagination(self):
+        transport = MockTransport()
+        transport.add(
+            "GET",
+            "/v2/crawl/c1",
+            json=_page("completed", ["https://a.com"], "https://api.firecrawl.dev/v2/crawl/c1?skip=1"),
+        )
+        transport.add("GET", "/v2/crawl/c1?skip=1", json=_page("completed", ["https://b.com"]))
+        client = FirecrawlClient(api_key="key", transport=transport)
+
+        job = client.get_crawl_status("c1")
+
+        assert [d.metadata.source_url for d in job.data] == ["https://a.com", "https://b.com"]
+        assert [r.target for r in transport.requests] == ["/v2/crawl/c1", "/v2/crawl/c1?skip=1"]
+        assert transport.requests[0].headers["Authorization"] == "Bearer key"
+
+    def test_post_body_is_visible(self):
+        transport = MockTransport().add("POST", "/v2/crawl", json={"success": True, "id": "c1", "url": "u"})
+        client = FirecrawlClient(api_key="key", transport=transport)
+        client.start_crawl("https://example.com", limit=5)
+        body = transport.requests[0].json()
+        assert body["url"] == "https://example.com"
+        assert body["limit"] == 5
+
+    def test_times_regex_and_handler(self):
+        transport = MockTransport(handler=lambda request: {"fallback": request.target})
+        transport.add("GET", re.compile(r"/v2/crawl/\w+"), status_code=503, times=1)
+        transport.add("GET", re.compile(r"/v2/crawl/\w+"), json={"ok": True})
+        assert transport.send("GET", "https://x/v2/crawl/a", headers={}).status_code == 503
+        assert transport.send("GET", "https://x/v2/crawl/a", headers={}).json() == {"ok": True}
+        assert transport.send("GET", "https://x/v2/map", headers={}).json() == {"fallback": "/v2/map"}
+
+    def test_unmatched_request(self):
+        with pytest.raises(UnmatchedRequestError):
+            MockTransport().send("GET", "https://x/v2/crawl/a", headers={})
+
+    def test_retries_apply_to_scripted_failures(self):
+        transport = MockTransport()
+        transport.add("GET", "/v2/crawl/c1", status_code=502, times=1)
+        transport.add("GET", "/v2/crawl/c1", json=_page("scraping", []))
+        client = FirecrawlClient(api_key="key", transport=transport, retry_policy=RetryPolicy(backoff_factor=0))
+        assert client.get_crawl_status("c1").status == "scraping"
+        assert len(transport.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_async_client_uses_transport(self):
+        transport = MockTransport().add("GET", "/v2/crawl/c1", json=_page("completed", ["https://a.com"]))
+        client = AsyncFirecrawlClient(api_key="key", transport=transport)
+        job = await client.get_crawl_status("c1")
+        assert job.status == "completed"
+        assert len(job.data) == 1
+        await client.close()
+
+
+class TestCassetteTransport:
+    def test_record_then_replay(self, tmp_path):
+        cassette = str(tmp_path / "session.jsonl")
+        network = MockTransport()
+        network.add("GET", "/v2/crawl/c1", json=_page("scraping", []), times=1)
+        network.add("GET", "/v2/crawl/c1", json=_page("completed", ["https://a.com"]))
+
+        recorder = CassetteTransport(cassette, mode="record", inner=network)
+        client = FirecrawlClient(api_key="secret", transport=recorder)
+        assert client.get_crawl_status("c1").status == "scraping"
+        assert client.get_crawl_status("c1").status == "completed"
+        with open(cassette) as f:
+            assert "secret" not in f.read()
+
+        player = CassetteTransport(cassette)
+        assert player.mode == "replay"
+        offline = FirecrawlClient(api_key="other", transport=player)
+        assert offline.get_crawl_status("c1").status == "scraping"
+        assert offline.get_crawl_status("c1").status == "completed"
+        # Exhausted recordings repeat the last answer
+        assert offline.get_crawl_status("c1").data[0].metadata.source_url == "https://a.com"
+        with pytest.raises(UnmatchedRequestError):
+            offline.get_crawl_status("other")
+
+    def test_records_from_default_network_transport(self, tmp_path, monkeypatch):
+        def fake_get(session, url, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+            response._content = b'{"success": true, "status": "completed", "data": []}'
+            response.headers["Content-Encoding"] = "gzip"
+            return response
+
+        monkeypatch.setattr(requests.Session, "get", fake_get)
+        cassette = str(tmp_path / "net.jsonl")
+        client = FirecrawlClient(api_key="key", transport=CassetteTransport(cassette, mode="record"))
+        assert client.get_crawl_status("c1").status == "completed"
+
+        replayed = CassetteTransport(cassette, mode="replay").send("GET", "https://h/v2/crawl/c1", headers={})
+        assert isinstance(replayed, TransportResponse)
+        assert "Content-Encoding" not in replayed.headers
+        assert replayed.json()["status"] == "completed"
+
+    def test_invalid_mode(self, tmp_path):
+        with pytest.raises(ValueError):
+            CassetteTransport(str(tmp_path / "x.jsonl"), mode="live")
@@ -25,7 +25,13 @@ import logging
 from .v1 import V1FirecrawlApp, AsyncV1FirecrawlApp
 from .v2 import FirecrawlClient as V2FirecrawlClient
 from .v2.client_async import AsyncFirecrawlClient
-from .v2.types import Document
+from .v2.types import Document, ResultMode
+from .v2.utils.retry import RetryPolicy
+from .v2.utils.rate_limit import RateLimiter
+from .v2.utils.compression import CompressionPolicy
+from .v2.utils.hedging import HedgePolicy
+from .v2.utils.circuit_breaker import CircuitBreaker
+from .v2.utils.transport import Transport
 
 logger = logging.getLogger("firecrawl")
 
@@ -61,6 +67,7 @@ class V2Proxy:
             self.crawl = client_instance.crawl
             self.start_crawl = client_instance.start_crawl
             self.get_crawl_status = client_instance.get_crawl_status
+            self.iter_crawl_documents = client_instance.iter_crawl_documents
             self.cancel_crawl = client_instance.cancel_crawl
             self.get_crawl_errors = client_instance.get_crawl_errors
             self.get_active_crawls = client_instance.get_active_crawls
@@ -78,6 +85,7 @@ class V2Proxy:
 
             self.start_batch_scrape = client_instance.start_batch_scrape
             self.get_batch_scrape_status = client_instance.get_batch_scrape_status
+            self.iter_batch_documents = client_instance.iter_batch_documents
             self.cancel_batch_scrape = client_instance.cancel_batch_scrape
             self.batch_scrape = client_instance.batch_scrape
             self.get_batch_scrape_errors = client_instance.get_batch_scrape_errors
@@ -89,6 +97,10 @@ class V2Proxy:
             self.get_queue_status = client_instance.get_queue_status
 
             self.watcher = client_instance.watcher
+            self.submit_crawl = client_instance.submit_crawl
+            self.submit_batch_scrape = client_instance.submit_batch_scrape
+            self.submit_extract = client_instance.submit_extract
+            self.submit_agent = client_instance.submit_agent
     
     def __getattr__(self, name):
         """Forward attribute access to the underlying client."""
@@ -127,6 +139,7 @@ class AsyncV2Proxy:
             self.start_crawl = client_instance.start_crawl
             self.wait_crawl = client_instance.wait_crawl
             self.get_crawl_status = client_instance.get_crawl_status
+            self.iter_crawl_documents = client_instance.iter_crawl_documents
             self.cancel_crawl = client_instance.cancel_crawl
             self.get_crawl_errors = client_instance.get_crawl_errors
             self.get_active_crawls = client_instance.get_active_crawls
@@ -144,6 +157,7 @@ class AsyncV2Proxy:
 
             self.start_batch_scrape = client_instance.start_batch_scrape
             self.get_batch_scrape_status = client_instance.get_batch_scrape_status
+            self.iter_batch_documents = client_instance.iter_batch_documents
             self.cancel_batch_scrape = client_instance.cancel_batch_scrape
             self.wait_batch_scrape = client_instance.wait_batch_scrape
             self.batch_scrape = client_instance.batch_scrape
@@ -156,6 +170,10 @@ class AsyncV2Proxy:
             self.get_queue_status = client_instance.get_queue_status
 
             self.watcher = client_instance.watcher
+            self.submit_crawl = client_instance.submit_crawl
+            self.submit_batch_scrape = client_instance.submit_batch_scrape
+            self.submit_extract = client_instance.submit_extract
+            self.submit_agent = client_instance.submit_agent
 
     def __getattr__(self, name):
         """Forward attribute access to the underlying client."""
@@ -172,19 +190,57 @@ class Firecrawl:
     keeping a feature-frozen v1 available for incremental migration.
     """
     
-    def __init__(self, api_key: str = None, api_url: str = "https://api.firecrawl.dev"):
+    def __init__(
+        self,
+        api_key: str = None,
+        api_url: str = "https://api.firecrawl.dev",
+        *,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_idle_timeout: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        compression: Optional[CompressionPolicy] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        transport: Optional[Transport] = None,
+        result_mode: ResultMode = "model",
+    ):
         """Initialize the unified client.
 
         Args:
             api_key: Firecrawl API key (or set ``FIRECRAWL_API_KEY``)
             api_url: Base API URL (defaults to production)
+            pool_connections: Number of per-host connection pools kept by the v2 HTTP session
+            pool_maxsize: Maximum number of keep-alive connections per host
+            pool_idle_timeout: Seconds of inactivity after which pooled connections are dropped
+            retry_policy: Retry policy (status rules, Retry-After, jitter, budget) for v2 requests
+            rate_limiter: Client-side limiter for v2 requests (RateLimiter or AdaptiveConcurrencyLimiter)
+            compression: Opt-in compression of large v2 request bodies and responses
+            hedge_policy: Opt-in hedging of slow v2 GET requests (status polls, pagination)
+            circuit_breaker: Opt-in per-endpoint circuit breaker for v2 requests
+            transport: Replace the v2 network transport (``MockTransport``, ``CassetteTransport``)
+            result_mode: How v2 crawl, batch scrape and search documents are built ("model", "lazy", "compact", "dict" or "raw")
         """
         self.api_key = api_key
         self.api_url = api_url
         
         # Initialize version-specific clients
         self._v1_client = V1FirecrawlApp(api_key=api_key, api_url=api_url) if V1FirecrawlApp else None
-        self._v2_client = V2FirecrawlClient(api_key=api_key, api_url=api_url) if V2FirecrawlClient else None
+        self._v2_client = V2FirecrawlClient(
+            api_key=api_key,
+            api_url=api_url,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_idle_timeout=pool_idle_timeout,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            compression=compression,
+            hedge_policy=hedge_policy,
+            circuit_breaker=circuit_breaker,
+            transport=transport,
+            result_mode=result_mode,
+        ) if V2FirecrawlClient else None
         
         # Create version-specific proxies
         self.v1 = V1Proxy(self._v1_client) if self._v1_client else None
@@ -198,6 +254,7 @@ class Firecrawl:
         self.start_crawl = self._v2_client.start_crawl
         self.crawl_params_preview = self._v2_client.crawl_params_preview
         self.get_crawl_status = self._v2_client.get_crawl_status
+        self.iter_crawl_documents = self._v2_client.iter_crawl_documents
         self.cancel_crawl = self._v2_client.cancel_crawl
         self.get_crawl_errors = self._v2_client.get_crawl_errors
         self.get_active_crawls = self._v2_client.get_active_crawls
@@ -205,6 +262,7 @@ class Firecrawl:
 
         self.start_batch_scrape = self._v2_client.start_batch_scrape
         self.get_batch_scrape_status = self._v2_client.get_batch_scrape_status
+        self.iter_batch_documents = self._v2_client.iter_batch_documents
         self.cancel_batch_scrape = self._v2_client.cancel_batch_scrape
         self.batch_scrape = self._v2_client.batch_scrape
         self.get_batch_scrape_errors = self._v2_client.get_batch_scrape_errors
@@ -224,17 +282,69 @@ class Firecrawl:
         self.get_queue_status = self._v2_client.get_queue_status
         
         self.watcher = self._v2_client.watcher
+        self.submit_crawl = self._v2_client.submit_crawl
+        self.submit_batch_scrape = self._v2_client.submit_batch_scrape
+        self.submit_extract = self._v2_client.submit_extract
+        self.submit_agent = self._v2_client.submit_agent
+        self.close = self._v2_client.close
         
 class AsyncFirecrawl:
     """Async unified Firecrawl client (v2 by default, v1 under ``.v1``)."""
 
-    def __init__(self, api_key: str = None, api_url: str = "https://api.firecrawl.dev"):
+    def __init__(
+        self,
+        api_key: str = None,
+        api_url: str = "https://api.firecrawl.dev",
+        *,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        compression: Optional[CompressionPolicy] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        transport: Optional[Transport] = None,
+        result_mode: ResultMode = "model",
+    ):
+        """Initialize the async unified client.
+
+        Args:
+            api_key: Firecrawl API key (or set ``FIRECRAWL_API_KEY``)
+            api_url: Base API URL (defaults to production)
+            max_connections: Maximum number of concurrent v2 connections
+            max_keepalive_connections: Maximum number of idle v2 connections kept for reuse
+            keepalive_expiry: Seconds an idle connection is kept before being closed
+            http2: Multiplex concurrent v2 requests over HTTP/2 (requires ``h2``)
+            retry_policy: Retry policy (status rules, Retry-After, jitter, budget) for v2 requests
+            rate_limiter: Client-side limiter for v2 requests (RateLimiter or AdaptiveConcurrencyLimiter)
+            compression: Opt-in compression of large v2 request bodies and responses
+            hedge_policy: Opt-in hedging of slow v2 GET requests (status polls, pagination)
+            circuit_breaker: Opt-in per-endpoint circuit breaker for v2 requests
+            transport: Replace the v2 network transport (``MockTransport``, ``CassetteTransport``)
+            result_mode: How v2 crawl, batch scrape and search documents are built ("model", "lazy", "compact", "dict" or "raw")
+        """
         self.api_key = api_key
         self.api_url = api_url
         
         # Initialize version-specific clients
         self._v1_client = AsyncV1FirecrawlApp(api_key=api_key, api_url=api_url) if AsyncV1FirecrawlApp else None
-        self._v2_client = AsyncFirecrawlClient(api_key=api_key, api_url=api_url) if AsyncFirecrawlClient else None
+        self._v2_client = AsyncFirecrawlClient(
+            api_key=api_key,
+            api_url=api_url,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            compression=compression,
+            hedge_policy=hedge_policy,
+            circuit_breaker=circuit_breaker,
+            transport=transport,
+            result_mode=result_mode,
+        ) if AsyncFirecrawlClient else None
         
         # Create version-specific proxies
         self.v1 = AsyncV1Proxy(self._v1_client) if self._v1_client else None
@@ -248,6 +358,7 @@ class AsyncFirecrawl:
 
         self.start_crawl = self._v2_client.start_crawl
         self.get_crawl_status = self._v2_client.get_crawl_status
+        self.iter_crawl_documents = self._v2_client.iter_crawl_documents
         self.cancel_crawl = self._v2_client.cancel_crawl
         self.crawl = self._v2_client.crawl
         self.get_crawl_errors = self._v2_client.get_crawl_errors
@@ -256,6 +367,7 @@ class AsyncFirecrawl:
 
         self.start_batch_scrape = self._v2_client.start_batch_scrape
         self.get_batch_scrape_status = self._v2_client.get_batch_scrape_status
+        self.iter_batch_documents = self._v2_client.iter_batch_documents
         self.cancel_batch_scrape = self._v2_client.cancel_batch_scrape
         self.batch_scrape = self._v2_client.batch_scrape
         self.get_batch_scrape_errors = self._v2_client.get_batch_scrape_errors
@@ -275,6 +387,11 @@ class AsyncFirecrawl:
         self.get_queue_status = self._v2_client.get_queue_status
 
         self.watcher = self._v2_client.watcher
+        self.submit_crawl = self._v2_client.submit_crawl
+        self.submit_batch_scrape = self._v2_client.submit_batch_scrape
+        self.submit_extract = self._v2_client.submit_extract
+        self.submit_agent = self._v2_client.submit_agent
+        self.close = self._v2_client.close
 
 # Export Firecrawl as an alias for FirecrawlApp
 FirecrawlApp = Firecrawl
@@ -1,4 +1,6 @@
 from .client import FirecrawlClient
 from .client_async import AsyncFirecrawlClient
+from .monitor import JobHandle, JobMonitor
+from .monitor_async import AsyncJobHandle, AsyncJobMonitor
 
-__all__ = ["FirecrawlClient", "AsyncFirecrawlClient"]
\ No newline at end of file
+__all__ = ["FirecrawlClient", "AsyncFirecrawlClient", "JobMonitor", "AsyncJobMonitor", "JobHandle", "AsyncJobHandle"]
\ No newline at end of file
@@ -5,7 +5,9 @@ This module provides the main client class that orchestrates all v2 functionalit
 """
 
 import os
-from typing import Optional, List, Dict, Any, Callable, Union, Literal
+import threading
+from concurrent.futures import Future
+from typing import Optional, List, Dict, Any, Callable, Iterator, Union, Literal
 from .types import (
     ClientConfig,
     ScrapeOptions,
@@ -37,9 +39,20 @@ from .types import (
     PDFAction,
     Location,
     PaginationConfig,
+    PollMode,
+    ResultMode,
     AgentOptions,
 )
 from .utils.http_client import HttpClient
+from .utils.retry import RetryPolicy
+from .utils.rate_limit import RateLimiter
+from .utils.compression import CompressionPolicy
+from .utils.hedging import HedgePolicy
+from .utils.circuit_breaker import CircuitBreaker
+from .utils.transport import Transport
+from .utils.checkpoint import CheckpointStore
+from .utils.sinks import DocumentSink
+from .utils.polling import AdaptivePollScheduler
 from .utils.error_handler import FirecrawlError
 from .methods import scrape as scrape_module
 from .methods import crawl as crawl_module  
@@ -51,6 +64,7 @@ from .methods import usage as usage_methods
 from .methods import extract as extract_module
 from .methods import agent as agent_module
 from .watcher import Watcher
+from .monitor import JobHandle, JobMonitor
 
 class FirecrawlClient:
     """
@@ -69,7 +83,18 @@ class FirecrawlClient:
         api_url: str = "https://api.firecrawl.dev",
         timeout: Optional[float] = None,
         max_retries: int = 3,
-        backoff_factor: float = 0.5
+        backoff_factor: float = 0.5,
+        *,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_idle_timeout: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        compression: Optional[CompressionPolicy] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        transport: Optional[Transport] = None,
+        result_mode: ResultMode = "model",
     ):
         """
         Initialize the Firecrawl client.
@@ -80,6 +105,21 @@ class FirecrawlClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for failed requests
             backoff_factor: Exponential backoff factor for retries (e.g. 0.5 means wait 0.5s, then 1s, then 2s between retries)
+            pool_connections: Number of per-host connection pools kept by the HTTP session
+            pool_maxsize: Maximum number of keep-alive connections per host (raise for multi-threaded use)
+            pool_idle_timeout: Seconds of inactivity after which pooled connections are dropped (None to keep them)
+            retry_policy: Full retry policy (status rules, Retry-After, jitter); overrides max_retries/backoff_factor
+            rate_limiter: Client-side rate/concurrency limiter; may be shared with other clients. With
+                ``auto_calibrate=True`` its concurrency cap is taken from ``get_concurrency()`` on first use
+            compression: Compress large request bodies and negotiate compressed responses (off by default)
+            hedge_policy: Duplicate slow status/pagination GETs and keep the first answer (off by default)
+            circuit_breaker: Fail fast per endpoint family while the API is failing; pass
+                ``CircuitBreaker.shared()`` to share state with every client in the process
+            transport: Replace the network transport (``MockTransport``, ``CassetteTransport``)
+            result_mode: How crawl, batch scrape and search documents are built: ``"model"`` (default),
+                ``"lazy"`` (validated field by field on first access), ``"compact"`` (memory-lean
+                ``CompactDocument`` objects), ``"dict"`` (snake_case dicts) or ``"raw"`` (the API's
+                camelCase dicts)
         """
         if api_key is None:
             api_key = os.getenv("FIRECRAWL_API_KEY")
@@ -95,11 +135,43 @@ class FirecrawlClient:
             api_url=api_url,
             timeout=timeout,
             max_retries=max_retries,
-            backoff_factor=backoff_factor
+            backoff_factor=backoff_factor,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_idle_timeout=pool_idle_timeout,
         )
 
-        self.http_client = HttpClient(api_key, api_url)
-    
+        self.http_client = HttpClient(
+            api_key,
+            api_url,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_idle_timeout=pool_idle_timeout,
+            retry_policy=retry_policy or RetryPolicy(max_attempts=max_retries, backoff_factor=backoff_factor),
+            rate_limiter=rate_limiter,
+            compression=compression,
+            hedge_policy=hedge_policy,
+            circuit_breaker=circuit_breaker,
+            transport=transport,
+            result_mode=result_mode,
+        )
+        if rate_limiter is not None:
+            rate_limiter.set_calibrator(lambda: usage_methods.get_concurrency(self.http_client).max_concurrency)
+        self._job_monitor: Optional[JobMonitor] = None
+        self._job_monitor_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close pooled HTTP connections held by this client and stop tracking submitted jobs."""
+        if self._job_monitor is not None:
+            self._job_monitor.close()
+        self.http_client.close()
+
+    def __enter__(self) -> "FirecrawlClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def scrape(
         self,
         url: str,
@@ -175,7 +247,10 @@ class FirecrawlClient:
                 integration=integration,
             ).items() if v is not None}
         ) if any(v is not None for v in [formats, headers, include_tags, exclude_tags, only_main_content, timeout, wait_for, mobile, parsers, actions, location, skip_tls_verification, remove_base64_images, fast_mode, use_mock, block_ads, proxy, max_age, store_in_cache, integration]) else None
-        return scrape_module.scrape(self.http_client, url, options)
+        document = scrape_module.scrape(self.http_client, url, options)
+        if self.http_client.rate_limiter is not None:
+            self.http_client.rate_limiter.record_document(document)
+        return document
 
     def search(
         self,
@@ -190,6 +265,7 @@ class FirecrawlClient:
         timeout: Optional[int] = None,
         scrape_options: Optional[ScrapeOptions] = None,
         integration: Optional[str] = None,
+        result_mode: Optional[ResultMode] = None,
     ) -> SearchData:
         """
         Search for documents.
@@ -201,6 +277,7 @@ class FirecrawlClient:
             location: Location string for search
             timeout: Request timeout in milliseconds (default: 300000)
             page_options: Options for scraping individual pages
+            result_mode: Overrides the client's result mode for this call ("dict" and "raw" return plain dicts)
             
         Returns:
             SearchData containing the search results
@@ -218,7 +295,7 @@ class FirecrawlClient:
             integration=integration,
         )
 
-        return search_module.search(self.http_client, request)
+        return search_module.search(self.http_client, request, result_mode=result_mode)
     
     def crawl(
         self,
@@ -243,6 +320,10 @@ class FirecrawlClient:
         timeout: Optional[int] = None,
         request_timeout: Optional[float] = None,
         integration: Optional[str] = None,
+        poll_mode: PollMode = "full",
+        sink: Optional[DocumentSink] = None,
+        poll_scheduler: Optional[AdaptivePollScheduler] = None,
+        memory_budget: Optional[int] = None,
     ) -> CrawlJob:
         """
         Start a crawl job and wait for it to complete.
@@ -267,6 +348,10 @@ class FirecrawlClient:
             poll_interval: Seconds between status checks
             timeout: Maximum seconds to wait for the entire crawl job to complete (None for no timeout)
             request_timeout: Timeout (in seconds) for each individual HTTP request, including pagination requests when fetching results. If there are multiple pages, each page request gets this timeout
+            poll_mode: "full" fetches all result pages on every poll; "counters" polls progress only and downloads the results once; "incremental" downloads each result once while the crawl runs
+            sink: Optional DocumentSink (JsonlSink, SQLiteSink, ParquetSink) that receives the raw documents as pages are downloaded instead of collecting them; the returned CrawlJob then has empty data
+            poll_scheduler: Optional AdaptivePollScheduler that spaces status checks by the crawl's progress rate instead of poll_interval
+            memory_budget: Approximate bytes of documents to keep in memory; CrawlJob.data is then a SpillingDocumentList storing the rest in a temporary file
             
         Returns:
             CrawlJob when job completes
@@ -302,6 +387,10 @@ class FirecrawlClient:
             poll_interval=poll_interval,
             timeout=timeout,
             request_timeout=request_timeout,
+            poll_mode=poll_mode,
+            sink=sink,
+            poll_scheduler=poll_scheduler,
+            memory_budget=memory_budget,
         )
     
     def start_crawl(
@@ -381,6 +470,7 @@ class FirecrawlClient:
         pagination_config: Optional[PaginationConfig] = None,
         *,
         request_timeout: Optional[float] = None,
+        result_mode: Optional[ResultMode] = None,
     ) -> CrawlJob:
         """
         Get the status of a crawl job.
@@ -391,6 +481,7 @@ class FirecrawlClient:
             request_timeout: Timeout (in seconds) for each individual HTTP request. When auto-pagination 
                 is enabled (default) and there are multiple pages of results, this timeout applies to 
                 each page request separately, not to the entire operation
+            result_mode: Overrides the client's result mode for this call ("dict" and "raw" return plain dicts)
             
         Returns:
             CrawlJob with current status and data
@@ -403,6 +494,42 @@ class FirecrawlClient:
             job_id,
             pagination_config=pagination_config,
             request_timeout=request_timeout,
+            result_mode=result_mode,
+        )
+    
+    def iter_crawl_documents(
+        self,
+        job_id: str,
+        pagination_config: Optional[PaginationConfig] = None,
+        *,
+        request_timeout: Optional[float] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
+    ) -> Iterator[Document]:
+        """
+        Iterate over the documents of a crawl job page by page.
+
+        Memory use is bounded by one result page, so arbitrarily large crawls can be
+        processed without materializing a CrawlJob with every document.
+
+        Args:
+            job_id: ID of the crawl job
+            pagination_config: Optional limits (max_pages, max_results, max_wait_time)
+            request_timeout: Timeout (in seconds) for each page request
+            checkpoint_store: Optional store (e.g. FileCheckpointStore, SQLiteCheckpointStore) that
+                records the position after each consumed page so an interrupted download resumes there
+
+        Returns:
+            Iterator of Document
+
+        Raises:
+            Exception: If the first status request fails
+        """
+        return crawl_module.iter_crawl_documents(
+            self.http_client,
+            job_id,
+            pagination_config=pagination_config,
+            request_timeout=request_timeout,
+            checkpoint_store=checkpoint_store,
         )
     
     def get_crawl_errors(self, crawl_id: str) -> CrawlErrorsResponse:
@@ -563,6 +690,7 @@ class FirecrawlClient:
         timeout: Optional[int] = None,
         integration: Optional[str] = None,
         agent: Optional[AgentOptions] = None,
+        poll_scheduler: Optional[AdaptivePollScheduler] = None,
     ):
         """Extract structured data and wait until completion.
 
@@ -580,6 +708,7 @@ class FirecrawlClient:
             timeout: Maximum seconds to wait (None for no timeout)
             integration: Integration tag/name
             agent: Agent configuration
+            poll_scheduler: Optional AdaptivePollScheduler; status checks back off from its initial interval
         Returns:
             Final extract response when completed
         """
@@ -598,6 +727,7 @@ class FirecrawlClient:
             timeout=timeout,
             integration=integration,
             agent=agent,
+            poll_scheduler=poll_scheduler,
         )
 
     def start_batch_scrape(
@@ -705,13 +835,16 @@ class FirecrawlClient:
     def get_batch_scrape_status(
         self, 
         job_id: str,
-        pagination_config: Optional[PaginationConfig] = None
+        pagination_config: Optional[PaginationConfig] = None,
+        *,
+        result_mode: Optional[ResultMode] = None,
     ):
         """Get current status and any scraped data for a batch job.
 
         Args:
             job_id: Batch job ID
             pagination_config: Optional configuration for pagination behavior
+            result_mode: Overrides the client's result mode for this call ("dict" and "raw" return plain dicts)
 
         Returns:
             Status payload including counts and partial data
@@ -719,7 +852,35 @@ class FirecrawlClient:
         return batch_module.get_batch_scrape_status(
             self.http_client, 
             job_id,
-            pagination_config=pagination_config
+            pagination_config=pagination_config,
+            result_mode=result_mode,
+        )
+
+    def iter_batch_documents(
+        self,
+        job_id: str,
+        pagination_config: Optional[PaginationConfig] = None,
+        *,
+        request_timeout: Optional[float] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
+    ) -> Iterator[Document]:
+        """Iterate over the documents of a batch job page by page.
+
+        Args:
+            job_id: Batch job ID
+            pagination_config: Optional limits (max_pages, max_results, max_wait_time)
+            request_timeout: Timeout (in seconds) for each page request
+            checkpoint_store: Optional store recording the position so an interrupted download resumes there
+
+        Returns:
+            Iterator of Document, holding at most one result page in memory
+        """
+        return batch_module.iter_batch_documents(
+            self.http_client,
+            job_id,
+            pagination_config=pagination_config,
+            request_timeout=request_timeout,
+            checkpoint_store=checkpoint_store,
         )
 
     def cancel_batch_scrape(self, job_id: str) -> bool:
@@ -797,6 +958,7 @@ class FirecrawlClient:
         timeout: Optional[int] = None,
         max_credits: Optional[int] = None,
         strict_constrain_to_urls: Optional[bool] = None,
+        poll_scheduler: Optional[AdaptivePollScheduler] = None,
     ):
         """Run an agent and wait until completion.
 
@@ -808,6 +970,7 @@ class FirecrawlClient:
             poll_interval: Seconds between status checks
             timeout: Maximum seconds to wait (None for no timeout)
             max_credits: Maximum credits to use (optional)
+            poll_scheduler: Optional AdaptivePollScheduler; status checks back off from its initial interval
         Returns:
             Final agent response when completed
         """
@@ -821,6 +984,7 @@ class FirecrawlClient:
             timeout=timeout,
             max_credits=max_credits,
             strict_constrain_to_urls=strict_constrain_to_urls,
+            poll_scheduler=poll_scheduler,
         )
 
     def get_agent_status(self, job_id: str):
@@ -890,6 +1054,68 @@ class FirecrawlClient:
         """
         return Watcher(self, job_id, kind=kind, poll_interval=poll_interval, timeout=timeout)
 
+    @property
+    def job_monitor(self) -> JobMonitor:
+        """Background engine completing the handles returned by the ``submit_*`` methods, created on first use."""
+        with self._job_monitor_lock:
+            if self._job_monitor is None:
+                self._job_monitor = JobMonitor(self)
+            return self._job_monitor
+
+    def _submit(
+        self,
+        job_id: str,
+        kind: Literal["crawl", "batch", "extract", "agent"],
+        timeout: Optional[float],
+        cancel_job: Optional[Callable[[str], bool]],
+    ) -> JobHandle:
+        future = self.job_monitor.watch(job_id, kind=kind, timeout=timeout)
+        return JobHandle(job_id, kind, future, cancel_job)
+
+    def submit_crawl(self, url: str, *, timeout: Optional[float] = None, **kwargs: Any) -> JobHandle:
+        """
+        Start a crawl job and return a handle instead of waiting for it.
+
+        Accepts the same arguments as ``start_crawl``. ``timeout`` bounds the wait in
+        seconds; ``handle.cancel()`` cancels the crawl.
+        """
+        response = self.start_crawl(url, **kwargs)
+        return self._submit(response.id, "crawl", timeout, self.cancel_crawl)
+
+    def submit_batch_scrape(self, urls: List[str], *, wait_timeout: Optional[float] = None, **kwargs: Any) -> JobHandle:
+        """
+        Start a batch scrape job and return a handle instead of waiting for it.
+
+        Accepts the same arguments as ``start_batch_scrape`` (where ``timeout`` is the
+        scrape timeout); ``wait_timeout`` bounds the wait in seconds.
+        """
+        response = self.start_batch_scrape(urls, **kwargs)
+        return self._submit(response.id, "batch", wait_timeout, self.cancel_batch_scrape)
+
+    def submit_extract(self, urls: Optional[List[str]] = None, *, timeout: Optional[float] = None, **kwargs: Any) -> JobHandle:
+        """
+        Start an extract job and return a handle instead of waiting for it.
+
+        Accepts the same arguments as ``start_extract``. Extract jobs cannot be
+        cancelled server-side, so ``handle.cancel()`` only stops tracking.
+        """
+        response = self.start_extract(urls, **kwargs)
+        if not response.id:
+            # Nothing to poll: the start response is final
+            future: "Future[Any]" = Future()
+            future.set_result(response)
+            return JobHandle("", "extract", future)
+        return self._submit(response.id, "extract", timeout, None)
+
+    def submit_agent(self, urls: Optional[List[str]] = None, *, timeout: Optional[float] = None, **kwargs: Any) -> JobHandle:
+        """
+        Start an agent job and return a handle instead of waiting for it.
+
+        Accepts the same arguments as ``start_agent``; ``handle.cancel()`` cancels the agent.
+        """
+        response = self.start_agent(urls, **kwargs)
+        return self._submit(response.id, "agent", timeout, self.cancel_agent)
+
     def batch_scrape(
         self,
         urls: List[str],
@@ -922,9 +1148,19 @@ class FirecrawlClient:
         idempotency_key: Optional[str] = None,
         poll_interval: int = 2,
         wait_timeout: Optional[int] = None,
+        poll_mode: PollMode = "full",
+        sink: Optional[DocumentSink] = None,
+        poll_scheduler: Optional[AdaptivePollScheduler] = None,
+        memory_budget: Optional[int] = None,
     ):
         """
         Start a batch scrape job and wait until completion.
+
+        ``poll_mode`` selects how status is polled while waiting ("full", "counters" or "incremental").
+        With a ``sink`` the raw documents are written to it as pages are downloaded and the
+        returned job has empty data. A ``poll_scheduler`` spaces status checks by the job's
+        progress rate instead of ``poll_interval``. With a ``memory_budget`` (bytes) the
+        returned job's data is a SpillingDocumentList keeping only that much in memory.
         """
         options = ScrapeOptions(
             **{k: v for k, v in dict(
@@ -963,5 +1199,9 @@ class FirecrawlClient:
             idempotency_key=idempotency_key,
             poll_interval=poll_interval,
             timeout=wait_timeout,
+            poll_mode=poll_mode,
+            sink=sink,
+            poll_scheduler=poll_scheduler,
+            memory_budget=memory_budget,
         )
     
\ No newline at end of file
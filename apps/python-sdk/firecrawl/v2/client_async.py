@@ -5,7 +5,7 @@ Async v2 client mirroring the regular client surface using true async HTTP trans
 import os
 import asyncio
 import time
-from typing import Optional, List, Dict, Any, Union, Callable, Literal
+from typing import Optional, List, Dict, Any, AsyncIterator, Union, Callable, Literal
 from .types import (
     ScrapeOptions,
     CrawlRequest,
@@ -15,6 +15,7 @@ from .types import (
     SourceOption,
     CrawlResponse,
     CrawlJob,
+    Document,
     CrawlParamsRequest,
     CrawlParamsData,
     CrawlErrorsResponse,
@@ -33,9 +34,24 @@ from .types import (
     PDFAction,
     Location,
     PaginationConfig,
+    PollMode,
+    ResultMode,
 )
 from .utils.http_client import HttpClient
 from .utils.http_client_async import AsyncHttpClient
+from .utils.retry import RetryBudget, RetryPolicy
+from .utils.rate_limit import RateLimiter
+from .utils.compression import CompressionPolicy
+from .utils.hedging import HedgePolicy
+from .utils.circuit_breaker import CircuitBreaker
+from .utils.transport import Transport
+from .utils.checkpoint import CheckpointStore
+from .utils.sinks import write_status_pages_async
+from .utils.spill import collect_status_documents_async
+from .utils import polling
+from .methods import usage as sync_usage
+from .methods.crawl import crawl_job_from_status
+from .methods.batch import batch_job_from_status
 
 from .methods.aio import scrape as async_scrape  # type: ignore[attr-defined]
 from .methods.aio import batch as async_batch  # type: ignore[attr-defined]
@@ -47,19 +63,102 @@ from .methods.aio import extract as async_extract  # type: ignore[attr-defined]
 from .methods.aio import agent as async_agent  # type: ignore[attr-defined]
 
 from .watcher_async import AsyncWatcher
+from .monitor_async import AsyncJobHandle, AsyncJobMonitor
 
 class AsyncFirecrawlClient:
     @staticmethod
     def _is_cloud_service(url: str) -> bool:
         return "api.firecrawl.dev" in url.lower()
 
-    def __init__(self, api_key: Optional[str] = None, api_url: str = "https://api.firecrawl.dev"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_url: str = "https://api.firecrawl.dev",
+        *,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        compression: Optional[CompressionPolicy] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        transport: Optional[Transport] = None,
+        result_mode: ResultMode = "model",
+    ):
+        """
+        Initialize the async Firecrawl client.
+
+        Args:
+            api_key: Firecrawl API key (or set FIRECRAWL_API_KEY env var)
+            api_url: Base URL for the Firecrawl API
+            max_connections: Maximum number of concurrent connections (None for no limit)
+            max_keepalive_connections: Maximum number of idle connections kept for reuse
+            keepalive_expiry: Seconds an idle connection is kept before being closed
+            http2: Multiplex concurrent requests over HTTP/2 (requires the ``h2`` package)
+            retry_policy: Retry policy (status rules, Retry-After, jitter) for all requests
+            rate_limiter: RateLimiter or AdaptiveConcurrencyLimiter; may be shared with sync clients
+            compression: Compress large request bodies and negotiate compressed responses (off by default)
+            hedge_policy: Duplicate slow status/pagination GETs and keep the first answer (off by default)
+            circuit_breaker: Fail fast per endpoint family while the API is failing; shared by both transports
+            transport: Replace the network transport (``MockTransport``, ``CassetteTransport``) of both
+                the async client and the sync one used for helper calls
+            result_mode: How crawl, batch scrape and search documents are built: ``"model"`` (default),
+                ``"lazy"`` (validated field by field on first access), ``"compact"`` (memory-lean
+                ``CompactDocument`` objects), ``"dict"`` (snake_case dicts) or ``"raw"`` (the API's
+                camelCase dicts)
+        """
         if api_key is None:
             api_key = os.getenv("FIRECRAWL_API_KEY")
         if self._is_cloud_service(api_url) and not api_key:
             raise ValueError("API key is required for the cloud API. Set FIRECRAWL_API_KEY or pass api_key.")
-        self.http_client = HttpClient(api_key, api_url)
-        self.async_http_client = AsyncHttpClient(api_key, api_url)
+        # Both transports draw from one budget so retries stay bounded per client
+        retry_budget = RetryBudget()
+        self.http_client = HttpClient(
+            api_key,
+            api_url,
+            retry_policy=retry_policy,
+            retry_budget=retry_budget,
+            rate_limiter=rate_limiter,
+            compression=compression,
+            hedge_policy=hedge_policy,
+            circuit_breaker=circuit_breaker,
+            transport=transport,
+            result_mode=result_mode,
+        )
+        self.async_http_client = AsyncHttpClient(
+            api_key,
+            api_url,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
+            retry_policy=retry_policy,
+            retry_budget=retry_budget,
+            rate_limiter=rate_limiter,
+            compression=compression,
+            hedge_policy=hedge_policy,
+            circuit_breaker=circuit_breaker,
+            transport=transport,
+            result_mode=result_mode,
+        )
+        if rate_limiter is not None:
+            rate_limiter.set_calibrator(lambda: sync_usage.get_concurrency(self.http_client).max_concurrency)
+        self._job_monitor: Optional[AsyncJobMonitor] = None
+
+    async def close(self) -> None:
+        """Close pooled connections held by this client and stop tracking submitted jobs."""
+        if self._job_monitor is not None:
+            await self._job_monitor.close()
+        await self.async_http_client.close()
+        self.http_client.close()
+
+    async def __aenter__(self) -> "AsyncFirecrawlClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
 
     # Scrape
     async def scrape(
@@ -68,7 +167,10 @@ class AsyncFirecrawlClient:
         **kwargs,
     ):
         options = ScrapeOptions(**{k: v for k, v in kwargs.items() if v is not None}) if kwargs else None
-        return await async_scrape.scrape(self.async_http_client, url, options)
+        document = await async_scrape.scrape(self.async_http_client, url, options)
+        if self.async_http_client.rate_limiter is not None:
+            self.async_http_client.rate_limiter.record_document(document)
+        return document
 
     # Search
     async def search(
@@ -76,8 +178,9 @@ class AsyncFirecrawlClient:
         query: str,
         **kwargs,
     ) -> SearchData:
+        result_mode = kwargs.pop("result_mode", None)
         request = SearchRequest(query=query, **{k: v for k, v in kwargs.items() if v is not None})
-        return await async_search.search(self.async_http_client, request)
+        return await async_search.search(self.async_http_client, request, result_mode=result_mode)
 
     async def start_crawl(self, url: str, **kwargs) -> CrawlResponse:
         request = CrawlRequest(url=url, **kwargs)
@@ -90,6 +193,8 @@ class AsyncFirecrawlClient:
         timeout: Optional[int] = None,
         *,
         request_timeout: Optional[float] = None,
+        poll_mode: PollMode = "full",
+        poll_scheduler: Optional[polling.AdaptivePollScheduler] = None,
     ) -> CrawlJob:
         """
         Polls the status of a crawl job until it reaches a terminal state.
@@ -99,6 +204,8 @@ class AsyncFirecrawlClient:
             poll_interval (int, optional): Number of seconds to wait between polling attempts. Defaults to 2.
             timeout (Optional[int], optional): Maximum number of seconds to wait for the entire crawl job to complete before timing out. If None, waits indefinitely. Defaults to None.
             request_timeout (Optional[float], optional): Timeout (in seconds) for each individual HTTP request, including pagination requests when fetching results. If there are multiple pages, each page request gets this timeout. If None, no per-request timeout is set. Defaults to None.
+            poll_mode (PollMode, optional): "full" fetches all result pages on every poll; "counters" polls progress only and downloads the results once; "incremental" downloads each result once while the crawl runs. Defaults to "full".
+            poll_scheduler (Optional[AdaptivePollScheduler], optional): Spaces status checks by the crawl's progress rate instead of poll_interval. Defaults to None.
 
         Returns:
             CrawlJob: The final status of the crawl job when it reaches a terminal state.
@@ -111,6 +218,25 @@ class AsyncFirecrawlClient:
             - "failed": The crawl finished with an error.
             - "cancelled": The crawl was cancelled.
         """
+        polling.validate_poll_mode(poll_mode)
+        if poll_mode == "counters":
+            await polling.poll_counters_async(
+                self.async_http_client, f"/v2/crawl/{job_id}", "get crawl status",
+                poll_interval, timeout or None, "Crawl wait timed out", request_timeout, poll_scheduler,
+            )
+            return await async_crawl.get_crawl_status(
+                self.async_http_client,
+                job_id,
+                request_timeout=request_timeout,
+            )
+        if poll_mode == "incremental":
+            body, documents = await polling.poll_incremental_async(
+                self.async_http_client, f"/v2/crawl/{job_id}", "get crawl status",
+                poll_interval, timeout or None, "Crawl wait timed out", request_timeout, poll_scheduler,
+            )
+            return crawl_job_from_status(body, documents)
+
+        session = polling.start_session(poll_scheduler)
         start = time.monotonic()
         while True:
             status = await async_crawl.get_crawl_status(
@@ -122,22 +248,49 @@ class AsyncFirecrawlClient:
                 return status
             if timeout and (time.monotonic() - start) > timeout:
                 raise TimeoutError("Crawl wait timed out")
-            await asyncio.sleep(poll_interval)
+            await asyncio.sleep(
+                poll_interval if session is None else session.next_interval(status.completed, status.total)
+            )
 
     async def crawl(self, **kwargs) -> CrawlJob:
         # wrapper combining start and wait
+        sink = kwargs.get("sink")
+        memory_budget = kwargs.get("memory_budget")
+        if sink is not None and memory_budget is not None:
+            raise ValueError("sink and memory_budget cannot be combined")
         resp = await self.start_crawl(
-            **{k: v for k, v in kwargs.items() if k not in ("poll_interval", "timeout", "request_timeout")}
+            **{k: v for k, v in kwargs.items() if k not in ("poll_interval", "timeout", "request_timeout", "poll_mode", "sink", "poll_scheduler", "memory_budget")}
         )
         poll_interval = kwargs.get("poll_interval", 2)
         timeout = kwargs.get("timeout")
         request_timeout = kwargs.get("request_timeout")
         effective_request_timeout = request_timeout if request_timeout is not None else timeout
+        poll_scheduler = kwargs.get("poll_scheduler")
+        if sink is not None or memory_budget is not None:
+            # Documents go to the sink or spilling list page by page instead of into a plain list
+            path = f"/v2/crawl/{resp.id}"
+            body = await polling.poll_counters_async(
+                self.async_http_client, path, "get crawl status",
+                poll_interval, timeout or None, "Crawl wait timed out", effective_request_timeout, poll_scheduler,
+            )
+            if sink is not None:
+                await write_status_pages_async(
+                    self.async_http_client, path, "get crawl status", sink, request_timeout=effective_request_timeout
+                )
+                return crawl_job_from_status(body, [])
+            job = crawl_job_from_status(body, [])
+            job.data = await collect_status_documents_async(
+                self.async_http_client, path, "get crawl status", memory_budget,
+                request_timeout=effective_request_timeout,
+            )
+            return job
         return await self.wait_crawl(
             resp.id,
             poll_interval=poll_interval,
             timeout=timeout,
             request_timeout=effective_request_timeout,
+            poll_mode=kwargs.get("poll_mode", "full"),
+            poll_scheduler=poll_scheduler,
         )
 
     async def get_crawl_status(
@@ -146,6 +299,7 @@ class AsyncFirecrawlClient:
         pagination_config: Optional[PaginationConfig] = None,
         *,
         request_timeout: Optional[float] = None,
+        result_mode: Optional[ResultMode] = None,
     ) -> CrawlJob:
         """
         Get the status of a crawl job.
@@ -156,6 +310,7 @@ class AsyncFirecrawlClient:
             request_timeout: Timeout (in seconds) for each individual HTTP request. When auto-pagination 
                 is enabled (default) and there are multiple pages of results, this timeout applies to 
                 each page request separately, not to the entire operation
+            result_mode: Overrides the client's result mode for this call ("dict" and "raw" return plain dicts)
             
         Returns:
             CrawlJob with current status and data
@@ -168,6 +323,44 @@ class AsyncFirecrawlClient:
             job_id,
             pagination_config=pagination_config,
             request_timeout=request_timeout,
+            result_mode=result_mode,
+        )
+
+    def iter_crawl_documents(
+        self,
+        job_id: str,
+        pagination_config: Optional[PaginationConfig] = None,
+        *,
+        request_timeout: Optional[float] = None,
+        prefetch: int = 1,
+        checkpoint_store: Optional[CheckpointStore] = None,
+    ) -> AsyncIterator[Document]:
+        """
+        Iterate over the documents of a crawl job as result pages arrive.
+
+        Use with ``async for``. For a finished job, up to ``prefetch`` page requests are
+        kept in flight, so downloading later pages overlaps with processing the current
+        one. A running job's pages are followed through ``next`` links one at a time.
+
+        Args:
+            job_id: ID of the crawl job
+            pagination_config: Optional limits (max_pages, max_results, max_wait_time)
+            request_timeout: Timeout (in seconds) for each page request
+            prefetch: Page requests kept in flight for a finished job; for a running job,
+                pages buffered ahead of the consumer
+            checkpoint_store: Optional store recording the position after each consumed page so an
+                interrupted download resumes there
+
+        Returns:
+            Async iterator of Document
+        """
+        return async_crawl.iter_crawl_documents(
+            self.async_http_client,
+            job_id,
+            pagination_config=pagination_config,
+            request_timeout=request_timeout,
+            prefetch=prefetch,
+            checkpoint_store=checkpoint_store,
         )
 
     async def cancel_crawl(self, job_id: str) -> bool:
@@ -211,7 +404,30 @@ class AsyncFirecrawlClient:
     async def start_batch_scrape(self, urls: List[str], **kwargs) -> Any:
         return await async_batch.start_batch_scrape(self.async_http_client, urls, **kwargs)
 
-    async def wait_batch_scrape(self, job_id: str, poll_interval: int = 2, timeout: Optional[int] = None) -> Any:
+    async def wait_batch_scrape(
+        self,
+        job_id: str,
+        poll_interval: int = 2,
+        timeout: Optional[int] = None,
+        *,
+        poll_mode: PollMode = "full",
+        poll_scheduler: Optional[polling.AdaptivePollScheduler] = None,
+    ) -> Any:
+        polling.validate_poll_mode(poll_mode)
+        if poll_mode == "counters":
+            await polling.poll_counters_async(
+                self.async_http_client, f"/v2/batch/scrape/{job_id}", "get batch scrape status",
+                poll_interval, timeout or None, "Batch wait timed out", None, poll_scheduler,
+            )
+            return await async_batch.get_batch_scrape_status(self.async_http_client, job_id)
+        if poll_mode == "incremental":
+            body, documents = await polling.poll_incremental_async(
+                self.async_http_client, f"/v2/batch/scrape/{job_id}", "get batch scrape status",
+                poll_interval, timeout or None, "Batch wait timed out", None, poll_scheduler,
+            )
+            return batch_job_from_status(body, documents)
+
+        session = polling.start_session(poll_scheduler)
         start = asyncio.get_event_loop().time()
         while True:
             status = await async_batch.get_batch_scrape_status(self.async_http_client, job_id)
@@ -219,25 +435,69 @@ class AsyncFirecrawlClient:
                 return status
             if timeout and (asyncio.get_event_loop().time() - start) > timeout:
                 raise TimeoutError("Batch wait timed out")
-            await asyncio.sleep(poll_interval)
+            await asyncio.sleep(
+                poll_interval if session is None else session.next_interval(status.completed, status.total)
+            )
 
     async def batch_scrape(self, urls: List[str], **kwargs) -> Any:
         # waiter wrapper
-        start = await self.start_batch_scrape(urls, **{k: v for k, v in kwargs.items() if k not in ("poll_interval", "timeout")})
+        sink = kwargs.get("sink")
+        memory_budget = kwargs.get("memory_budget")
+        if sink is not None and memory_budget is not None:
+            raise ValueError("sink and memory_budget cannot be combined")
+        start = await self.start_batch_scrape(urls, **{k: v for k, v in kwargs.items() if k not in ("poll_interval", "timeout", "poll_mode", "sink", "poll_scheduler", "memory_budget")})
         job_id = start.id
         poll_interval = kwargs.get("poll_interval", 2)
         timeout = kwargs.get("timeout")
-        return await self.wait_batch_scrape(job_id, poll_interval=poll_interval, timeout=timeout)
+        poll_mode = kwargs.get("poll_mode", "full")
+        poll_scheduler = kwargs.get("poll_scheduler")
+        if sink is not None or memory_budget is not None:
+            path = f"/v2/batch/scrape/{job_id}"
+            body = await polling.poll_counters_async(
+                self.async_http_client, path, "get batch scrape status",
+                poll_interval, timeout or None, "Batch wait timed out", None, poll_scheduler,
+            )
+            if sink is not None:
+                await write_status_pages_async(self.async_http_client, path, "get batch scrape status", sink)
+                return batch_job_from_status(body, [])
+            job = batch_job_from_status(body, [])
+            job.data = await collect_status_documents_async(
+                self.async_http_client, path, "get batch scrape status", memory_budget
+            )
+            return job
+        return await self.wait_batch_scrape(job_id, poll_interval=poll_interval, timeout=timeout, poll_mode=poll_mode, poll_scheduler=poll_scheduler)
+
+    def iter_batch_documents(
+        self,
+        job_id: str,
+        pagination_config: Optional[PaginationConfig] = None,
+        *,
+        request_timeout: Optional[float] = None,
+        prefetch: int = 1,
+        checkpoint_store: Optional[CheckpointStore] = None,
+    ) -> AsyncIterator[Document]:
+        """Iterate over the documents of a batch job as result pages arrive (see iter_crawl_documents)."""
+        return async_batch.iter_batch_documents(
+            self.async_http_client,
+            job_id,
+            pagination_config=pagination_config,
+            request_timeout=request_timeout,
+            prefetch=prefetch,
+            checkpoint_store=checkpoint_store,
+        )
 
     async def get_batch_scrape_status(
         self, 
         job_id: str,
-        pagination_config: Optional[PaginationConfig] = None
+        pagination_config: Optional[PaginationConfig] = None,
+        *,
+        result_mode: Optional[ResultMode] = None,
     ):
         return await async_batch.get_batch_scrape_status(
             self.async_http_client, 
             job_id,
-            pagination_config=pagination_config
+            pagination_config=pagination_config,
+            result_mode=result_mode,
         )
 
     async def cancel_batch_scrape(self, job_id: str) -> bool:
@@ -263,6 +523,7 @@ class AsyncFirecrawlClient:
         poll_interval: int = 2,
         timeout: Optional[int] = None,
         integration: Optional[str] = None,
+        poll_scheduler: Optional[polling.AdaptivePollScheduler] = None,
     ):
         return await async_extract.extract(
             self.async_http_client,
@@ -278,6 +539,7 @@ class AsyncFirecrawlClient:
             poll_interval=poll_interval,
             timeout=timeout,
             integration=integration,
+            poll_scheduler=poll_scheduler,
         )
 
     async def get_extract_status(self, job_id: str):
@@ -323,6 +585,7 @@ class AsyncFirecrawlClient:
         timeout: Optional[int] = None,
         max_credits: Optional[int] = None,
         strict_constrain_to_urls: Optional[bool] = None,
+        poll_scheduler: Optional[polling.AdaptivePollScheduler] = None,
     ):
         return await async_agent.agent(
             self.async_http_client,
@@ -334,6 +597,7 @@ class AsyncFirecrawlClient:
             timeout=timeout,
             max_credits=max_credits,
             strict_constrain_to_urls=strict_constrain_to_urls,
+            poll_scheduler=poll_scheduler,
         )
 
     async def get_agent_status(self, job_id: str):
@@ -406,3 +670,49 @@ class AsyncFirecrawlClient:
     ) -> AsyncWatcher:
         return AsyncWatcher(self, job_id, kind=kind, poll_interval=poll_interval, timeout=timeout)
 
+    @property
+    def job_monitor(self) -> AsyncJobMonitor:
+        """Background engine completing the handles returned by the ``submit_*`` methods, created on first use."""
+        if self._job_monitor is None:
+            self._job_monitor = AsyncJobMonitor(self)
+        return self._job_monitor
+
+    def _submit(
+        self,
+        job_id: str,
+        kind: Literal["crawl", "batch", "extract", "agent"],
+        timeout: Optional[float],
+        cancel_job: Optional[Callable[[str], Any]],
+    ) -> AsyncJobHandle:
+        future = self.job_monitor.watch(job_id, kind=kind, timeout=timeout)
+        return AsyncJobHandle(job_id, kind, future, cancel_job)
+
+    async def submit_crawl(self, url: str, *, timeout: Optional[float] = None, **kwargs) -> AsyncJobHandle:
+        """Start a crawl and return a handle to await instead of waiting; accepts the arguments of ``start_crawl``."""
+        response = await self.start_crawl(url, **kwargs)
+        return self._submit(response.id, "crawl", timeout, self.cancel_crawl)
+
+    async def submit_batch_scrape(self, urls: List[str], *, timeout: Optional[float] = None, **kwargs) -> AsyncJobHandle:
+        """Start a batch scrape and return a handle; accepts the arguments of ``start_batch_scrape``."""
+        response = await self.start_batch_scrape(urls, **kwargs)
+        return self._submit(response.id, "batch", timeout, self.cancel_batch_scrape)
+
+    async def submit_extract(
+        self, urls: Optional[List[str]] = None, *, timeout: Optional[float] = None, **kwargs
+    ) -> AsyncJobHandle:
+        """Start an extract job and return a handle; ``cancel`` only stops tracking it."""
+        response = await self.start_extract(urls, **kwargs)
+        if not response.id:
+            # Nothing to poll: the start response is final
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(response)
+            return AsyncJobHandle("", "extract", future)
+        return self._submit(response.id, "extract", timeout, None)
+
+    async def submit_agent(
+        self, urls: Optional[List[str]] = None, *, timeout: Optional[float] = None, **kwargs
+    ) -> AsyncJobHandle:
+        """Start an agent job and return a handle; ``cancel`` cancels the agent."""
+        response = await self.start_agent(urls, **kwargs)
+        return self._submit(response.id, "agent", timeout, self.cancel_agent)
+
@@ -5,6 +5,9 @@ from ..types import AgentResponse
 from ..utils.http_client import HttpClient
 from ..utils.error_handler import handle_response_error
 from ..utils.validation import _normalize_schema
+from ..utils.json_codec import decode_response
+from ..utils.normalize import normalize_payload_keys
+from ..utils.polling import AdaptivePollScheduler, poll_delay, start_session
 
 
 def _prepare_agent_request(
@@ -38,15 +41,6 @@ def _prepare_agent_request(
     return body
 
 
-def _normalize_agent_response_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
-    out = dict(payload)
-    if "expiresAt" in out and "expires_at" not in out:
-        out["expires_at"] = out["expiresAt"]
-    if "creditsUsed" in out and "credits_used" not in out:
-        out["credits_used"] = out["creditsUsed"]
-    return out
-
-
 def start_agent(
     client: HttpClient,
     urls: Optional[List[str]],
@@ -68,7 +62,7 @@ def start_agent(
     resp = client.post("/v2/agent", body)
     if not resp.ok:
         handle_response_error(resp, "agent")
-    payload = _normalize_agent_response_payload(resp.json())
+    payload = normalize_payload_keys(decode_response(resp))
     return AgentResponse(**payload)
 
 
@@ -76,7 +70,7 @@ def get_agent_status(client: HttpClient, job_id: str) -> AgentResponse:
     resp = client.get(f"/v2/agent/{job_id}")
     if not resp.ok:
         handle_response_error(resp, "agent-status")
-    payload = _normalize_agent_response_payload(resp.json())
+    payload = normalize_payload_keys(decode_response(resp))
     return AgentResponse(**payload)
 
 
@@ -86,15 +80,17 @@ def wait_agent(
     *,
     poll_interval: int = 2,
     timeout: Optional[int] = None,
+    poll_scheduler: Optional[AdaptivePollScheduler] = None,
 ) -> AgentResponse:
     start_ts = time.time()
+    session = start_session(poll_scheduler)
     while True:
         status = get_agent_status(client, job_id)
         if status.status in ("completed", "failed", "cancelled"):
             return status
         if timeout is not None and (time.time() - start_ts) > timeout:
             return status
-        time.sleep(max(1, poll_interval))
+        time.sleep(poll_delay(max(1, poll_interval), session))
 
 
 def agent(
@@ -108,6 +104,7 @@ def agent(
     timeout: Optional[int] = None,
     max_credits: Optional[int] = None,
     strict_constrain_to_urls: Optional[bool] = None,
+    poll_scheduler: Optional[AdaptivePollScheduler] = None,
 ) -> AgentResponse:
     started = start_agent(
         client,
@@ -121,7 +118,9 @@ def agent(
     job_id = getattr(started, "id", None)
     if not job_id:
         return started
-    return wait_agent(client, job_id, poll_interval=poll_interval, timeout=timeout)
+    return wait_agent(
+        client, job_id, poll_interval=poll_interval, timeout=timeout, poll_scheduler=poll_scheduler
+    )
 
 
 def cancel_agent(client: HttpClient, job_id: str) -> bool:
@@ -141,4 +140,4 @@ def cancel_agent(client: HttpClient, job_id: str) -> bool:
     resp = client.delete(f"/v2/agent/{job_id}")
     if not resp.ok:
         handle_response_error(resp, "cancel agent")
-    return resp.json().get("success", False)
+    return decode_response(resp).get("success", False)
@@ -4,6 +4,9 @@ import asyncio
 from ...types import AgentResponse
 from ...utils.http_client_async import AsyncHttpClient
 from ...utils.validation import _normalize_schema
+from ...utils.json_codec import decode_response
+from ...utils.normalize import normalize_payload_keys
+from ...utils.polling import AdaptivePollScheduler, poll_delay, start_session
 
 
 def _prepare_agent_request(
@@ -37,15 +40,6 @@ def _prepare_agent_request(
     return body
 
 
-def _normalize_agent_response_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
-    out = dict(payload)
-    if "expiresAt" in out and "expires_at" not in out:
-        out["expires_at"] = out["expiresAt"]
-    if "creditsUsed" in out and "credits_used" not in out:
-        out["credits_used"] = out["creditsUsed"]
-    return out
-
-
 async def start_agent(
     client: AsyncHttpClient,
     urls: Optional[List[str]],
@@ -65,13 +59,13 @@ async def start_agent(
         strict_constrain_to_urls=strict_constrain_to_urls,
     )
     resp = await client.post("/v2/agent", body)
-    payload = _normalize_agent_response_payload(resp.json())
+    payload = normalize_payload_keys(decode_response(resp))
     return AgentResponse(**payload)
 
 
 async def get_agent_status(client: AsyncHttpClient, job_id: str) -> AgentResponse:
     resp = await client.get(f"/v2/agent/{job_id}")
-    payload = _normalize_agent_response_payload(resp.json())
+    payload = normalize_payload_keys(decode_response(resp))
     return AgentResponse(**payload)
 
 
@@ -81,15 +75,17 @@ async def wait_agent(
     *,
     poll_interval: int = 2,
     timeout: Optional[int] = None,
+    poll_scheduler: Optional[AdaptivePollScheduler] = None,
 ) -> AgentResponse:
     start_ts = asyncio.get_event_loop().time()
+    session = start_session(poll_scheduler)
     while True:
         status = await get_agent_status(client, job_id)
         if status.status in ("completed", "failed", "cancelled"):
             return status
         if timeout is not None and (asyncio.get_event_loop().time() - start_ts) > timeout:
             return status
-        await asyncio.sleep(max(1, poll_interval))
+        await asyncio.sleep(poll_delay(max(1, poll_interval), session))
 
 
 async def agent(
@@ -103,6 +99,7 @@ async def agent(
     timeout: Optional[int] = None,
     max_credits: Optional[int] = None,
     strict_constrain_to_urls: Optional[bool] = None,
+    poll_scheduler: Optional[AdaptivePollScheduler] = None,
 ) -> AgentResponse:
     started = await start_agent(
         client,
@@ -116,7 +113,9 @@ async def agent(
     job_id = getattr(started, "id", None)
     if not job_id:
         return started
-    return await wait_agent(client, job_id, poll_interval=poll_interval, timeout=timeout)
+    return await wait_agent(
+        client, job_id, poll_interval=poll_interval, timeout=timeout, poll_scheduler=poll_scheduler
+    )
 
 
 async def cancel_agent(client: AsyncHttpClient, job_id: str) -> bool:
@@ -134,4 +133,4 @@ async def cancel_agent(client: AsyncHttpClient, job_id: str) -> bool:
         Exception: If the cancellation fails
     """
     resp = await client.delete(f"/v2/agent/{job_id}")
-    return resp.json().get("success", False)
+    return decode_response(resp).get("success", False)
@@ -1,11 +1,14 @@
-from typing import Optional, List, Dict, Any
-from ...types import ScrapeOptions, WebhookConfig, Document, BatchScrapeResponse, BatchScrapeJob, PaginationConfig
+from typing import Optional, List, Dict, Any, AsyncIterator
+from ...types import ScrapeOptions, WebhookConfig, Document, BatchScrapeResponse, BatchScrapeJob, PaginationConfig, ResultMode
 from ...utils.http_client_async import AsyncHttpClient
 from ...utils.validation import prepare_scrape_options
 from ...utils.error_handler import handle_response_error
-from ...utils.normalize import normalize_document_input
+from ...utils.documents import attach_documents, build_documents, client_result_mode
 from ...methods.batch import validate_batch_urls
 import time
+from ...utils.json_codec import decode_response
+from ...utils.pagination import aiter_status_documents, fetch_pages_parallel_async
+from ...utils.checkpoint import CheckpointStore
 
 def _prepare(urls: List[str], *, options: Optional[ScrapeOptions] = None, **kwargs) -> Dict[str, Any]:
     if not urls:
@@ -39,7 +42,7 @@ async def start_batch_scrape(client: AsyncHttpClient, urls: List[str], **kwargs)
     response = await client.post("/v2/batch/scrape", payload)
     if response.status_code >= 400:
         handle_response_error(response, "start batch scrape")
-    body = response.json()
+    body = decode_response(response)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
     return BatchScrapeResponse(id=body.get("id"), url=body.get("url"), invalid_urls=body.get("invalidURLs"))
@@ -48,7 +51,9 @@ async def start_batch_scrape(client: AsyncHttpClient, urls: List[str], **kwargs)
 async def get_batch_scrape_status(
     client: AsyncHttpClient, 
     job_id: str,
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    result_mode: Optional[ResultMode] = None,
 ) -> BatchScrapeJob:
     """
     Get the status of a batch scrape job.
@@ -57,6 +62,8 @@ async def get_batch_scrape_status(
         client: Async HTTP client instance
         job_id: ID of the batch scrape job
         pagination_config: Optional configuration for pagination behavior
+        result_mode: Overrides the client's result mode; "dict" and "raw" return the
+            documents as plain dicts
         
     Returns:
         BatchScrapeJob containing job status and data
@@ -67,33 +74,68 @@ async def get_batch_scrape_status(
     response = await client.get(f"/v2/batch/scrape/{job_id}")
     if response.status_code >= 400:
         handle_response_error(response, "get batch scrape status")
-    body = response.json()
+    body = decode_response(response)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
-    docs: List[Document] = []
-    for doc in body.get("data", []) or []:
-        if isinstance(doc, dict):
-            normalized = normalize_document_input(doc)
-            docs.append(Document(**normalized))
+    mode = client_result_mode(client, result_mode)
+    docs: List[Document] = build_documents(body.get("data"), mode)
     
     # Handle pagination if requested
     auto_paginate = pagination_config.auto_paginate if pagination_config else True
     if auto_paginate and body.get("next"):
-        docs = await _fetch_all_batch_pages_async(
+        parallel = await fetch_pages_parallel_async(client, body, docs, pagination_config, result_mode=mode)
+        docs = parallel if parallel is not None else await _fetch_all_batch_pages_async(
             client, 
             body.get("next"), 
             docs, 
-            pagination_config
+            pagination_config,
+            result_mode=mode,
         )
     
-    return BatchScrapeJob(
+    job = BatchScrapeJob(
         status=body.get("status"),
         completed=body.get("completed", 0),
         total=body.get("total", 0),
         credits_used=body.get("creditsUsed"),
         expires_at=body.get("expiresAt"),
         next=body.get("next") if not auto_paginate else None,
-        data=docs,
+    )
+    return attach_documents(job, docs)
+
+
+def iter_batch_documents(
+    client: AsyncHttpClient,
+    job_id: str,
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    request_timeout: Optional[float] = None,
+    prefetch: int = 1,
+    checkpoint_store: Optional[CheckpointStore] = None,
+) -> AsyncIterator[Document]:
+    """
+    Asynchronously iterate over the documents of a batch scrape job as pages arrive.
+
+    Args:
+        client: Async HTTP client instance
+        job_id: ID of the batch scrape job
+        pagination_config: Optional configuration for pagination limits
+        request_timeout: Timeout (in seconds) for each page request
+        prefetch: Page requests kept in flight for a finished job; for a running job,
+            pages buffered ahead of the consumer
+        checkpoint_store: Optional store for resuming the download, keyed by job id
+
+    Returns:
+        Async iterator of Document
+    """
+    return aiter_status_documents(
+        client,
+        f"/v2/batch/scrape/{job_id}",
+        "get batch scrape status",
+        pagination_config,
+        request_timeout=request_timeout,
+        prefetch=prefetch,
+        checkpoint_store=checkpoint_store,
+        checkpoint_key=job_id,
     )
 
 
@@ -101,7 +143,9 @@ async def _fetch_all_batch_pages_async(
     client: AsyncHttpClient,
     next_url: str,
     initial_documents: List[Document],
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    result_mode: Optional[ResultMode] = None,
 ) -> List[Document]:
     """
     Fetch all pages of batch scrape results asynchronously.
@@ -111,6 +155,7 @@ async def _fetch_all_batch_pages_async(
         next_url: URL for the next page
         initial_documents: Documents from the first page
         pagination_config: Optional configuration for pagination limits
+        result_mode: Overrides the client's result mode
         
     Returns:
         List of all documents from all pages
@@ -125,6 +170,7 @@ async def _fetch_all_batch_pages_async(
     max_wait_time = pagination_config.max_wait_time if pagination_config else None
     
     start_time = time.monotonic()
+    mode = client_result_mode(client, result_mode)
     
     while current_url:
         # Check pagination limits
@@ -144,19 +190,14 @@ async def _fetch_all_batch_pages_async(
             logger.warning(f"Failed to fetch next page: {response.status_code}")
             break
         
-        page_data = response.json()
+        page_data = decode_response(response)
         
         if not page_data.get("success"):
             break
         
-        # Add documents from this page
-        for doc in page_data.get("data", []) or []:
-            if isinstance(doc, dict):
-                # Check max_results limit
-                if (max_results is not None) and (len(documents) >= max_results):
-                    break
-                normalized = normalize_document_input(doc)
-                documents.append(Document(**normalized))
+        # Add documents from this page, up to the max_results limit
+        remaining = None if max_results is None else max_results - len(documents)
+        documents.extend(build_documents(page_data.get("data"), mode, limit=remaining))
         
         # Check if we hit max_results limit
         if (max_results is not None) and (len(documents) >= max_results):
@@ -173,7 +214,7 @@ async def cancel_batch_scrape(client: AsyncHttpClient, job_id: str) -> bool:
     response = await client.delete(f"/v2/batch/scrape/{job_id}")
     if response.status_code >= 400:
         handle_response_error(response, "cancel batch scrape")
-    body = response.json()
+    body = decode_response(response)
     return body.get("status") == "cancelled"
 
 
@@ -181,7 +222,7 @@ async def get_batch_scrape_errors(client: AsyncHttpClient, job_id: str) -> Dict[
     response = await client.get(f"/v2/batch/scrape/{job_id}/errors")
     if response.status_code >= 400:
         handle_response_error(response, "get batch scrape errors")
-    body = response.json()
+    body = decode_response(response)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
     return body
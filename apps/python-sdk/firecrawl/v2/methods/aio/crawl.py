@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, AsyncIterator, List
 from ...types import (
     CrawlRequest,
     CrawlJob,
@@ -11,12 +11,16 @@ from ...types import (
     ActiveCrawlsResponse,
     ActiveCrawl,
     PaginationConfig,
+    ResultMode,
 )
 from ...utils.error_handler import handle_response_error
 from ...utils.validation import prepare_scrape_options
 from ...utils.http_client_async import AsyncHttpClient
-from ...utils.normalize import normalize_document_input
+from ...utils.documents import attach_documents, build_documents, client_result_mode
 import time
+from ...utils.json_codec import decode_response
+from ...utils.pagination import aiter_status_documents, fetch_pages_parallel_async
+from ...utils.checkpoint import CheckpointStore
 
 
 def _prepare_crawl_request(request: CrawlRequest) -> dict:
@@ -80,7 +84,7 @@ async def start_crawl(client: AsyncHttpClient, request: CrawlRequest) -> CrawlRe
     response = await client.post("/v2/crawl", payload)
     if response.status_code >= 400:
         handle_response_error(response, "start crawl")
-    body = response.json()
+    body = decode_response(response)
     if body.get("success"):
         return CrawlResponse(id=body.get("id"), url=body.get("url"))
     raise Exception(body.get("error", "Unknown error occurred"))
@@ -92,6 +96,7 @@ async def get_crawl_status(
     pagination_config: Optional[PaginationConfig] = None,
     *,
     request_timeout: Optional[float] = None,
+    result_mode: Optional[ResultMode] = None,
 ) -> CrawlJob:
     """
     Get the status of a crawl job.
@@ -103,6 +108,8 @@ async def get_crawl_status(
         request_timeout: Timeout (in seconds) for each individual HTTP request. When auto-pagination 
             is enabled (default) and there are multiple pages of results, this timeout applies to 
             each page request separately, not to the entire operation
+        result_mode: Overrides the client's result mode; "dict" and "raw" return the
+            documents as plain dicts
         
     Returns:
         CrawlJob with job information
@@ -113,37 +120,79 @@ async def get_crawl_status(
     response = await client.get(f"/v2/crawl/{job_id}", timeout=request_timeout)
     if response.status_code >= 400:
         handle_response_error(response, "get crawl status")
-    body = response.json()
+    body = decode_response(response)
     if body.get("success"):
-        documents = []
-        for doc_data in body.get("data", []):
-            if isinstance(doc_data, dict):
-                normalized = normalize_document_input(doc_data)
-                documents.append(Document(**normalized))
+        mode = client_result_mode(client, result_mode)
+        documents = build_documents(body.get("data", []), mode)
         
         # Handle pagination if requested
         auto_paginate = pagination_config.auto_paginate if pagination_config else True
         if auto_paginate and body.get("next"):
-            documents = await _fetch_all_pages_async(
+            parallel = await fetch_pages_parallel_async(
+                client,
+                body,
+                documents,
+                pagination_config,
+                request_timeout=request_timeout,
+                result_mode=mode,
+            )
+            documents = parallel if parallel is not None else await _fetch_all_pages_async(
                 client,
                 body.get("next"),
                 documents,
                 pagination_config,
                 request_timeout=request_timeout,
+                result_mode=mode,
             )
         
-        return CrawlJob(
+        job = CrawlJob(
             status=body.get("status"),
             completed=body.get("completed", 0),
             total=body.get("total", 0),
             credits_used=body.get("creditsUsed", 0),
             expires_at=body.get("expiresAt"),
             next=body.get("next") if not auto_paginate else None,
-            data=documents,
         )
+        return attach_documents(job, documents)
     raise Exception(body.get("error", "Unknown error occurred"))
 
 
+def iter_crawl_documents(
+    client: AsyncHttpClient,
+    job_id: str,
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    request_timeout: Optional[float] = None,
+    prefetch: int = 1,
+    checkpoint_store: Optional[CheckpointStore] = None,
+) -> AsyncIterator[Document]:
+    """
+    Asynchronously iterate over the documents of a crawl job as pages arrive.
+
+    Args:
+        client: Async HTTP client instance
+        job_id: ID of the crawl job
+        pagination_config: Optional configuration for pagination limits
+        request_timeout: Timeout (in seconds) for each page request
+        prefetch: Page requests kept in flight for a finished job; for a running job,
+            pages buffered ahead of the consumer
+        checkpoint_store: Optional store for resuming the download, keyed by job id
+
+    Returns:
+        Async iterator of Document
+    """
+    return aiter_status_documents(
+        client,
+        f"/v2/crawl/{job_id}",
+        "get crawl status",
+        pagination_config,
+        request_timeout=request_timeout,
+        prefetch=prefetch,
+        checkpoint_store=checkpoint_store,
+        checkpoint_key=job_id,
+    )
+
+
 async def _fetch_all_pages_async(
     client: AsyncHttpClient,
     next_url: str,
@@ -151,6 +200,7 @@ async def _fetch_all_pages_async(
     pagination_config: Optional[PaginationConfig] = None,
     *,
     request_timeout: Optional[float] = None,
+    result_mode: Optional[ResultMode] = None,
 ) -> List[Document]:
     """
     Fetch all pages of crawl results asynchronously.
@@ -161,6 +211,7 @@ async def _fetch_all_pages_async(
         initial_documents: Documents from the first page
         pagination_config: Optional configuration for pagination limits
         request_timeout: Optional timeout (in seconds) for the underlying HTTP request
+        result_mode: Overrides the client's result mode
         
     Returns:
         List of all documents from all pages
@@ -175,6 +226,7 @@ async def _fetch_all_pages_async(
     max_wait_time = pagination_config.max_wait_time if pagination_config else None
     
     start_time = time.monotonic()
+    mode = client_result_mode(client, result_mode)
     
     while current_url:
         # Check pagination limits (treat 0 as a valid limit)
@@ -194,19 +246,14 @@ async def _fetch_all_pages_async(
             logger.warning("Failed to fetch next page", extra={"status_code": response.status_code})
             break
         
-        page_data = response.json()
+        page_data = decode_response(response)
         
         if not page_data.get("success"):
             break
         
-        # Add documents from this page
-        for doc_data in page_data.get("data", []):
-            if isinstance(doc_data, dict):
-                # Check max_results limit
-                if (max_results is not None) and (len(documents) >= max_results):
-                    break
-                normalized = normalize_document_input(doc_data)
-                documents.append(Document(**normalized))
+        # Add documents from this page, up to the max_results limit
+        remaining = None if max_results is None else max_results - len(documents)
+        documents.extend(build_documents(page_data.get("data", []), mode, limit=remaining))
         
         # Check if we hit max_results limit
         if (max_results is not None) and (len(documents) >= max_results):
@@ -236,7 +283,7 @@ async def cancel_crawl(client: AsyncHttpClient, job_id: str) -> bool:
     response = await client.delete(f"/v2/crawl/{job_id}")
     if response.status_code >= 400:
         handle_response_error(response, "cancel crawl")
-    body = response.json()
+    body = decode_response(response)
     return body.get("status") == "cancelled"
 
 
@@ -263,7 +310,7 @@ async def crawl_params_preview(client: AsyncHttpClient, request: CrawlParamsRequ
     response = await client.post("/v2/crawl/params-preview", payload)
     if response.status_code >= 400:
         handle_response_error(response, "crawl params preview")
-    body = response.json()
+    body = decode_response(response)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
     params_data = body.get("data", {})
@@ -309,7 +356,7 @@ async def get_crawl_errors(client: AsyncHttpClient, crawl_id: str) -> CrawlError
     response = await client.get(f"/v2/crawl/{crawl_id}/errors")
     if response.status_code >= 400:
         handle_response_error(response, "check crawl errors")
-    body = response.json()
+    body = decode_response(response)
     payload = body.get("data", body)
     normalized = {
         "errors": payload.get("errors", []),
@@ -334,7 +381,7 @@ async def get_active_crawls(client: AsyncHttpClient) -> ActiveCrawlsResponse:
     response = await client.get("/v2/crawl/active")
     if response.status_code >= 400:
         handle_response_error(response, "get active crawls")
-    body = response.json()
+    body = decode_response(response)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
     crawls_in = body.get("crawls", [])
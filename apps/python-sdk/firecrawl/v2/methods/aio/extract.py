@@ -4,6 +4,9 @@ import asyncio
 from ...types import ExtractResponse, ScrapeOptions
 from ...utils.http_client_async import AsyncHttpClient
 from ...utils.validation import prepare_scrape_options
+from ...utils.json_codec import decode_response
+from ...utils.normalize import normalize_payload_keys
+from ...utils.polling import AdaptivePollScheduler, poll_delay, start_session
 
 
 def _prepare_extract_request(
@@ -72,12 +75,12 @@ async def start_extract(
         integration=integration,
     )
     resp = await client.post("/v2/extract", body)
-    return ExtractResponse(**resp.json())
+    return ExtractResponse(**normalize_payload_keys(decode_response(resp)))
 
 
 async def get_extract_status(client: AsyncHttpClient, job_id: str) -> ExtractResponse:
     resp = await client.get(f"/v2/extract/{job_id}")
-    return ExtractResponse(**resp.json())
+    return ExtractResponse(**normalize_payload_keys(decode_response(resp)))
 
 
 async def wait_extract(
@@ -86,15 +89,17 @@ async def wait_extract(
     *,
     poll_interval: int = 2,
     timeout: Optional[int] = None,
+    poll_scheduler: Optional[AdaptivePollScheduler] = None,
 ) -> ExtractResponse:
     start_ts = asyncio.get_event_loop().time()
+    session = start_session(poll_scheduler)
     while True:
         status = await get_extract_status(client, job_id)
         if status.status in ("completed", "failed", "cancelled"):
             return status
         if timeout is not None and (asyncio.get_event_loop().time() - start_ts) > timeout:
             return status
-        await asyncio.sleep(max(1, poll_interval))
+        await asyncio.sleep(poll_delay(max(1, poll_interval), session))
 
 
 async def extract(
@@ -112,6 +117,7 @@ async def extract(
     poll_interval: int = 2,
     timeout: Optional[int] = None,
     integration: Optional[str] = None,
+    poll_scheduler: Optional[AdaptivePollScheduler] = None,
 ) -> ExtractResponse:
     started = await start_extract(
         client,
@@ -129,5 +135,7 @@ async def extract(
     job_id = getattr(started, "id", None)
     if not job_id:
         return started
-    return await wait_extract(client, job_id, poll_interval=poll_interval, timeout=timeout)
+    return await wait_extract(
+        client, job_id, poll_interval=poll_interval, timeout=timeout, poll_scheduler=poll_scheduler
+    )
 
@@ -2,6 +2,7 @@ from typing import Optional, Dict, Any
 from ...types import MapOptions, MapData, LinkResult
 from ...utils.http_client_async import AsyncHttpClient
 from ...utils.error_handler import handle_response_error
+from ...utils.json_codec import decode_response
 
 
 def _prepare_map_request(url: str, options: Optional[MapOptions] = None) -> Dict[str, Any]:
@@ -35,7 +36,7 @@ async def map(client: AsyncHttpClient, url: str, options: Optional[MapOptions] =
     response = await client.post("/v2/map", request_data)
     if response.status_code >= 400:
         handle_response_error(response, "map")
-    body = response.json()
+    body = decode_response(response)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
     
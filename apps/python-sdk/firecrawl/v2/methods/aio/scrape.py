@@ -1,9 +1,10 @@
 from typing import Optional, Dict, Any
 from ...types import ScrapeOptions, Document
-from ...utils.normalize import normalize_document_input
+from ...utils.documents import build_document
 from ...utils.error_handler import handle_response_error
 from ...utils.validation import prepare_scrape_options, validate_scrape_options
 from ...utils.http_client_async import AsyncHttpClient
+from ...utils.json_codec import decode_response
 
 
 async def _prepare_scrape_request(url: str, options: Optional[ScrapeOptions] = None) -> Dict[str, Any]:
@@ -24,10 +25,9 @@ async def scrape(client: AsyncHttpClient, url: str, options: Optional[ScrapeOpti
     response = await client.post("/v2/scrape", payload)
     if response.status_code >= 400:
         handle_response_error(response, "scrape")
-    body = response.json()
+    body = decode_response(response)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
     document_data = body.get("data", {})
-    normalized = normalize_document_input(document_data)
-    return Document(**normalized)
+    return build_document(document_data)
 
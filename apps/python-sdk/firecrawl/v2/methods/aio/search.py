@@ -1,5 +1,5 @@
 import re
-from typing import Dict, Any, Union, List, TypeVar, Type
+from typing import Dict, Any, Optional, Union, List, TypeVar, Type
 from ...types import (
     SearchRequest,
     SearchData,
@@ -7,17 +7,25 @@ from ...types import (
     SearchResultWeb,
     SearchResultNews,
     SearchResultImages,
+    ResultMode,
 )
 from ...utils.http_client_async import AsyncHttpClient
 from ...utils.error_handler import handle_response_error
-from ...utils.normalize import normalize_document_input
+from ...utils.documents import DICT_MODES, build_documents, client_result_mode
+from ...utils.normalize import _map_search_result_keys
 from ...utils.validation import validate_scrape_options, prepare_scrape_options
+from ...utils.json_codec import decode_response
 
 T = TypeVar("T")
 
+# Key table name of each search result type
+_RESULT_TYPE_NAMES = {SearchResultWeb: "web", SearchResultNews: "news", SearchResultImages: "images"}
+
 async def search(
     client: AsyncHttpClient,
-    request: SearchRequest
+    request: SearchRequest,
+    *,
+    result_mode: Optional[ResultMode] = None,
 ) -> SearchData:
     """
     Async search for documents.
@@ -25,6 +33,8 @@ async def search(
     Args:
         client: Async HTTP client instance
         request: Search request
+        result_mode: Overrides the client's result mode; "dict" and "raw" return the
+            results as plain dicts
 
     Returns:
         SearchData with search results grouped by source type
@@ -37,24 +47,25 @@ async def search(
         response = await client.post("/v2/search", request_data)
         if response.status_code != 200:
             handle_response_error(response, "search")
-        response_data = response.json()
+        response_data = decode_response(response)
         if not response_data.get("success"):
             handle_response_error(response, "search")
         data = response_data.get("data", {}) or {}
+        mode = client_result_mode(client, result_mode)
         out = SearchData()
         if "web" in data:
-            out.web = _transform_array(data["web"], SearchResultWeb)
+            out.web = _transform_array(data["web"], SearchResultWeb, mode)
         if "news" in data:
-            out.news = _transform_array(data["news"], SearchResultNews)
+            out.news = _transform_array(data["news"], SearchResultNews, mode)
         if "images" in data:
-            out.images = _transform_array(data["images"], SearchResultImages)
+            out.images = _transform_array(data["images"], SearchResultImages, mode)
         return out
     except Exception as err:
         if hasattr(err, "response"):
             handle_response_error(getattr(err, "response"), "search")
         raise err
 
-def _transform_array(arr: List[Any], result_type: Type[T]) -> List[Union[T, Document]]:
+def _transform_array(arr: List[Any], result_type: Type[T], mode: ResultMode = "model") -> List[Union[T, Document]]:
     """
     Transforms an array of items into a list of result_type or Document.
     If the item dict contains any of the special keys, it is treated as a Document.
@@ -62,6 +73,9 @@ def _transform_array(arr: List[Any], result_type: Type[T]) -> List[Union[T, Docu
     If the item is not a dict, it is wrapped as result_type with url=item.
     """
     results: List[Union[T, Document]] = []
+    # Documents are validated together once the array has been scanned
+    document_items: List[Dict[str, Any]] = []
+    document_indices: List[int] = []
     for item in arr:
         if item and isinstance(item, dict):
             if (
@@ -74,11 +88,18 @@ def _transform_array(arr: List[Any], result_type: Type[T]) -> List[Union[T, Docu
                 "summary" in item or
                 "json" in item
             ):
-                results.append(Document(**normalize_document_input(item)))
+                document_indices.append(len(results))
+                document_items.append(item)
+                results.append(None)  # type: ignore[arg-type]
+            elif mode == "raw":
+                results.append(item)
             else:
-                results.append(result_type(**item))
+                normalized_item = _map_search_result_keys(item, _RESULT_TYPE_NAMES.get(result_type, ""))
+                results.append(normalized_item if mode == "dict" else result_type(**normalized_item))
         else:
-            results.append(result_type(url=item))
+            results.append({"url": item} if mode in DICT_MODES else result_type(url=item))
+    for index, document in zip(document_indices, build_documents(document_items, mode)):
+        results[index] = document
     return results
 
 def _validate_search_request(request: SearchRequest) -> SearchRequest:
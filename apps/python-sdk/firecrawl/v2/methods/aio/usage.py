@@ -1,13 +1,14 @@
 from ...utils.http_client_async import AsyncHttpClient
 from ...utils.error_handler import handle_response_error
 from ...types import ConcurrencyCheck, CreditUsage, TokenUsage, CreditUsageHistoricalResponse, TokenUsageHistoricalResponse, QueueStatusResponse
+from ...utils.json_codec import decode_response
 
 
 async def get_concurrency(client: AsyncHttpClient) -> ConcurrencyCheck:
     resp = await client.get("/v2/concurrency-check")
     if resp.status_code >= 400:
         handle_response_error(resp, "get concurrency")
-    body = resp.json()
+    body = decode_response(resp)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error"))
     data = body.get("data", body)
@@ -21,7 +22,7 @@ async def get_credit_usage(client: AsyncHttpClient) -> CreditUsage:
     resp = await client.get("/v2/team/credit-usage")
     if resp.status_code >= 400:
         handle_response_error(resp, "get credit usage")
-    body = resp.json()
+    body = decode_response(resp)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error"))
     data = body.get("data", body)
@@ -37,7 +38,7 @@ async def get_token_usage(client: AsyncHttpClient) -> TokenUsage:
     resp = await client.get("/v2/team/token-usage")
     if resp.status_code >= 400:
         handle_response_error(resp, "get token usage")
-    body = resp.json()
+    body = decode_response(resp)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error"))
     data = body.get("data", body)
@@ -53,7 +54,7 @@ async def get_queue_status(client: AsyncHttpClient) -> QueueStatusResponse:
     resp = await client.get("/v2/team/queue-status")
     if resp.status_code >= 400:
         handle_response_error(resp, "get queue status")
-    body = resp.json()
+    body = decode_response(resp)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error"))
     data = body.get("data", body)
@@ -71,7 +72,7 @@ async def get_credit_usage_historical(client: AsyncHttpClient, by_api_key: bool
     resp = await client.get(f"/v2/team/credit-usage/historical{query}")
     if resp.status_code >= 400:
         handle_response_error(resp, "get credit usage historical")
-    body = resp.json()
+    body = decode_response(resp)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error"))
     return CreditUsageHistoricalResponse(**body)
@@ -82,7 +83,7 @@ async def get_token_usage_historical(client: AsyncHttpClient, by_api_key: bool =
     resp = await client.get(f"/v2/team/token-usage/historical{query}")
     if resp.status_code >= 400:
         handle_response_error(resp, "get token usage historical")
-    body = resp.json()
+    body = decode_response(resp)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error"))
     return TokenUsageHistoricalResponse(**body)
@@ -3,7 +3,7 @@ Batch scraping functionality for Firecrawl v2 API.
 """
 
 import time
-from typing import Optional, List, Callable, Dict, Any, Union
+from typing import Optional, List, Callable, Dict, Any, Iterator, Union
 from ..types import (
     BatchScrapeRequest,
     BatchScrapeResponse,
@@ -12,10 +12,19 @@ from ..types import (
     Document,
     WebhookConfig,
     PaginationConfig,
+    PollMode,
+    ResultMode,
 )
 from ..utils import HttpClient, handle_response_error, validate_scrape_options, prepare_scrape_options
-from ..utils.normalize import normalize_document_input
+from ..utils.documents import attach_documents, build_documents, client_result_mode
 from ..types import CrawlErrorsResponse
+from ..utils.json_codec import decode_response
+from ..utils import polling
+from ..utils.polling import AdaptivePollScheduler
+from ..utils.pagination import fetch_pages_parallel, iter_status_documents
+from ..utils.checkpoint import CheckpointStore
+from ..utils.sinks import DocumentSink, write_status_pages
+from ..utils.spill import collect_status_documents
 
 
 def start_batch_scrape(
@@ -66,7 +75,7 @@ def start_batch_scrape(
         handle_response_error(response, "start batch scrape")
     
     # Parse response
-    body = response.json()
+    body = decode_response(response)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
     return BatchScrapeResponse(
@@ -79,7 +88,9 @@ def start_batch_scrape(
 def get_batch_scrape_status(
     client: HttpClient,
     job_id: str,
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    result_mode: Optional[ResultMode] = None,
 ) -> BatchScrapeJob:
     """
     Get the status of a batch scrape job.
@@ -88,6 +99,8 @@ def get_batch_scrape_status(
         client: HTTP client instance
         job_id: ID of the batch scrape job
         pagination_config: Optional configuration for pagination behavior
+        result_mode: Overrides the client's result mode; "dict" and "raw" return the
+            documents as plain dicts
         
     Returns:
         BatchScrapeJob containing job status and data
@@ -103,35 +116,71 @@ def get_batch_scrape_status(
         handle_response_error(response, "get batch scrape status")
     
     # Parse response
-    body = response.json()
+    body = decode_response(response)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
 
     # Convert documents
-    documents: List[Document] = []
-    for doc in body.get("data", []) or []:
-        if isinstance(doc, dict):
-            normalized = normalize_document_input(doc)
-            documents.append(Document(**normalized))
+    mode = client_result_mode(client, result_mode)
+    documents: List[Document] = build_documents(body.get("data"), mode)
 
     # Handle pagination if requested
     auto_paginate = pagination_config.auto_paginate if pagination_config else True
     if auto_paginate and body.get("next"):
-        documents = _fetch_all_batch_pages(
+        parallel = fetch_pages_parallel(client, body, documents, pagination_config, result_mode=mode)
+        documents = parallel if parallel is not None else _fetch_all_batch_pages(
             client, 
             body.get("next"), 
             documents, 
-            pagination_config
+            pagination_config,
+            result_mode=mode,
         )
 
-    return BatchScrapeJob(
+    job = BatchScrapeJob(
         status=body.get("status"),
         completed=body.get("completed", 0),
         total=body.get("total", 0),
         credits_used=body.get("creditsUsed"),
         expires_at=body.get("expiresAt"),
         next=body.get("next") if not auto_paginate else None,
-        data=documents,
+    )
+    return attach_documents(job, documents)
+
+
+def iter_batch_documents(
+    client: HttpClient,
+    job_id: str,
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    request_timeout: Optional[float] = None,
+    checkpoint_store: Optional[CheckpointStore] = None,
+) -> Iterator[Document]:
+    """
+    Iterate over the documents of a batch scrape job, fetching one page at a time.
+
+    Args:
+        client: HTTP client instance
+        job_id: ID of the batch scrape job
+        pagination_config: Optional limits (max_pages, max_results, max_wait_time);
+            auto_paginate=False yields the first page only
+        request_timeout: Timeout (in seconds) for each page request
+        checkpoint_store: Optional store for resuming the download; the position is
+            saved under the job id after each consumed page and a later call resumes from it
+
+    Yields:
+        Document for every scraped URL available so far
+
+    Raises:
+        FirecrawlError: If the first status request fails
+    """
+    return iter_status_documents(
+        client,
+        f"/v2/batch/scrape/{job_id}",
+        "get batch scrape status",
+        pagination_config,
+        request_timeout=request_timeout,
+        checkpoint_store=checkpoint_store,
+        checkpoint_key=job_id,
     )
 
 
@@ -139,7 +188,9 @@ def _fetch_all_batch_pages(
     client: HttpClient,
     next_url: str,
     initial_documents: List[Document],
-    pagination_config: Optional[PaginationConfig] = None
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    result_mode: Optional[ResultMode] = None,
 ) -> List[Document]:
     """
     Fetch all pages of batch scrape results.
@@ -149,6 +200,7 @@ def _fetch_all_batch_pages(
         next_url: URL for the next page
         initial_documents: Documents from the first page
         pagination_config: Optional configuration for pagination limits
+        result_mode: Overrides the client's result mode
         
     Returns:
         List of all documents from all pages
@@ -163,6 +215,7 @@ def _fetch_all_batch_pages(
     max_wait_time = pagination_config.max_wait_time if pagination_config else None
     
     start_time = time.monotonic()
+    mode = client_result_mode(client, result_mode)
     
     while current_url:
         # Check pagination limits (treat 0 as a valid limit)
@@ -182,19 +235,14 @@ def _fetch_all_batch_pages(
             logger.warning("Failed to fetch next page", extra={"status_code": response.status_code})
             break
         
-        page_data = response.json()
+        page_data = decode_response(response)
         
         if not page_data.get("success"):
             break
         
-        # Add documents from this page
-        for doc in page_data.get("data", []) or []:
-            if isinstance(doc, dict):
-                # Check max_results limit
-                if max_results is not None and len(documents) >= max_results:
-                    break
-                normalized = normalize_document_input(doc)
-                documents.append(Document(**normalized))
+        # Add documents from this page, up to the max_results limit
+        remaining = None if max_results is None else max_results - len(documents)
+        documents.extend(build_documents(page_data.get("data"), mode, limit=remaining))
         
         # Check if we hit max_results limit after adding all docs from this page
         if max_results is not None and len(documents) >= max_results:
@@ -232,15 +280,30 @@ def cancel_batch_scrape(
         handle_response_error(response, "cancel batch scrape")
     
     # Parse response
-    body = response.json()
+    body = decode_response(response)
     return body.get("status") == "cancelled"
 
 
+def batch_job_from_status(body: Dict[str, Any], documents: List[Document]) -> BatchScrapeJob:
+    job = BatchScrapeJob(
+        status=body.get("status"),
+        completed=body.get("completed", 0),
+        total=body.get("total", 0),
+        credits_used=body.get("creditsUsed"),
+        expires_at=body.get("expiresAt"),
+        next=None,
+    )
+    return attach_documents(job, documents)
+
+
 def wait_for_batch_completion(
     client: HttpClient,
     job_id: str,
     poll_interval: int = 2,
-    timeout: Optional[int] = None
+    timeout: Optional[int] = None,
+    *,
+    poll_mode: PollMode = "full",
+    poll_scheduler: Optional[AdaptivePollScheduler] = None,
 ) -> BatchScrapeJob:
     """
     Wait for a batch scrape job to complete, polling for status updates.
@@ -250,6 +313,11 @@ def wait_for_batch_completion(
         job_id: ID of the batch scrape job
         poll_interval: Seconds between status checks
         timeout: Maximum seconds to wait (None for no timeout)
+        poll_mode: "full" fetches all result pages on every poll; "counters" polls
+            progress only and downloads the results once the job finished;
+            "incremental" downloads each result once, resuming where the previous poll stopped
+        poll_scheduler: Optional AdaptivePollScheduler choosing the interval between
+            polls from the job's progress; poll_interval is used when omitted
         
     Returns:
         BatchScrapeStatusResponse when job completes
@@ -258,7 +326,23 @@ def wait_for_batch_completion(
         FirecrawlError: If the job fails or timeout is reached
         TimeoutError: If timeout is reached
     """
+    polling.validate_poll_mode(poll_mode)
+    timeout_message = f"Batch scrape job {job_id} did not complete within {timeout} seconds"
+    if poll_mode == "counters":
+        polling.poll_counters(
+            client, f"/v2/batch/scrape/{job_id}", "get batch scrape status",
+            poll_interval, timeout or None, timeout_message, None, poll_scheduler,
+        )
+        return get_batch_scrape_status(client, job_id)
+    if poll_mode == "incremental":
+        body, documents = polling.poll_incremental(
+            client, f"/v2/batch/scrape/{job_id}", "get batch scrape status",
+            poll_interval, timeout or None, timeout_message, None, poll_scheduler,
+        )
+        return batch_job_from_status(body, documents)
+
     start_time = time.monotonic()
+    session = polling.start_session(poll_scheduler)
     
     while True:
         status_job = get_batch_scrape_status(client, job_id)
@@ -269,10 +353,10 @@ def wait_for_batch_completion(
         
         # Check timeout
         if timeout and (time.monotonic() - start_time) > timeout:
-            raise TimeoutError(f"Batch scrape job {job_id} did not complete within {timeout} seconds")
+            raise TimeoutError(timeout_message)
         
         # Wait before next poll
-        time.sleep(poll_interval)
+        time.sleep(polling.poll_delay(poll_interval, session, status_job.completed, status_job.total))
 
 
 def batch_scrape(
@@ -288,7 +372,11 @@ def batch_scrape(
     integration: Optional[str] = None,
     idempotency_key: Optional[str] = None,
     poll_interval: int = 2,
-    timeout: Optional[int] = None
+    timeout: Optional[int] = None,
+    poll_mode: PollMode = "full",
+    sink: Optional[DocumentSink] = None,
+    poll_scheduler: Optional[AdaptivePollScheduler] = None,
+    memory_budget: Optional[int] = None,
 ) -> BatchScrapeJob:
     """
     Start a batch scrape job and wait for it to complete.
@@ -299,6 +387,14 @@ def batch_scrape(
         options: Scraping options
         poll_interval: Seconds between status checks
         timeout: Maximum seconds to wait (None for no timeout)
+        poll_mode: How job status is polled ("full", "counters" or "incremental"),
+            see wait_for_batch_completion
+        sink: Optional DocumentSink receiving the raw documents page by page once the
+            job finished; the returned job then carries no data and poll_mode is ignored
+        poll_scheduler: Optional AdaptivePollScheduler replacing the fixed poll_interval
+        memory_budget: Approximate bytes of documents to keep in memory; the results are
+            downloaded once the job finished into a SpillingDocumentList that stores the
+            rest on disk, and poll_mode is ignored
         
     Returns:
         BatchScrapeStatusResponse when job completes
@@ -307,6 +403,9 @@ def batch_scrape(
         FirecrawlError: If the batch scrape fails to start or complete
         TimeoutError: If timeout is reached
     """
+    if sink is not None and memory_budget is not None:
+        raise ValueError("sink and memory_budget cannot be combined")
+
     # Start the batch scrape
     start = start_batch_scrape(
         client,
@@ -323,9 +422,23 @@ def batch_scrape(
 
     job_id = start.id
 
+    if sink is not None or memory_budget is not None:
+        path = f"/v2/batch/scrape/{job_id}"
+        body = polling.poll_counters(
+            client, path, "get batch scrape status", poll_interval, timeout or None,
+            f"Batch scrape job {job_id} did not complete within {timeout} seconds", None, poll_scheduler,
+        )
+        if sink is not None:
+            write_status_pages(client, path, "get batch scrape status", sink)
+            return batch_job_from_status(body, [])
+        job = batch_job_from_status(body, [])
+        # Assigned after construction so validation does not copy the documents into a list
+        job.data = collect_status_documents(client, path, "get batch scrape status", memory_budget)
+        return job
+
     # Wait for completion
     return wait_for_batch_completion(
-        client, job_id, poll_interval, timeout
+        client, job_id, poll_interval, timeout, poll_mode=poll_mode, poll_scheduler=poll_scheduler
     )
 
 
@@ -490,7 +603,7 @@ def get_batch_scrape_errors(client: HttpClient, job_id: str) -> CrawlErrorsRespo
     if not response.ok:
         handle_response_error(response, "get batch scrape errors")
 
-    body = response.json()
+    body = decode_response(response)
     payload = body.get("data", body)
     normalized = {
         "errors": payload.get("errors", []),
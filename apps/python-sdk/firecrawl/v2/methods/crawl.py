@@ -3,15 +3,22 @@ Crawling functionality for Firecrawl v2 API.
 """
 
 import time
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List
 from ..types import (
     CrawlRequest,
     CrawlJob,
     CrawlResponse, Document, CrawlParamsRequest, CrawlParamsResponse, CrawlParamsData,
-    WebhookConfig, CrawlErrorsResponse, ActiveCrawlsResponse, ActiveCrawl, PaginationConfig
+    WebhookConfig, CrawlErrorsResponse, ActiveCrawlsResponse, ActiveCrawl, PaginationConfig, PollMode, ResultMode
 )
 from ..utils import HttpClient, handle_response_error, validate_scrape_options, prepare_scrape_options
-from ..utils.normalize import normalize_document_input
+from ..utils.documents import attach_documents, build_documents, client_result_mode
+from ..utils.json_codec import decode_response
+from ..utils import polling
+from ..utils.polling import AdaptivePollScheduler
+from ..utils.pagination import fetch_pages_parallel, iter_status_documents
+from ..utils.checkpoint import CheckpointStore
+from ..utils.sinks import DocumentSink, write_status_pages
+from ..utils.spill import collect_status_documents
 
 
 def _validate_crawl_request(request: CrawlRequest) -> None:
@@ -128,7 +135,7 @@ def start_crawl(client: HttpClient, request: CrawlRequest) -> CrawlResponse:
     if not response.ok:
         handle_response_error(response, "start crawl")
     
-    response_data = response.json()
+    response_data = decode_response(response)
     
     if response_data.get("success"):
         job_data = {
@@ -147,6 +154,7 @@ def get_crawl_status(
     pagination_config: Optional[PaginationConfig] = None,
     *,
     request_timeout: Optional[float] = None,
+    result_mode: Optional[ResultMode] = None,
 ) -> CrawlJob:
     """
     Get the status of a crawl job.
@@ -158,6 +166,8 @@ def get_crawl_status(
         request_timeout: Timeout (in seconds) for each individual HTTP request. When auto-pagination 
             is enabled (default) and there are multiple pages of results, this timeout applies to 
             each page request separately, not to the entire operation
+        result_mode: Overrides the client's result mode; "dict" and "raw" return the
+            documents as plain dicts
 
     Returns:
         CrawlJob with current status and data
@@ -173,21 +183,15 @@ def get_crawl_status(
         handle_response_error(response, "get crawl status")
 
     # Parse response
-    response_data = response.json()
+    response_data = decode_response(response)
 
     if response_data.get("success"):
         # The API returns status fields at the top level, not in a data field
 
         # Convert documents
-        documents = []
-        data_list = response_data.get("data", [])
-        for doc_data in data_list:
-            if isinstance(doc_data, str):
-                # Handle case where API returns just URLs - this shouldn't happen for crawl
-                # but we'll handle it gracefully
-                continue
-            else:
-                documents.append(Document(**normalize_document_input(doc_data)))
+        mode = client_result_mode(client, result_mode)
+        # URL strings in data shouldn't happen for crawl but are skipped gracefully
+        documents = build_documents(response_data.get("data", []), mode)
 
         # Handle pagination if requested
         auto_paginate = pagination_config.auto_paginate if pagination_config else True
@@ -196,28 +200,77 @@ def get_crawl_status(
             and pagination_config.max_results is not None
             and len(documents) >= pagination_config.max_results
         ):
-            documents = _fetch_all_pages(
+            parallel = fetch_pages_parallel(
+                client,
+                response_data,
+                documents,
+                pagination_config,
+                request_timeout=request_timeout,
+                result_mode=mode,
+            )
+            documents = parallel if parallel is not None else _fetch_all_pages(
                 client,
                 response_data.get("next"),
                 documents,
                 pagination_config,
                 request_timeout=request_timeout,
+                result_mode=mode,
             )
 
         # Create CrawlJob with current status and data
-        return CrawlJob(
+        job = CrawlJob(
             status=response_data.get("status"),
             completed=response_data.get("completed", 0),
             total=response_data.get("total", 0),
             credits_used=response_data.get("creditsUsed", 0),
             expires_at=response_data.get("expiresAt"),
             next=response_data.get("next", None) if not auto_paginate else None,
-            data=documents
         )
+        return attach_documents(job, documents)
     else:
         raise Exception(response_data.get("error", "Unknown error occurred"))
 
 
+def iter_crawl_documents(
+    client: HttpClient,
+    job_id: str,
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    request_timeout: Optional[float] = None,
+    checkpoint_store: Optional[CheckpointStore] = None,
+) -> Iterator[Document]:
+    """
+    Iterate over the documents of a crawl job, fetching one page at a time.
+
+    Unlike get_crawl_status, documents are not collected into a list, so memory
+    use is bounded by one page regardless of the crawl size.
+
+    Args:
+        client: HTTP client instance
+        job_id: ID of the crawl job
+        pagination_config: Optional limits (max_pages, max_results, max_wait_time);
+            auto_paginate=False yields the first page only
+        request_timeout: Timeout (in seconds) for each page request
+        checkpoint_store: Optional store for resuming the download; the position is
+            saved under the job id after each consumed page and a later call resumes from it
+
+    Yields:
+        Document for every crawled page available so far
+
+    Raises:
+        Exception: If the first status request fails
+    """
+    return iter_status_documents(
+        client,
+        f"/v2/crawl/{job_id}",
+        "get crawl status",
+        pagination_config,
+        request_timeout=request_timeout,
+        checkpoint_store=checkpoint_store,
+        checkpoint_key=job_id,
+    )
+
+
 def _fetch_all_pages(
     client: HttpClient,
     next_url: str,
@@ -225,6 +278,7 @@ def _fetch_all_pages(
     pagination_config: Optional[PaginationConfig] = None,
     *,
     request_timeout: Optional[float] = None,
+    result_mode: Optional[ResultMode] = None,
 ) -> List[Document]:
     """
     Fetch all pages of crawl results.
@@ -235,6 +289,7 @@ def _fetch_all_pages(
         initial_documents: Documents from the first page
         pagination_config: Optional configuration for pagination limits
         request_timeout: Optional timeout (in seconds) for the underlying HTTP request
+        result_mode: Overrides the client's result mode
 
     Returns:
         List of all documents from all pages
@@ -249,6 +304,7 @@ def _fetch_all_pages(
     max_wait_time = pagination_config.max_wait_time if pagination_config else None
 
     start_time = time.monotonic()
+    mode = client_result_mode(client, result_mode)
 
     while current_url:
         # Check pagination limits (treat 0 as a valid limit)
@@ -268,21 +324,14 @@ def _fetch_all_pages(
             logger.warning("Failed to fetch next page", extra={"status_code": response.status_code})
             break
 
-        page_data = response.json()
+        page_data = decode_response(response)
 
         if not page_data.get("success"):
             break
 
-        # Add documents from this page
-        data_list = page_data.get("data", [])
-        for doc_data in data_list:
-            if isinstance(doc_data, str):
-                continue
-            else:
-                # Check max_results limit BEFORE adding each document
-                if max_results is not None and len(documents) >= max_results:
-                    break
-                documents.append(Document(**normalize_document_input(doc_data)))
+        # Add documents from this page, up to the max_results limit
+        remaining = None if max_results is None else max_results - len(documents)
+        documents.extend(build_documents(page_data.get("data", []), mode, limit=remaining))
 
         # Check if we hit max_results limit
         if max_results is not None and len(documents) >= max_results:
@@ -314,10 +363,22 @@ def cancel_crawl(client: HttpClient, job_id: str) -> bool:
     if not response.ok:
         handle_response_error(response, "cancel crawl")
     
-    response_data = response.json()
+    response_data = decode_response(response)
     
     return response_data.get("status") == "cancelled"
 
+def crawl_job_from_status(body: Dict[str, Any], documents: List[Document]) -> CrawlJob:
+    job = CrawlJob(
+        status=body.get("status"),
+        completed=body.get("completed", 0),
+        total=body.get("total", 0),
+        credits_used=body.get("creditsUsed", 0),
+        expires_at=body.get("expiresAt"),
+        next=None,
+    )
+    return attach_documents(job, documents)
+
+
 def wait_for_crawl_completion(
     client: HttpClient,
     job_id: str,
@@ -325,6 +386,8 @@ def wait_for_crawl_completion(
     timeout: Optional[int] = None,
     *,
     request_timeout: Optional[float] = None,
+    poll_mode: PollMode = "full",
+    poll_scheduler: Optional[AdaptivePollScheduler] = None,
 ) -> CrawlJob:
     """
     Wait for a crawl job to complete, polling for status updates.
@@ -335,6 +398,11 @@ def wait_for_crawl_completion(
         poll_interval: Seconds between status checks
         timeout: Maximum seconds to wait (None for no timeout)
         request_timeout: Optional timeout (in seconds) for each status request
+        poll_mode: "full" fetches all result pages on every poll; "counters" polls
+            progress only and downloads the results once the job finished;
+            "incremental" downloads each result once, resuming where the previous poll stopped
+        poll_scheduler: Optional AdaptivePollScheduler choosing the interval between
+            polls from the job's progress; poll_interval is used when omitted
         
     Returns:
         CrawlJob when job completes
@@ -343,7 +411,23 @@ def wait_for_crawl_completion(
         Exception: If the job fails
         TimeoutError: If timeout is reached
     """
+    polling.validate_poll_mode(poll_mode)
+    timeout_message = f"Crawl job {job_id} did not complete within {timeout} seconds"
+    if poll_mode == "counters":
+        polling.poll_counters(
+            client, f"/v2/crawl/{job_id}", "get crawl status",
+            poll_interval, timeout, timeout_message, request_timeout, poll_scheduler,
+        )
+        return get_crawl_status(client, job_id, request_timeout=request_timeout)
+    if poll_mode == "incremental":
+        body, documents = polling.poll_incremental(
+            client, f"/v2/crawl/{job_id}", "get crawl status",
+            poll_interval, timeout, timeout_message, request_timeout, poll_scheduler,
+        )
+        return crawl_job_from_status(body, documents)
+
     start_time = time.monotonic()
+    session = polling.start_session(poll_scheduler)
     
     while True:
         crawl_job = get_crawl_status(
@@ -358,10 +442,10 @@ def wait_for_crawl_completion(
         
         # Check timeout
         if timeout is not None and (time.monotonic() - start_time) > timeout:
-            raise TimeoutError(f"Crawl job {job_id} did not complete within {timeout} seconds")
+            raise TimeoutError(timeout_message)
         
         # Wait before next poll
-        time.sleep(poll_interval)
+        time.sleep(polling.poll_delay(poll_interval, session, crawl_job.completed, crawl_job.total))
 
 
 def crawl(
@@ -371,6 +455,10 @@ def crawl(
     timeout: Optional[int] = None,
     *,
     request_timeout: Optional[float] = None,
+    poll_mode: PollMode = "full",
+    sink: Optional[DocumentSink] = None,
+    poll_scheduler: Optional[AdaptivePollScheduler] = None,
+    memory_budget: Optional[int] = None,
 ) -> CrawlJob:
     """
     Start a crawl job and wait for it to complete.
@@ -382,6 +470,14 @@ def crawl(
         timeout: Maximum seconds to wait for the entire crawl job to complete (None for no timeout)
         request_timeout: Timeout (in seconds) for each individual HTTP request, including pagination 
             requests when fetching results. If there are multiple pages, each page request gets this timeout
+        poll_mode: How job status is polled ("full", "counters" or "incremental"),
+            see wait_for_crawl_completion
+        sink: Optional DocumentSink receiving the raw documents page by page once the
+            crawl finished; the returned CrawlJob then carries no data and poll_mode is ignored
+        poll_scheduler: Optional AdaptivePollScheduler replacing the fixed poll_interval
+        memory_budget: Approximate bytes of documents to keep in memory; the results are
+            downloaded once the crawl finished into a SpillingDocumentList that stores the
+            rest on disk, and poll_mode is ignored
         
     Returns:
         CrawlJob when job completes
@@ -391,6 +487,9 @@ def crawl(
         Exception: If the crawl fails to start or complete
         TimeoutError: If timeout is reached
     """
+    if sink is not None and memory_budget is not None:
+        raise ValueError("sink and memory_budget cannot be combined")
+
     # Start the crawl
     crawl_job = start_crawl(client, request)
     job_id = crawl_job.id
@@ -398,6 +497,23 @@ def crawl(
     # Determine the per-request timeout. If not provided, reuse the overall timeout value.
     effective_request_timeout = request_timeout if request_timeout is not None else timeout
 
+    if sink is not None or memory_budget is not None:
+        path = f"/v2/crawl/{job_id}"
+        body = polling.poll_counters(
+            client, path, "get crawl status", poll_interval, timeout,
+            f"Crawl job {job_id} did not complete within {timeout} seconds", effective_request_timeout,
+            poll_scheduler,
+        )
+        if sink is not None:
+            write_status_pages(client, path, "get crawl status", sink, request_timeout=effective_request_timeout)
+            return crawl_job_from_status(body, [])
+        job = crawl_job_from_status(body, [])
+        # Assigned after construction so validation does not copy the documents into a list
+        job.data = collect_status_documents(
+            client, path, "get crawl status", memory_budget, request_timeout=effective_request_timeout
+        )
+        return job
+
     # Wait for completion
     return wait_for_crawl_completion(
         client,
@@ -405,6 +521,8 @@ def crawl(
         poll_interval,
         timeout,
         request_timeout=effective_request_timeout,
+        poll_mode=poll_mode,
+        poll_scheduler=poll_scheduler,
     )
 
 
@@ -444,7 +562,7 @@ def crawl_params_preview(client: HttpClient, request: CrawlParamsRequest) -> Cra
         handle_response_error(response, "crawl params preview")
     
     # Parse response
-    response_data = response.json()
+    response_data = decode_response(response)
     
     if response_data.get("success"):
         params_data = response_data.get("data", {})
@@ -545,7 +663,7 @@ def get_crawl_errors(http_client: HttpClient, crawl_id: str) -> CrawlErrorsRespo
         handle_response_error(response, "check crawl errors")
 
     try:
-        body = response.json()
+        body = decode_response(response)
         payload = body.get("data", body)
         # Manual key normalization since we avoid Pydantic aliases
         normalized = {
@@ -575,7 +693,7 @@ def get_active_crawls(client: HttpClient) -> ActiveCrawlsResponse:
     if not response.ok:
         handle_response_error(response, "get active crawls")
 
-    body = response.json()
+    body = decode_response(response)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
 
@@ -6,6 +6,9 @@ from ..types import AgentOptions
 from ..utils.http_client import HttpClient
 from ..utils.validation import prepare_scrape_options
 from ..utils.error_handler import handle_response_error
+from ..utils.json_codec import decode_response
+from ..utils.normalize import normalize_payload_keys
+from ..utils.polling import AdaptivePollScheduler, poll_delay, start_session
 
 
 def _prepare_extract_request(
@@ -53,17 +56,6 @@ def _prepare_extract_request(
     return body
 
 
-def _normalize_extract_response_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
-    out = dict(payload)
-    if "expiresAt" in out and "expires_at" not in out:
-        out["expires_at"] = out["expiresAt"]
-    if "creditsUsed" in out and "credits_used" not in out:
-        out["credits_used"] = out["creditsUsed"]
-    if "tokensUsed" in out and "tokens_used" not in out:
-        out["tokens_used"] = out["tokensUsed"]
-    return out
-
-
 def start_extract(
     client: HttpClient,
     urls: Optional[List[str]],
@@ -95,7 +87,7 @@ def start_extract(
     resp = client.post("/v2/extract", body)
     if not resp.ok:
         handle_response_error(resp, "extract")
-    payload = _normalize_extract_response_payload(resp.json())
+    payload = normalize_payload_keys(decode_response(resp))
     return ExtractResponse(**payload)
 
 
@@ -103,7 +95,7 @@ def get_extract_status(client: HttpClient, job_id: str) -> ExtractResponse:
     resp = client.get(f"/v2/extract/{job_id}")
     if not resp.ok:
         handle_response_error(resp, "extract-status")
-    payload = _normalize_extract_response_payload(resp.json())
+    payload = normalize_payload_keys(decode_response(resp))
     return ExtractResponse(**payload)
 
 
@@ -113,15 +105,17 @@ def wait_extract(
     *,
     poll_interval: int = 2,
     timeout: Optional[int] = None,
+    poll_scheduler: Optional[AdaptivePollScheduler] = None,
 ) -> ExtractResponse:
     start_ts = time.time()
+    session = start_session(poll_scheduler)
     while True:
         status = get_extract_status(client, job_id)
         if status.status in ("completed", "failed", "cancelled"):
             return status
         if timeout is not None and (time.time() - start_ts) > timeout:
             return status
-        time.sleep(max(1, poll_interval))
+        time.sleep(poll_delay(max(1, poll_interval), session))
 
 
 def extract(
@@ -140,6 +134,7 @@ def extract(
     timeout: Optional[int] = None,
     integration: Optional[str] = None,
     agent: Optional[AgentOptions] = None,
+    poll_scheduler: Optional[AdaptivePollScheduler] = None,
 ) -> ExtractResponse:
     started = start_extract(
         client,
@@ -158,4 +153,6 @@ def extract(
     job_id = getattr(started, "id", None)
     if not job_id:
         return started
-    return wait_extract(client, job_id, poll_interval=poll_interval, timeout=timeout)
+    return wait_extract(
+        client, job_id, poll_interval=poll_interval, timeout=timeout, poll_scheduler=poll_scheduler
+    )
@@ -5,6 +5,7 @@ Mapping functionality for Firecrawl v2 API.
 from typing import Optional, Dict, Any
 from ..types import MapOptions, MapData, LinkResult
 from ..utils import HttpClient, handle_response_error
+from ..utils.json_codec import decode_response
 
 
 def _prepare_map_request(url: str, options: Optional[MapOptions] = None) -> Dict[str, Any]:
@@ -47,7 +48,7 @@ def map(client: HttpClient, url: str, options: Optional[MapOptions] = None) -> M
     if not response.ok:
         handle_response_error(response, "map")
 
-    body = response.json()
+    body = decode_response(response)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
 
@@ -4,8 +4,9 @@ Scraping functionality for Firecrawl v2 API.
 
 from typing import Optional, Dict, Any
 from ..types import ScrapeOptions, Document
-from ..utils.normalize import normalize_document_input
+from ..utils.documents import build_document
 from ..utils import HttpClient, handle_response_error, prepare_scrape_options, validate_scrape_options
+from ..utils.json_codec import decode_response
 
 
 def _prepare_scrape_request(url: str, options: Optional[ScrapeOptions] = None) -> Dict[str, Any]:
@@ -55,10 +56,9 @@ def scrape(client: HttpClient, url: str, options: Optional[ScrapeOptions] = None
     if not response.ok:
         handle_response_error(response, "scrape")
 
-    body = response.json()
+    body = decode_response(response)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error occurred"))
 
     document_data = body.get("data", {})
-    normalized = normalize_document_input(document_data)
-    return Document(**normalized)
\ No newline at end of file
+    return build_document(document_data)
\ No newline at end of file
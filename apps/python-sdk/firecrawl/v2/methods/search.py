@@ -3,16 +3,20 @@ Search functionality for Firecrawl v2 API.
 """
 
 import re
-from typing import Dict, Any, Union, List, TypeVar, Type
-from ..types import SearchRequest, SearchData, Document, SearchResultWeb, SearchResultNews, SearchResultImages
-from ..utils.normalize import normalize_document_input, _map_search_result_keys
+from typing import Dict, Any, Optional, Union, List, TypeVar, Type
+from ..types import SearchRequest, SearchData, Document, SearchResultWeb, SearchResultNews, SearchResultImages, ResultMode
+from ..utils.normalize import _map_search_result_keys
+from ..utils.documents import DICT_MODES, build_documents, client_result_mode
 from ..utils import HttpClient, handle_response_error, validate_scrape_options, prepare_scrape_options
+from ..utils.json_codec import decode_response
 
 T = TypeVar("T")
 
 def search(
     client: HttpClient,
-    request: SearchRequest
+    request: SearchRequest,
+    *,
+    result_mode: Optional[ResultMode] = None,
 ) -> SearchData:
     """
     Search for documents.
@@ -20,6 +24,8 @@ def search(
     Args:
         client: HTTP client instance
         request: Search request
+        result_mode: Overrides the client's result mode; "dict" and "raw" return the
+            results as plain dicts
         
     Returns:
         SearchData with search results grouped by source type
@@ -32,17 +38,18 @@ def search(
         response = client.post("/v2/search", request_data)
         if response.status_code != 200:
             handle_response_error(response, "search")
-        response_data = response.json()
+        response_data = decode_response(response)
         if not response_data.get("success"):
             handle_response_error(response, "search")
         data = response_data.get("data", {}) or {}
+        mode = client_result_mode(client, result_mode)
         out = SearchData()
         if "web" in data:
-            out.web = _transform_array(data["web"], SearchResultWeb)
+            out.web = _transform_array(data["web"], SearchResultWeb, mode)
         if "news" in data:
-            out.news = _transform_array(data["news"], SearchResultNews)
+            out.news = _transform_array(data["news"], SearchResultNews, mode)
         if "images" in data:
-            out.images = _transform_array(data["images"], SearchResultImages)
+            out.images = _transform_array(data["images"], SearchResultImages, mode)
         return out
     except Exception as err:
         # If the error is an HTTP error from requests, handle it
@@ -51,7 +58,7 @@ def search(
             handle_response_error(getattr(err, "response"), "search")
         raise err
 
-def _transform_array(arr: List[Any], result_type: Type[T]) -> List[Union[T, 'Document']]:
+def _transform_array(arr: List[Any], result_type: Type[T], mode: ResultMode = "model") -> List[Union[T, 'Document']]:
     """
     Transforms an array of items into a list of result_type or Document.
     If the item dict contains any of the special keys, it is treated as a Document.
@@ -59,6 +66,9 @@ def _transform_array(arr: List[Any], result_type: Type[T]) -> List[Union[T, 'Doc
     If the item is not a dict, it is wrapped as result_type with url=item.
     """
     results: List[Union[T, 'Document']] = []
+    # Documents are validated together once the array has been scanned
+    document_items: List[Dict[str, Any]] = []
+    document_indices: List[int] = []
     for item in arr:
         if item and isinstance(item, dict):
             if (
@@ -71,7 +81,9 @@ def _transform_array(arr: List[Any], result_type: Type[T]) -> List[Union[T, 'Doc
                 "summary" in item or
                 "json" in item
             ):
-                results.append(Document(**normalize_document_input(item)))
+                document_indices.append(len(results))
+                document_items.append(item)
+                results.append(None)  # type: ignore[arg-type]
             else:
                 result_type_name = None
                 if result_type == SearchResultImages:
@@ -81,13 +93,17 @@ def _transform_array(arr: List[Any], result_type: Type[T]) -> List[Union[T, 'Doc
                 elif result_type == SearchResultWeb:
                     result_type_name = "web"
 
-                if result_type_name:
+                if mode == "raw":
+                    results.append(item)
+                elif result_type_name:
                     normalized_item = _map_search_result_keys(item, result_type_name)
-                    results.append(result_type(**normalized_item))
+                    results.append(normalized_item if mode == "dict" else result_type(**normalized_item))
                 else:
-                    results.append(result_type(**item))
+                    results.append(item if mode == "dict" else result_type(**item))
         else:
-            results.append(result_type(url=item))
+            results.append({"url": item} if mode in DICT_MODES else result_type(url=item))
+    for index, document in zip(document_indices, build_documents(document_items, mode)):
+        results[index] = document
     return results
 
 def _validate_search_request(request: SearchRequest) -> SearchRequest:
@@ -1,12 +1,13 @@
 from ..utils import HttpClient, handle_response_error
 from ..types import ConcurrencyCheck, CreditUsage, QueueStatusResponse, TokenUsage, CreditUsageHistoricalResponse, TokenUsageHistoricalResponse
+from ..utils.json_codec import decode_response
 
 
 def get_concurrency(client: HttpClient) -> ConcurrencyCheck:
     resp = client.get("/v2/concurrency-check")
     if not resp.ok:
         handle_response_error(resp, "get concurrency")
-    body = resp.json()
+    body = decode_response(resp)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error"))
     data = body.get("data", body)
@@ -20,7 +21,7 @@ def get_credit_usage(client: HttpClient) -> CreditUsage:
     resp = client.get("/v2/team/credit-usage")
     if not resp.ok:
         handle_response_error(resp, "get credit usage")
-    body = resp.json()
+    body = decode_response(resp)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error"))
     data = body.get("data", body)
@@ -36,7 +37,7 @@ def get_token_usage(client: HttpClient) -> TokenUsage:
     resp = client.get("/v2/team/token-usage")
     if not resp.ok:
         handle_response_error(resp, "get token usage")
-    body = resp.json()
+    body = decode_response(resp)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error"))
     data = body.get("data", body)
@@ -51,7 +52,7 @@ def get_queue_status(client: HttpClient) -> QueueStatusResponse:
     resp = client.get("/v2/team/queue-status")
     if not resp.ok:
         handle_response_error(resp, "get queue status")
-    body = resp.json()
+    body = decode_response(resp)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error"))
     data = body.get("data", body)
@@ -68,7 +69,7 @@ def get_credit_usage_historical(client: HttpClient, by_api_key: bool = False) ->
     resp = client.get(f"/v2/team/credit-usage/historical{'?byApiKey=true' if by_api_key else ''}")
     if not resp.ok:
         handle_response_error(resp, "get credit usage historical")
-    body = resp.json()
+    body = decode_response(resp)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error"))
     return CreditUsageHistoricalResponse(**body)
@@ -78,7 +79,7 @@ def get_token_usage_historical(client: HttpClient, by_api_key: bool = False) ->
     resp = client.get(f"/v2/team/token-usage/historical{'?byApiKey=true' if by_api_key else ''}")
     if not resp.ok:
         handle_response_error(resp, "get token usage historical")
-    body = resp.json()
+    body = decode_response(resp)
     if not body.get("success"):
         raise Exception(body.get("error", "Unknown error"))
     return TokenUsageHistoricalResponse(**body)
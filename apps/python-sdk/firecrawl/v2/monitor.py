@@ -0,0 +1,265 @@
+"""
+Shared poller completing futures for many v2 jobs (crawl, batch, extract and agent).
+
+Usage:
+    with JobMonitor(client) as monitor:
+        futures = [monitor.watch(client.start_crawl(url).id, kind="crawl") for url in urls]
+        for future in concurrent.futures.as_completed(futures):
+            print(future.result().status)
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
+
+from .methods import agent as agent_module
+from .methods import batch as batch_module
+from .methods import crawl as crawl_module
+from .methods import extract as extract_module
+from .utils import polling
+from .utils.polling import AdaptivePollScheduler, PollSession
+
+JobKind = Literal["crawl", "batch", "extract", "agent"]
+JOB_KINDS = ("crawl", "batch", "extract", "agent")
+
+# Crawl and batch jobs are polled for counters only; results are downloaded once at the end
+COUNTER_ENDPOINTS = {
+    "crawl": ("/v2/crawl/{}", "get crawl status"),
+    "batch": ("/v2/batch/scrape/{}", "get batch scrape status"),
+}
+
+JobKey = Tuple[str, str]
+
+
+def validate_kind(kind: str) -> None:
+    if kind not in JOB_KINDS:
+        raise ValueError(f"kind must be one of {', '.join(JOB_KINDS)}")
+
+
+def timeout_error(kind: str, job_id: str, timeout: float) -> TimeoutError:
+    return TimeoutError(f"{kind} job {job_id} did not complete within {timeout} seconds")
+
+
+def check_job(
+    http_client: Any, kind: str, job_id: str, request_timeout: Optional[float] = None
+) -> Tuple[Any, Optional[int], Optional[int]]:
+    """One status check: (final job or response once terminal, else None; completed; total)."""
+    if kind in COUNTER_ENDPOINTS:
+        path, action = COUNTER_ENDPOINTS[kind]
+        body = polling.fetch_counters(http_client, path.format(job_id), action, request_timeout)
+        if body.get("status") not in polling.TERMINAL_STATUSES:
+            return None, body.get("completed"), body.get("total")
+        if kind == "crawl":
+            return crawl_module.get_crawl_status(http_client, job_id, request_timeout=request_timeout), None, None
+        return batch_module.get_batch_scrape_status(http_client, job_id), None, None
+    get_status = extract_module.get_extract_status if kind == "extract" else agent_module.get_agent_status
+    status = get_status(http_client, job_id)
+    return (status if status.status in polling.TERMINAL_STATUSES else None), None, None
+
+
+class WatchedJob:
+    __slots__ = ("kind", "job_id", "key", "future", "session", "timeout", "deadline")
+
+    def __init__(self, kind: str, job_id: str, future: Any, session: PollSession, timeout: Optional[float]):
+        self.kind = kind
+        self.job_id = job_id
+        self.key: JobKey = (kind, job_id)
+        self.future = future
+        self.session = session
+        self.timeout = timeout
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+
+
+class JobMonitor:
+    """
+    Polls many jobs from one dispatcher thread and completes a ``Future`` per job.
+
+    The dispatcher keeps a heap of next-poll times and hands due polls to a small
+    thread pool sharing the client's pooled connections, so thousands of jobs need
+    ``max_concurrent_polls`` threads rather than one sleeping thread each. Every job
+    gets its own ``AdaptivePollScheduler`` session, and a job never has more than one
+    poll in flight; watching a job again returns the same future.
+
+    Futures resolve to the same objects as the ``wait_*`` helpers (``CrawlJob``,
+    ``BatchScrapeJob``, ``ExtractResponse``, ``AgentResponse``), including failed and
+    cancelled jobs. Errors raised while polling and per-job timeouts are set as the
+    future's exception. Cancelling a future stops polling its job (the job itself keeps
+    running on the server).
+
+    Args:
+        client: FirecrawlClient whose HTTP client is used for polling
+        scheduler: Poll interval policy (defaults to ``AdaptivePollScheduler()``)
+        max_concurrent_polls: Status requests in flight at once
+        request_timeout: Timeout in seconds for each status request
+    """
+
+    def __init__(
+        self,
+        client: object,
+        *,
+        scheduler: Optional[AdaptivePollScheduler] = None,
+        max_concurrent_polls: int = 16,
+        request_timeout: Optional[float] = None,
+    ) -> None:
+        if max_concurrent_polls < 1:
+            raise ValueError("max_concurrent_polls must be at least 1")
+        self._http_client = getattr(client, "http_client", client)
+        self._scheduler = scheduler or AdaptivePollScheduler()
+        self._request_timeout = request_timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent_polls, thread_name_prefix="firecrawl-monitor")
+        self._cond = threading.Condition()
+        self._heap: List[Tuple[float, int, WatchedJob]] = []
+        self._jobs: Dict[JobKey, WatchedJob] = {}
+        self._seq = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def watch(self, job_id: str, kind: JobKind = "crawl", *, timeout: Optional[float] = None) -> "Future[Any]":
+        """Start tracking a job; the returned future completes when the job reaches a terminal state."""
+        validate_kind(kind)
+        key = (kind, job_id)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("JobMonitor is closed")
+            job = self._jobs.get(key)
+            if job is not None and not job.future.cancelled():
+                return job.future
+            job = WatchedJob(kind, job_id, Future(), self._scheduler.session(), timeout)
+            self._jobs[key] = job
+            self._schedule(job, time.monotonic())
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="firecrawl-monitor", daemon=True)
+                self._thread.start()
+            return job.future
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._jobs)
+
+    def _schedule(self, job: WatchedJob, due: float) -> None:
+        heapq.heappush(self._heap, (due, next(self._seq), job))
+        self._cond.notify()
+
+    def _run(self) -> None:
+        with self._cond:
+            while not self._closed:
+                now = time.monotonic()
+                while self._heap and self._heap[0][0] <= now:
+                    _, _, job = heapq.heappop(self._heap)
+                    if self._jobs.get(job.key) is not job:
+                        continue
+                    if job.future.cancelled():
+                        del self._jobs[job.key]
+                        continue
+                    self._executor.submit(self._poll, job)
+                self._cond.wait(self._heap[0][0] - now if self._heap else None)
+
+    def _poll(self, job: WatchedJob) -> None:
+        try:
+            result, completed, total = check_job(self._http_client, job.kind, job.job_id, self._request_timeout)
+        except Exception as exc:
+            self._finish(job, exception=exc)
+            return
+        if result is not None:
+            self._finish(job, result=result)
+            return
+        now = time.monotonic()
+        if job.deadline is not None and now >= job.deadline:
+            self._finish(job, exception=timeout_error(job.kind, job.job_id, job.timeout))
+            return
+        due = now + job.session.next_interval(completed, total)
+        if job.deadline is not None:
+            due = min(due, job.deadline)
+        with self._cond:
+            if not self._closed and self._jobs.get(job.key) is job:
+                self._schedule(job, due)
+
+    def _finish(self, job: WatchedJob, result: Any = None, exception: Optional[BaseException] = None) -> None:
+        with self._cond:
+            if self._jobs.get(job.key) is job:
+                del self._jobs[job.key]
+        try:
+            if exception is not None:
+                job.future.set_exception(exception)
+            else:
+                job.future.set_result(result)
+        except InvalidStateError:
+            # Cancelled by the caller while the poll was in flight
+            pass
+
+    def close(self) -> None:
+        """Stop polling and cancel the futures of jobs that have not finished."""
+        with self._cond:
+            self._closed = True
+            jobs = list(self._jobs.values())
+            self._jobs.clear()
+            self._heap.clear()
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join()
+        self._executor.shutdown(wait=True)
+        for job in jobs:
+            job.future.cancel()
+
+    def __enter__(self) -> "JobMonitor":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class JobHandle:
+    """
+    Non-blocking handle to a started job, completed in the background by a ``JobMonitor``.
+
+    Returned by the client's ``submit_*`` methods. ``result`` blocks until the job
+    is terminal and returns what the matching ``wait_*`` helper would; ``future``
+    is the underlying ``concurrent.futures.Future`` for use with ``as_completed``
+    and ``wait``.
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        kind: JobKind,
+        future: "Future[Any]",
+        cancel_job: Optional[Callable[[str], bool]] = None,
+    ) -> None:
+        self.id = job_id
+        self.kind = kind
+        self.future = future
+        self._cancel_job = cancel_job
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        return self.future.result(timeout)
+
+    def exception(self, timeout: Optional[float] = None) -> Optional[BaseException]:
+        return self.future.exception(timeout)
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def add_done_callback(self, fn: Callable[["JobHandle"], None]) -> None:
+        """Call ``fn(handle)`` once the job is terminal (immediately if it already is)."""
+        self.future.add_done_callback(lambda _: fn(self))
+
+    def cancel(self) -> bool:
+        """
+        Cancel the job on the server (crawl, batch and agent jobs) and stop tracking it.
+
+        Extract jobs cannot be cancelled server-side; for them this only stops tracking.
+        Returns False if the job had already finished.
+        """
+        if self.future.done():
+            return False
+        cancelled = self._cancel_job(self.id) if self._cancel_job is not None else True
+        self.future.cancel()
+        return cancelled
+
+    def __repr__(self) -> str:
+        state = "done" if self.future.done() else "pending"
+        return f"<JobHandle {self.kind} {self.id} {state}>"
+
@@ -0,0 +1,224 @@
+"""
+Async shared poller completing asyncio futures for many v2 jobs.
+
+Usage:
+    async with AsyncJobMonitor(client) as monitor:
+        futures = [monitor.watch((await client.start_crawl(url=url)).id) for url in urls]
+        jobs = await asyncio.gather(*futures)
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Any, Awaitable, Callable, Dict, Generator, List, Optional, Set, Tuple
+
+from .methods.aio import agent as async_agent  # type: ignore[attr-defined]
+from .methods.aio import batch as async_batch  # type: ignore[attr-defined]
+from .methods.aio import crawl as async_crawl  # type: ignore[attr-defined]
+from .methods.aio import extract as async_extract  # type: ignore[attr-defined]
+from .monitor import COUNTER_ENDPOINTS, JobKey, JobKind, WatchedJob, timeout_error, validate_kind
+from .utils import polling
+from .utils.polling import AdaptivePollScheduler
+
+
+async def check_job_async(
+    http_client: Any, kind: str, job_id: str, request_timeout: Optional[float] = None
+) -> Tuple[Any, Optional[int], Optional[int]]:
+    """Async variant of ``monitor.check_job``."""
+    if kind in COUNTER_ENDPOINTS:
+        path, action = COUNTER_ENDPOINTS[kind]
+        body = await polling.fetch_counters_async(http_client, path.format(job_id), action, request_timeout)
+        if body.get("status") not in polling.TERMINAL_STATUSES:
+            return None, body.get("completed"), body.get("total")
+        if kind == "crawl":
+            job = await async_crawl.get_crawl_status(http_client, job_id, request_timeout=request_timeout)
+            return job, None, None
+        return await async_batch.get_batch_scrape_status(http_client, job_id), None, None
+    get_status = async_extract.get_extract_status if kind == "extract" else async_agent.get_agent_status
+    status = await get_status(http_client, job_id)
+    return (status if status.status in polling.TERMINAL_STATUSES else None), None, None
+
+
+class AsyncJobMonitor:
+    """
+    Polls many jobs from one task on the running event loop and completes an
+    ``asyncio.Future`` per job; the async counterpart of ``JobMonitor``.
+
+    Args:
+        client: AsyncFirecrawlClient whose async HTTP client is used for polling
+        scheduler: Poll interval policy (defaults to ``AdaptivePollScheduler()``)
+        max_concurrent_polls: Status requests in flight at once
+        request_timeout: Timeout in seconds for each status request
+    """
+
+    def __init__(
+        self,
+        client: object,
+        *,
+        scheduler: Optional[AdaptivePollScheduler] = None,
+        max_concurrent_polls: int = 16,
+        request_timeout: Optional[float] = None,
+    ) -> None:
+        if max_concurrent_polls < 1:
+            raise ValueError("max_concurrent_polls must be at least 1")
+        self._http_client = getattr(client, "async_http_client", client)
+        self._scheduler = scheduler or AdaptivePollScheduler()
+        self._max_concurrent_polls = max_concurrent_polls
+        self._request_timeout = request_timeout
+        self._heap: List[Tuple[float, int, WatchedJob]] = []
+        self._jobs: Dict[JobKey, WatchedJob] = {}
+        self._seq = itertools.count()
+        self._polls: Set["asyncio.Task[None]"] = set()
+        self._dispatcher: Optional["asyncio.Task[None]"] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._closed = False
+
+    def watch(self, job_id: str, kind: JobKind = "crawl", *, timeout: Optional[float] = None) -> "asyncio.Future[Any]":
+        """Start tracking a job; must be called from the event loop the monitor runs on."""
+        validate_kind(kind)
+        if self._closed:
+            raise RuntimeError("AsyncJobMonitor is closed")
+        key = (kind, job_id)
+        job = self._jobs.get(key)
+        if job is not None and not job.future.cancelled():
+            return job.future
+        loop = asyncio.get_running_loop()
+        job = WatchedJob(kind, job_id, loop.create_future(), self._scheduler.session(), timeout)
+        self._jobs[key] = job
+        if self._dispatcher is None:
+            self._wake = asyncio.Event()
+            self._semaphore = asyncio.Semaphore(self._max_concurrent_polls)
+            self._dispatcher = loop.create_task(self._run())
+        self._schedule(job, time.monotonic())
+        return job.future
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def _schedule(self, job: WatchedJob, due: float) -> None:
+        heapq.heappush(self._heap, (due, next(self._seq), job))
+        assert self._wake is not None
+        self._wake.set()
+
+    async def _run(self) -> None:
+        assert self._wake is not None
+        while True:
+            now = time.monotonic()
+            while self._heap and self._heap[0][0] <= now:
+                _, _, job = heapq.heappop(self._heap)
+                if self._jobs.get(job.key) is not job:
+                    continue
+                if job.future.cancelled():
+                    del self._jobs[job.key]
+                    continue
+                task = asyncio.ensure_future(self._poll(job))
+                self._polls.add(task)
+                task.add_done_callback(self._polls.discard)
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), self._heap[0][0] - now if self._heap else None)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _poll(self, job: WatchedJob) -> None:
+        assert self._semaphore is not None
+        try:
+            async with self._semaphore:
+                result, completed, total = await check_job_async(
+                    self._http_client, job.kind, job.job_id, self._request_timeout
+                )
+        except Exception as exc:
+            self._finish(job, exception=exc)
+            return
+        if result is not None:
+            self._finish(job, result=result)
+            return
+        now = time.monotonic()
+        if job.deadline is not None and now >= job.deadline:
+            self._finish(job, exception=timeout_error(job.kind, job.job_id, job.timeout))
+            return
+        due = now + job.session.next_interval(completed, total)
+        if job.deadline is not None:
+            due = min(due, job.deadline)
+        if not self._closed and self._jobs.get(job.key) is job:
+            self._schedule(job, due)
+
+    def _finish(self, job: WatchedJob, result: Any = None, exception: Optional[BaseException] = None) -> None:
+        if self._jobs.get(job.key) is job:
+            del self._jobs[job.key]
+        if job.future.done():
+            return
+        if exception is not None:
+            job.future.set_exception(exception)
+        else:
+            job.future.set_result(result)
+
+    async def close(self) -> None:
+        """Stop polling and cancel the futures of jobs that have not finished."""
+        self._closed = True
+        tasks = list(self._polls)
+        if self._dispatcher is not None:
+            tasks.append(self._dispatcher)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for job in self._jobs.values():
+            job.future.cancel()
+        self._jobs.clear()
+        self._heap.clear()
+
+    async def __aenter__(self) -> "AsyncJobMonitor":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+
+class AsyncJobHandle:
+    """
+    Handle to a started job, completed in the background by an ``AsyncJobMonitor``.
+
+    Awaiting the handle (or ``result()``) returns what the matching ``wait_*`` helper
+    would; ``future`` is the underlying ``asyncio.Future``.
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        kind: JobKind,
+        future: "asyncio.Future[Any]",
+        cancel_job: Optional[Callable[[str], Awaitable[bool]]] = None,
+    ) -> None:
+        self.id = job_id
+        self.kind = kind
+        self.future = future
+        self._cancel_job = cancel_job
+
+    async def result(self, timeout: Optional[float] = None) -> Any:
+        # Shielded so a timed-out wait leaves the job tracked
+        return await asyncio.wait_for(asyncio.shield(self.future), timeout)
+
+    def __await__(self) -> Generator[Any, None, Any]:
+        return self.future.__await__()
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def add_done_callback(self, fn: Callable[["AsyncJobHandle"], None]) -> None:
+        """Call ``fn(handle)`` on the event loop once the job is terminal."""
+        self.future.add_done_callback(lambda _: fn(self))
+
+    async def cancel(self) -> bool:
+        """Async variant of ``JobHandle.cancel``."""
+        if self.future.done():
+            return False
+        cancelled = await self._cancel_job(self.id) if self._cancel_job is not None else True
+        self.future.cancel()
+        return cancelled
+
+    def __repr__(self) -> str:
+        state = "done" if self.future.done() else "pending"
+        return f"<AsyncJobHandle {self.kind} {self.id} {state}>"
+
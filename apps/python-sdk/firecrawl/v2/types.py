@@ -6,11 +6,14 @@ This module contains clean, modern type definitions for the v2 API.
 
 import warnings
 from datetime import datetime
-from typing import Any, Dict, Generic, List, Literal, Optional, TypeVar, Union
+from typing import Any, Dict, Generic, Iterable, List, Literal, Optional, TypeVar, Union
 import logging
+from typing_extensions import Annotated
 from pydantic import (
     BaseModel,
     Field,
+    SerializerFunctionWrapHandler,
+    WrapSerializer,
     field_validator,
     ValidationError,
     model_serializer,
@@ -57,6 +60,52 @@ class BaseResponse(BaseModel, Generic[T]):
 
 
 # Document and content types
+
+# Single-string metadata fields the API may send as lists
+_METADATA_STRING_KEYS = frozenset(
+    (
+        "title",
+        "description",
+        "url",
+        "language",
+        "robots",
+        "og_title",
+        "og_description",
+        "og_url",
+        "og_image",
+        "og_audio",
+        "og_determiner",
+        "og_locale",
+        "og_site_name",
+        "og_video",
+        "favicon",
+        "dc_terms_created",
+        "dc_date_created",
+        "dc_date",
+        "dc_terms_type",
+        "dc_terms_audience",
+        "dc_type",
+        "dc_terms_subject",
+        "dc_subject",
+        "dc_description",
+        "dc_terms_keywords",
+        "modified_time",
+        "published_time",
+        "article_tag",
+        "article_section",
+        "source_url",
+        "scrape_id",
+        "content_type",
+        "cached_at",
+        "error",
+        "timezone",
+    )
+)
+# Integer metadata fields the API may send as lists
+_METADATA_INT_KEYS = frozenset(("status_code", "num_pages", "credits_used"))
+_METADATA_LIST_KEYS = _METADATA_STRING_KEYS | _METADATA_INT_KEYS
+
+
 class DocumentMetadata(BaseModel):
     """Metadata for scraped documents (snake_case only; API camelCase normalized in code)."""
 
@@ -159,54 +208,21 @@ class DocumentMetadata(BaseModel):
         """
         if not isinstance(data, dict):
             return data
-        single_str_fields = {
-            "title",
-            "description",
-            "url",
-            "language",
-            "robots",
-            "og_title",
-            "og_description",
-            "og_url",
-            "og_image",
-            "og_audio",
-            "og_determiner",
-            "og_locale",
-            "og_site_name",
-            "og_video",
-            "favicon",
-            "dc_terms_created",
-            "dc_date_created",
-            "dc_date",
-            "dc_terms_type",
-            "dc_type",
-            "dc_terms_audience",
-            "dc_terms_subject",
-            "dc_subject",
-            "dc_description",
-            "dc_terms_keywords",
-            "modified_time",
-            "published_time",
-            "article_tag",
-            "article_section",
-            "source_url",
-            "scrape_id",
-            "content_type",
-            "cached_at",
-            "error",
-            "timezone",
-        }
-        for k, v in list(data.items()):
-            if isinstance(v, list) and k in single_str_fields:
-                data[k] = cls._coerce_list_to_string(v)
-            # For ints that might appear as list, take first
-            if isinstance(v, list) and k in {
-                "status_code",
-                "num_pages",
-                "credits_used",
-            }:
-                first = v[0] if v else None
+        # Most metadata has no list values at all; checked without a Python-level loop
+        if list not in map(type, data.values()):
+            return data
+        listed = [k for k in data.keys() & _METADATA_LIST_KEYS if isinstance(data[k], list)]
+        if not listed:
+            return data
+        # Copy so the caller's (or the API response's) dict is left unchanged
+        data = dict(data)
+        for k in listed:
+            if k in _METADATA_INT_KEYS:
+                # For ints that might appear as list, take first
+                first = data[k][0] if data[k] else None
                 data[k] = cls._coerce_string_to_int(first)
+            else:
+                data[k] = cls._coerce_list_to_string(data[k])
         return data
 
     @field_validator(
@@ -279,6 +295,15 @@ class Document(BaseModel):
     change_tracking: Optional[Dict[str, Any]] = None
     branding: Optional[BrandingProfile] = None
 
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler):
+        # Lazily built documents resolve their remaining fields before being dumped
+        self._materialize()
+        return handler(self)
+
+    def _materialize(self) -> None:
+        """Resolve every field; a no-op for documents validated up front."""
+
     @property
     def metadata_typed(self) -> DocumentMetadata:
         """Always returns a DocumentMetadata instance for LSP-friendly access."""
@@ -310,6 +335,63 @@ class Document(BaseModel):
         return {}
 
 
+class _CompactFields:
+    """
+    Slotted storage where known fields that were never set read as ``None``.
+
+    Base of the compact result types in ``utils.documents``; result fields accept
+    instances and dump them with ``to_dict``.
+    """
+
+    __slots__ = ()
+    _FIELDS_ORDER: tuple = ()
+    _FIELDS: frozenset = frozenset()
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self._FIELDS:
+            return None
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def _items(self) -> Iterable[Any]:
+        for name in self._FIELDS_ORDER:
+            value = getattr(self, name)
+            if value is not None:
+                yield name, value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Set fields as a snake_case dict, nested compact values included."""
+        return {
+            name: value.to_dict() if isinstance(value, _CompactFields) else value
+            for name, value in self._items()
+        }
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        args = ", ".join(f"{name}={value!r}" for name, value in self._items())
+        return f"{type(self).__name__}({args})"
+
+
+def _serialize_result_document(value: Any, handler: SerializerFunctionWrapHandler) -> Any:
+    # Results of the "dict", "raw" and "compact" result modes are assigned to the job
+    # without validation; plain dicts are dumped as they are
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, _CompactFields):
+        return value.to_dict()
+    return handler(value)
+
+
+_RESULT_SERIALIZER = WrapSerializer(_serialize_result_document)
+
+# A crawl or batch scrape result. Validated as a Document; the other result modes'
+# values are only ever assigned, and dumped by the serializer
+ResultDocument = Annotated[Document, _RESULT_SERIALIZER]
+
+
 # Webhook types
 class WebhookConfig(BaseModel):
     """Configuration for webhooks."""
@@ -585,7 +667,7 @@ class CrawlJob(BaseModel):
     credits_used: int = 0
     expires_at: Optional[datetime] = None
     next: Optional[str] = None
-    data: List[Document] = []
+    data: List[ResultDocument] = []
 
 
 class CrawlStatusRequest(BaseModel):
@@ -699,7 +781,7 @@ class BatchScrapeJob(BaseModel):
     credits_used: Optional[int] = None
     expires_at: Optional[datetime] = None
     next: Optional[str] = None
-    data: List[Document] = []
+    data: List[ResultDocument] = []
 
 
 class BatchScrapeStatusRequest(BaseModel):
@@ -1026,9 +1108,9 @@ SearchResult = LinkResult
 class SearchData(BaseModel):
     """Search results grouped by source type."""
 
-    web: Optional[List[Union[SearchResultWeb, Document]]] = None
-    news: Optional[List[Union[SearchResultNews, Document]]] = None
-    images: Optional[List[Union[SearchResultImages, Document]]] = None
+    web: Optional[List[Annotated[Union[SearchResultWeb, Document], _RESULT_SERIALIZER]]] = None
+    news: Optional[List[Annotated[Union[SearchResultNews, Document], _RESULT_SERIALIZER]]] = None
+    images: Optional[List[Annotated[Union[SearchResultImages, Document], _RESULT_SERIALIZER]]] = None
 
 
 class SearchResponse(BaseResponse[SearchData]):
@@ -1121,6 +1203,9 @@ class ClientConfig(BaseModel):
     timeout: Optional[float] = None
     max_retries: int = 3
     backoff_factor: float = 0.5
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    pool_idle_timeout: Optional[float] = None
 
 
 class PaginationConfig(BaseModel):
@@ -1130,6 +1215,24 @@ class PaginationConfig(BaseModel):
     max_pages: Optional[int] = Field(default=None, ge=0)
     max_results: Optional[int] = Field(default=None, ge=0)
     max_wait_time: Optional[int] = Field(default=None, ge=0)  # seconds
+    # Fetch the pages of finished jobs concurrently, deriving their offsets from the first next link
+    max_concurrent_pages: Optional[int] = Field(default=None, ge=1)
+    page_size: int = Field(default=100, ge=1)  # results requested per page when fetching concurrently
+
+
+# How the wait helpers poll a running job:
+#   "full": fetch every result page on every poll
+#   "counters": poll progress counters only and download results once at the end
+#   "incremental": download each result exactly once, resuming from a cursor on every poll
+PollMode = Literal["full", "counters", "incremental"]
+
+# How crawl, batch scrape and search results are built from API responses:
+#   "model": validate every document up front
+#   "lazy": wrap the response dicts and validate each field when it is first read
+#   "compact": unvalidated slotted documents, for holding very large result sets
+#   "dict": plain dicts with snake_case keys, no models
+#   "raw": the API's dicts unchanged (camelCase keys)
+ResultMode = Literal["model", "lazy", "compact", "dict", "raw"]
 
 
 # Response union types
@@ -3,7 +3,19 @@ Utility modules for v2 API client.
 """
 
 from .http_client import HttpClient
-from .error_handler import FirecrawlError, handle_response_error
+from .retry import RetryPolicy, RetryBudget
+from .rate_limit import RateLimiter
+from .concurrency import AdaptiveConcurrencyLimiter
+from .compression import CompressionPolicy
+from .hedging import HedgePolicy
+from .circuit_breaker import CircuitBreaker
+from .transport import Transport, MockTransport, CassetteTransport, TransportResponse
+from .checkpoint import CheckpointStore, FileCheckpointStore, SQLiteCheckpointStore
+from .sinks import DocumentSink, JsonlSink, SQLiteSink, ParquetSink
+from .polling import AdaptivePollScheduler
+from .spill import SpillingDocumentList
+from .documents import CompactDocument, LazyDocument
+from .error_handler import FirecrawlError, CircuitOpenError, handle_response_error
 from .validation import validate_scrape_options, prepare_scrape_options
 
-__all__ = ['HttpClient', 'FirecrawlError', 'handle_response_error', 'validate_scrape_options', 'prepare_scrape_options']
\ No newline at end of file
+__all__ = ['HttpClient', 'RetryPolicy', 'RetryBudget', 'RateLimiter', 'AdaptiveConcurrencyLimiter', 'CompressionPolicy', 'HedgePolicy', 'CircuitBreaker', 'Transport', 'MockTransport', 'CassetteTransport', 'TransportResponse', 'CheckpointStore', 'FileCheckpointStore', 'SQLiteCheckpointStore', 'DocumentSink', 'JsonlSink', 'SQLiteSink', 'ParquetSink', 'AdaptivePollScheduler', 'SpillingDocumentList', 'LazyDocument', 'CompactDocument', 'FirecrawlError', 'CircuitOpenError', 'handle_response_error', 'validate_scrape_options', 'prepare_scrape_options']
\ No newline at end of file
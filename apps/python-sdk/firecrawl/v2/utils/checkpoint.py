@@ -0,0 +1,134 @@
+"""
+Persisted pagination cursors for resumable result downloads.
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Dict, NamedTuple, Optional
+
+
+class Checkpoint(NamedTuple):
+    """Position of a result download: the ``next`` link to request and the documents consumed before it."""
+
+    next_url: str
+    documents: int
+
+
+class CheckpointStore:
+    """
+    Stores one ``Checkpoint`` per job id.
+
+    Subclass and implement ``load``, ``save`` and ``delete`` to keep checkpoints
+    elsewhere (e.g. in an existing database).
+    """
+
+    def load(self, job_id: str) -> Optional[Checkpoint]:
+        raise NotImplementedError
+
+    def save(self, job_id: str, checkpoint: Checkpoint) -> None:
+        raise NotImplementedError
+
+    def delete(self, job_id: str) -> None:
+        raise NotImplementedError
+
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    Keeps checkpoints in a JSON file, rewritten atomically on every save.
+
+    Suited to a single process; use ``SQLiteCheckpointStore`` when several
+    processes share one store.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, Dict[str, object]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, entries: Dict[str, Dict[str, object]]) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".firecrawl-checkpoint-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def load(self, job_id: str) -> Optional[Checkpoint]:
+        with self._lock:
+            entry = self._read().get(job_id)
+        if entry is None:
+            return None
+        return Checkpoint(entry["next_url"], entry["documents"])
+
+    def save(self, job_id: str, checkpoint: Checkpoint) -> None:
+        with self._lock:
+            entries = self._read()
+            entries[job_id] = checkpoint._asdict()
+            self._write(entries)
+
+    def delete(self, job_id: str) -> None:
+        with self._lock:
+            entries = self._read()
+            if entries.pop(job_id, None) is not None:
+                self._write(entries)
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """Keeps checkpoints in a SQLite database, safe to share between threads and processes."""
+
+    def __init__(self, path: str):
+        self.path = path
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS firecrawl_checkpoints ("
+                    "job_id TEXT PRIMARY KEY, next_url TEXT NOT NULL, documents INTEGER NOT NULL, updated_at REAL NOT NULL)"
+                )
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def load(self, job_id: str) -> Optional[Checkpoint]:
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT next_url, documents FROM firecrawl_checkpoints WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        finally:
+            conn.close()
+        return Checkpoint(row[0], row[1]) if row else None
+
+    def save(self, job_id: str, checkpoint: Checkpoint) -> None:
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO firecrawl_checkpoints (job_id, next_url, documents, updated_at) VALUES (?, ?, ?, ?)",
+                    (job_id, checkpoint.next_url, checkpoint.documents, time.time()),
+                )
+        finally:
+            conn.close()
+
+    def delete(self, job_id: str) -> None:
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM firecrawl_checkpoints WHERE job_id = ?", (job_id,))
+        finally:
+            conn.close()
@@ -0,0 +1,180 @@
+"""
+Per-endpoint circuit breaker shared by the sync and async v2 HTTP clients.
+"""
+
+import logging
+import threading
+import time
+from typing import Collection, Dict, Optional
+from urllib.parse import urlparse
+
+from .error_handler import CircuitOpenError
+
+logger = logging.getLogger("firecrawl")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+DEFAULT_FAILURE_STATUSES = frozenset({500, 502, 503, 504})
+
+
+def endpoint_key(url: str) -> str:
+    """
+    Endpoint family of an API URL: ``scrape``, ``crawl``, ``batch``, ``search``, ``map``, ``extract``, ...
+
+    The API version is ignored so ``/v2/crawl/<id>`` and pagination links on
+    ``/v1/crawl/<id>?skip=`` share one circuit.
+    """
+    segments = [s for s in urlparse(url).path.split("/") if s]
+    if segments and segments[0][:1] == "v" and segments[0][1:].isdigit():
+        segments = segments[1:]
+    return segments[0] if segments else "/"
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "successes", "opened_at", "probes", "probe_started_at")
+
+    def __init__(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.successes = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.probe_started_at = 0.0
+
+
+class CircuitBreaker:
+    """
+    Fails requests fast while an endpoint family is failing, instead of spending
+    retries and sleeps on every call.
+
+    Each endpoint family has its own circuit:
+
+    - closed: requests flow; ``failure_threshold`` consecutive failures open it
+    - open: requests raise ``CircuitOpenError`` until ``recovery_timeout`` elapsed
+    - half-open: up to ``half_open_max_calls`` probe requests are let through;
+      ``success_threshold`` successes close the circuit, any failure re-opens it
+
+    Failures are network errors and responses with a status in ``failure_statuses``.
+    A breaker is thread-safe; pass the same instance (or ``CircuitBreaker.shared()``)
+    to several clients, sync or async, to share circuit state across them.
+
+    Args:
+        failure_threshold: Consecutive failures that open a circuit
+        recovery_timeout: Seconds a circuit stays open before probing
+        half_open_max_calls: Concurrent probe requests allowed while half-open
+        success_threshold: Successful probes needed to close the circuit
+        failure_statuses: HTTP statuses counted as failures
+    """
+
+    _shared: Optional["CircuitBreaker"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        success_threshold: int = 1,
+        failure_statuses: Collection[int] = DEFAULT_FAILURE_STATUSES,
+    ):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if recovery_timeout <= 0:
+            raise ValueError("recovery_timeout must be positive")
+        if half_open_max_calls < 1 or success_threshold < 1:
+            raise ValueError("half_open_max_calls and success_threshold must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.success_threshold = success_threshold
+        self.failure_statuses = frozenset(failure_statuses)
+
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _Circuit] = {}
+
+    @classmethod
+    def shared(cls) -> "CircuitBreaker":
+        """Process-wide breaker with default settings."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def _circuit(self, key: str) -> _Circuit:
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = self._circuits[key] = _Circuit()
+        return circuit
+
+    def state(self, key: str) -> str:
+        """Current state of a circuit (``closed``, ``open`` or ``half_open``)."""
+        with self._lock:
+            circuit = self._circuit(key)
+            if circuit.state == OPEN and time.monotonic() - circuit.opened_at >= self.recovery_timeout:
+                return HALF_OPEN
+            return circuit.state
+
+    def before_request(self, key: str) -> None:
+        """Admit a request, or raise ``CircuitOpenError`` while the circuit is open."""
+        with self._lock:
+            circuit = self._circuit(key)
+            now = time.monotonic()
+            if circuit.state == OPEN:
+                remaining = self.recovery_timeout - (now - circuit.opened_at)
+                if remaining > 0:
+                    raise CircuitOpenError(key, remaining)
+                circuit.state = HALF_OPEN
+                circuit.probes = 0
+                circuit.successes = 0
+                logger.debug("Circuit for %s endpoints half-open", key)
+            if circuit.state == HALF_OPEN:
+                # A probe that never reported back (e.g. cancelled) stops counting after recovery_timeout
+                if circuit.probes >= self.half_open_max_calls and now - circuit.probe_started_at < self.recovery_timeout:
+                    raise CircuitOpenError(key, self.recovery_timeout - (now - circuit.probe_started_at))
+                if circuit.probes >= self.half_open_max_calls:
+                    circuit.probes = 0
+                circuit.probes += 1
+                circuit.probe_started_at = now
+
+    def record_success(self, key: str) -> None:
+        with self._lock:
+            circuit = self._circuit(key)
+            if circuit.state == OPEN:
+                # Late answer from a request admitted before the circuit opened
+                return
+            if circuit.state == HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
+                circuit.successes += 1
+                if circuit.successes < self.success_threshold:
+                    return
+                logger.debug("Circuit for %s endpoints closed", key)
+            circuit.state = CLOSED
+            circuit.failures = 0
+
+    def record_failure(self, key: str) -> None:
+        with self._lock:
+            circuit = self._circuit(key)
+            if circuit.state == OPEN:
+                return
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+                logger.warning("Circuit for %s endpoints opened after %d failures", key, circuit.failures)
+                circuit.state = OPEN
+                circuit.opened_at = time.monotonic()
+                circuit.probes = 0
+
+    def record_response(self, key: str, status_code: int) -> None:
+        if status_code in self.failure_statuses:
+            self.record_failure(key)
+        else:
+            self.record_success(key)
+
+    def reset(self, key: Optional[str] = None) -> None:
+        """Close one circuit, or all of them."""
+        with self._lock:
+            if key is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(key, None)
@@ -0,0 +1,80 @@
+"""
+Opt-in compression of request bodies and negotiation of response encodings.
+"""
+
+import gzip
+import zlib
+from typing import Iterable, Optional, Tuple
+
+# Preference order for response encodings; only those the transport can decode are advertised
+_RESPONSE_ENCODING_PREFERENCE = ("zstd", "br", "gzip", "deflate")
+# The API inflates gzip and deflate request bodies
+REQUEST_ENCODINGS = ("gzip", "deflate")
+
+
+def _ordered(encodings: Iterable[str]) -> str:
+    available = {e.strip().lower() for e in encodings if e and e.strip()}
+    return ", ".join(e for e in _RESPONSE_ENCODING_PREFERENCE if e in available)
+
+
+def requests_accept_encoding() -> str:
+    """``Accept-Encoding`` for ``requests``, listing every codec urllib3 can decode (zstd/br when installed)."""
+    try:
+        from urllib3.util.request import ACCEPT_ENCODING
+    except ImportError:  # pragma: no cover - urllib3 always ships with requests
+        return "gzip, deflate"
+    return _ordered(ACCEPT_ENCODING.split(",")) or "gzip, deflate"
+
+
+def httpx_accept_encoding() -> str:
+    """``Accept-Encoding`` for ``httpx``, listing every codec httpx can decode (zstd/br when installed)."""
+    try:
+        from httpx._decoders import SUPPORTED_DECODERS
+    except ImportError:  # pragma: no cover - private module, guard against layout changes
+        return "gzip, deflate"
+    return _ordered(SUPPORTED_DECODERS) or "gzip, deflate"
+
+
+class CompressionPolicy:
+    """
+    Controls request body compression and the response encodings advertised to the API.
+
+    Responses are decompressed incrementally by the underlying transport as they are read.
+
+    Args:
+        min_size: Compress request bodies of at least this many bytes
+        encoding: Request ``Content-Encoding``, ``"gzip"`` or ``"deflate"``
+        level: Compression level (1 fastest, 9 smallest)
+        negotiate_responses: Advertise every response encoding the transport can decode
+    """
+
+    def __init__(
+        self,
+        min_size: int = 16 * 1024,
+        encoding: str = "gzip",
+        level: int = 6,
+        negotiate_responses: bool = True,
+    ):
+        if encoding not in REQUEST_ENCODINGS:
+            raise ValueError(f"encoding must be one of {', '.join(REQUEST_ENCODINGS)}")
+        if min_size < 0:
+            raise ValueError("min_size must be non-negative")
+        if not 1 <= level <= 9:
+            raise ValueError("level must be between 1 and 9")
+        self.min_size = min_size
+        self.encoding = encoding
+        self.level = level
+        self.negotiate_responses = negotiate_responses
+
+    def encode(self, body: bytes) -> Tuple[bytes, Optional[str]]:
+        """Return the body to send and its ``Content-Encoding`` (None when left uncompressed)."""
+        if len(body) < self.min_size:
+            return body, None
+        if self.encoding == "gzip":
+            compressed = gzip.compress(body, compresslevel=self.level)
+        else:
+            compressed = zlib.compress(body, self.level)
+        # Incompressible payloads are sent as-is
+        if len(compressed) >= len(body):
+            return body, None
+        return compressed, self.encoding
@@ -0,0 +1,132 @@
+"""
+Adaptive (AIMD) concurrency control driven by server queueing signals.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Optional
+
+from .rate_limit import RateLimiter
+
+logger = logging.getLogger("firecrawl")
+
+
+class AdaptiveConcurrencyLimiter(RateLimiter):
+    """
+    Rate limiter whose in-flight cap adapts with additive-increase/multiplicative-decrease.
+
+    Each successful response grows the cap by roughly ``increase`` per full window of
+    requests. A 429, or a scraped document whose metadata reports that it waited in the
+    team's concurrency queue, shrinks the cap by ``decrease_factor``. Decreases are
+    applied at most once per ``cooldown`` so a burst of signals from the same window
+    counts as one congestion event.
+
+    Args:
+        initial_concurrency: Starting in-flight cap
+        min_concurrency: Lower bound for the cap
+        max_concurrency_limit: Upper bound for the cap; replaced by the plan limit when auto-calibrated
+        increase: Slots added per window of successful responses
+        decrease_factor: Multiplier applied to the cap on congestion
+        queue_threshold_ms: Queue time above which a document counts as queued
+        cooldown: Minimum seconds between two decreases
+        requests_per_second: Optional sustained request rate, as for RateLimiter
+        burst: Optional bucket size, as for RateLimiter
+        auto_calibrate: Take ``max_concurrency_limit`` from the team's plan concurrency
+    """
+
+    def __init__(
+        self,
+        initial_concurrency: int = 4,
+        min_concurrency: int = 1,
+        max_concurrency_limit: int = 100,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        queue_threshold_ms: int = 0,
+        cooldown: float = 1.0,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        auto_calibrate: bool = False,
+    ):
+        if min_concurrency < 1:
+            raise ValueError("min_concurrency must be at least 1")
+        if max_concurrency_limit < min_concurrency:
+            raise ValueError("max_concurrency_limit must be at least min_concurrency")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        if increase <= 0:
+            raise ValueError("increase must be positive")
+
+        initial = min(max(initial_concurrency, min_concurrency), max_concurrency_limit)
+        super().__init__(
+            requests_per_second=requests_per_second,
+            burst=burst,
+            max_concurrency=initial,
+            auto_calibrate=auto_calibrate,
+        )
+        self.min_concurrency = min_concurrency
+        self.max_concurrency_limit = max_concurrency_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.queue_threshold_ms = queue_threshold_ms
+        self.cooldown = cooldown
+
+        self._aimd_lock = threading.Lock()
+        self._limit = float(initial)
+        self._last_decrease: Optional[float] = None
+
+    @property
+    def limit(self) -> int:
+        """Current in-flight cap."""
+        with self._aimd_lock:
+            return int(self._limit)
+
+    def record_response(self, status_code: int) -> None:
+        if status_code == 429:
+            self.on_congestion()
+        elif 200 <= status_code < 400:
+            self.on_success()
+
+    def record_document(self, document: Any) -> None:
+        metadata = getattr(document, "metadata", None)
+        if metadata is None:
+            return
+        queue_ms = getattr(metadata, "concurrency_queue_duration_ms", None)
+        if queue_ms is not None:
+            queued = queue_ms > self.queue_threshold_ms
+        else:
+            queued = bool(getattr(metadata, "concurrency_limited", None))
+        if queued:
+            self.on_congestion()
+
+    def on_success(self) -> None:
+        """Additive increase: about ``increase`` slots per window of successes."""
+        with self._aimd_lock:
+            self._limit = min(
+                float(self.max_concurrency_limit),
+                self._limit + self.increase / max(self._limit, 1.0),
+            )
+            self._apply()
+
+    def on_congestion(self) -> None:
+        """Multiplicative decrease, at most once per cooldown."""
+        with self._aimd_lock:
+            now = time.monotonic()
+            if self._last_decrease is not None and now - self._last_decrease < self.cooldown:
+                return
+            self._last_decrease = now
+            self._limit = max(float(self.min_concurrency), self._limit * self.decrease_factor)
+            self._apply()
+            logger.debug("Adaptive concurrency decreased to %s", int(self._limit))
+
+    def _apply_calibration(self, limit: int) -> None:
+        with self._aimd_lock:
+            self.max_concurrency_limit = max(limit, self.min_concurrency)
+            self._limit = min(self._limit, float(self.max_concurrency_limit))
+            self._apply()
+
+    def _apply(self) -> None:
+        """Must hold ``_aimd_lock``."""
+        limit = int(self._limit)
+        if limit != self.max_concurrency:
+            self.set_max_concurrency(limit)
@@ -0,0 +1,302 @@
+"""
+Building result documents from API response dicts in the configured ``ResultMode``.
+"""
+
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Set, TypeVar, Union
+
+from pydantic import TypeAdapter
+
+from .normalize import (
+    _BRANDING_KEY_NAMES,
+    _DOCUMENT_KEY_NAMES,
+    _METADATA_KEY_NAMES,
+    _map_metadata_keys,
+    _translate_keys,
+    normalize_document_keys,
+)
+from ..types import BrandingProfile, Document, DocumentMetadata, ResultMode, _CompactFields
+
+RESULT_MODES = ("model", "lazy", "compact", "dict", "raw")
+
+# Modes returning plain dicts instead of models
+DICT_MODES = ("dict", "raw")
+
+JobT = TypeVar("JobT")
+
+# Validates a whole page of normalized documents in one call
+_DOCUMENT_LIST = TypeAdapter(List[Document])
+
+# Top-level API keys that differ from the Document field names
+_API_KEYS = {"raw_html": "rawHtml", "change_tracking": "changeTracking"}
+_FIELD_NAMES = {api_key: field for field, api_key in _API_KEYS.items()}
+_KNOWN_KEYS = frozenset(Document.model_fields) | frozenset(_FIELD_NAMES)
+
+
+def _raw_value(raw: Dict[str, Any], name: str) -> Any:
+    if name in raw:
+        return raw[name]
+    api_key = _API_KEYS.get(name)
+    return raw.get(api_key) if api_key is not None else None
+
+
+# JSON values of these types are already valid for the field and are used as-is
+_PLAIN_TYPES = {
+    "markdown": str,
+    "html": str,
+    "raw_html": str,
+    "summary": str,
+    "screenshot": str,
+    "warning": str,
+    "actions": dict,
+    "change_tracking": dict,
+}
+_STRING_LISTS = ("links", "images")
+_UNRESOLVED = object()
+
+
+def _resolve_value(name: str, value: Any) -> Any:
+    """The validated value of one field, as ``Document.model_validate(raw)`` would hold it."""
+    if name == "json" or type(value) is _PLAIN_TYPES.get(name):
+        return value
+    if name in _STRING_LISTS and type(value) is list and all(type(item) is str for item in value):
+        return value
+    if name == "metadata" and isinstance(value, dict):
+        return DocumentMetadata.model_validate(_map_metadata_keys(value))
+    if name == "branding" and isinstance(value, dict):
+        return BrandingProfile.model_validate(_translate_keys(value, _BRANDING_KEY_NAMES))
+    return _UNRESOLVED
+
+
+def _fields_set(raw: Dict[str, Any]) -> Set[str]:
+    names = raw.keys() & _KNOWN_KEYS
+    if "rawHtml" in names or "changeTracking" in names:
+        names = {_FIELD_NAMES.get(name, name) for name in names}
+    return names
+
+
+class LazyDocument(Document):
+    """
+    ``Document`` over a raw API response dict whose fields are validated on first access.
+
+    Reading ``doc.markdown`` returns the response's string without building the
+    rest of the document; ``doc.metadata`` maps the camelCase keys and validates
+    ``DocumentMetadata`` only then. Each field is validated exactly as ``Document``
+    would validate it and cached afterwards. Dumping, comparing, copying or
+    pickling resolves every field first, so a lazy document is interchangeable
+    with an eagerly built one (including inside ``CrawlJob.data``).
+
+    Create instances with ``LazyDocument.from_api``; the wrapped dict must not be
+    modified afterwards.
+    """
+
+    __slots__ = ("_raw",)
+
+    @classmethod
+    def from_api(cls, raw: Dict[str, Any]) -> "LazyDocument":
+        document = cls.__new__(cls)
+        object.__setattr__(document, "__dict__", {})
+        object.__setattr__(document, "__pydantic_extra__", None)
+        object.__setattr__(document, "__pydantic_private__", None)
+        object.__setattr__(document, "__pydantic_fields_set__", _fields_set(raw))
+        object.__setattr__(document, "_raw", raw)
+        return document
+
+    def _resolve(self, name: str) -> Any:
+        value = _raw_value(self._raw, name)
+        resolved = None if value is None else _resolve_value(name, value)
+        if resolved is _UNRESOLVED:
+            # Anything else goes through the field's validator (coercion and errors as for Document)
+            fields_set = self.__pydantic_fields_set__
+            Document.__pydantic_validator__.validate_assignment(self, name, value)
+            object.__setattr__(self, "__pydantic_fields_set__", fields_set)
+            return self.__dict__[name]
+        self.__dict__[name] = resolved
+        return resolved
+
+    def __getattr__(self, name: str) -> Any:
+        if name in Document.model_fields:
+            return self._resolve(name)
+        return super().__getattr__(name)
+
+    def _materialize(self) -> None:
+        if len(self.__dict__) == len(Document.model_fields):
+            return
+        for name in Document.model_fields:
+            if name not in self.__dict__:
+                self._resolve(name)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Document):
+            return NotImplemented
+        self._materialize()
+        other._materialize()
+        return self.__dict__ == other.__dict__ and self.__pydantic_fields_set__ == other.__pydantic_fields_set__
+
+    def __iter__(self):
+        self._materialize()
+        return super().__iter__()
+
+    def __repr_args__(self):
+        self._materialize()
+        return super().__repr_args__()
+
+    def __copy__(self):
+        self._materialize()
+        return super().__copy__()
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None):
+        self._materialize()
+        return super().__deepcopy__(memo)
+
+    def __getstate__(self) -> Dict[Any, Any]:
+        self._materialize()
+        return super().__getstate__()
+
+
+# Metadata values shared by most documents of a job, kept once per distinct string
+_INTERNED_METADATA = frozenset(
+    ("language", "content_type", "og_site_name", "og_locale", "proxy_used", "cache_state")
+)
+
+
+class CompactMetadata(_CompactFields):
+    """
+    ``DocumentMetadata`` fields in slots, without pydantic's per-instance state.
+
+    Only fields present in the response take a value; repeated strings such as
+    ``language`` or ``content_type`` are interned. Unknown keys are kept in ``extras``.
+    """
+
+    __slots__ = tuple(DocumentMetadata.model_fields) + ("_extras",)
+    _FIELDS_ORDER = tuple(DocumentMetadata.model_fields)
+    _FIELDS = frozenset(_FIELDS_ORDER)
+
+    @classmethod
+    def from_api(cls, raw: Dict[str, Any]) -> "CompactMetadata":
+        metadata = cls.__new__(cls)
+        extras = None
+        for key, value in raw.items():
+            if value is None:
+                continue
+            name = _METADATA_KEY_NAMES.get(key, key)
+            if name not in cls._FIELDS:
+                if extras is None:
+                    extras = {}
+                extras[key] = value
+                continue
+            if type(value) is str:
+                if name in _INTERNED_METADATA:
+                    value = sys.intern(value)
+                elif name == "status_code" and value.isdigit():
+                    value = int(value)
+            setattr(metadata, name, value)
+        metadata._extras = extras
+        return metadata
+
+    @property
+    def extras(self) -> Dict[str, Any]:
+        """Unknown metadata keys."""
+        return dict(self._extras) if self._extras else {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Set fields and extras as a snake_case dict."""
+        out = super().to_dict()
+        if self._extras:
+            out.update(self._extras)
+        return out
+
+
+class CompactDocument(_CompactFields):
+    """
+    Memory-lean result document for large result sets (``result_mode="compact"``).
+
+    Fields are held in slots with the values the API returned (snake_case names,
+    metadata as ``CompactMetadata``), so a document costs a few hundred bytes plus its
+    content instead of the several KB of a ``Document`` with its ``DocumentMetadata``.
+    Values are not validated; ``to_document`` builds the full ``Document`` when needed,
+    and ``model_dump`` goes through it.
+    """
+
+    __slots__ = tuple(Document.model_fields)
+    _FIELDS_ORDER = __slots__
+    _FIELDS = frozenset(_FIELDS_ORDER)
+
+    @classmethod
+    def from_api(cls, raw: Dict[str, Any]) -> "CompactDocument":
+        document = cls.__new__(cls)
+        for key, value in raw.items():
+            if value is None:
+                continue
+            name = _DOCUMENT_KEY_NAMES.get(key, key)
+            if name not in cls._FIELDS:
+                continue
+            if name == "metadata" and isinstance(value, dict):
+                value = CompactMetadata.from_api(value)
+            setattr(document, name, value)
+        return document
+
+    def to_document(self) -> Document:
+        """The validated ``Document`` for this result."""
+        return Document.model_validate(self.to_dict())
+
+    def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
+        return self.to_document().model_dump(**kwargs)
+
+
+def validate_result_mode(mode: str) -> None:
+    if mode not in RESULT_MODES:
+        raise ValueError(f"result_mode must be one of {', '.join(RESULT_MODES)}")
+
+
+def client_result_mode(client: Any, override: Optional[ResultMode] = None) -> ResultMode:
+    """
+    ``override`` if given, else the ``result_mode`` an HTTP client was configured with
+    ("model" for anything else).
+    """
+    if override is not None:
+        validate_result_mode(override)
+        return override
+    mode = getattr(client, "result_mode", "model")
+    return mode if mode in RESULT_MODES else "model"
+
+
+def build_document(raw: Dict[str, Any], mode: ResultMode = "model") -> Union[Document, Dict[str, Any]]:
+    """One result document from a raw API dict."""
+    if mode == "raw":
+        return raw
+    if mode == "dict":
+        return normalize_document_keys(raw)
+    if mode == "lazy":
+        return LazyDocument.from_api(raw)
+    if mode == "compact":
+        return CompactDocument.from_api(raw)
+    return Document.model_validate(normalize_document_keys(raw))
+
+
+def build_documents(
+    items: Optional[Iterable[Any]], mode: ResultMode = "model", limit: Optional[int] = None
+) -> List[Any]:
+    """
+    Result documents from a response ``data`` list, skipping non-dict entries.
+
+    In "model" mode the page's keys are normalized first and the page is then validated
+    with a single ``TypeAdapter`` call. ``limit`` caps the number of documents built.
+    """
+    raws = [item for item in items or () if isinstance(item, dict)]
+    if limit is not None:
+        raws = raws[: max(limit, 0)]
+    if mode == "model":
+        return _DOCUMENT_LIST.validate_python([normalize_document_keys(raw) for raw in raws])
+    return [build_document(raw, mode) for raw in raws]
+
+
+def attach_documents(job: JobT, documents: List[Any]) -> JobT:
+    """
+    Set ``job.data`` to ``documents`` as they are.
+
+    Jobs are built without their documents and get them assigned afterwards, which
+    pydantic does not validate, so results in the dict modes stay plain dicts.
+    """
+    job.data = documents  # type: ignore[attr-defined]
+    return job
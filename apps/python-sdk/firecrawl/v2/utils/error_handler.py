@@ -4,6 +4,7 @@ Error handling utilities for v2 API.
 
 import requests
 from typing import Dict, Any, Optional
+from .json_codec import decode_response
 
 
 class FirecrawlError(Exception):
@@ -51,6 +52,17 @@ class InternalServerError(FirecrawlError):
     pass
 
 
+class CircuitOpenError(FirecrawlError):
+    """Raised without contacting the API while the circuit for an endpoint family is open."""
+
+    def __init__(self, endpoint: str, retry_after: float):
+        super().__init__(
+            f"Circuit open for {endpoint} endpoints after repeated failures; retry in {retry_after:.1f}s"
+        )
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
 def handle_response_error(response: requests.Response, action: str) -> None:
     """
     Handle API response errors and raise appropriate exceptions.
@@ -63,7 +75,7 @@ def handle_response_error(response: requests.Response, action: str) -> None:
         FirecrawlError: Appropriate error based on status code
     """
     try:
-        response_json = response.json()
+        response_json = decode_response(response)
         error_message = response_json.get('error', 'No error message provided.')
         error_details = response_json.get('details', 'No additional error details provided.')
     except:
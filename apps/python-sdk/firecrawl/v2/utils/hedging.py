@@ -0,0 +1,103 @@
+"""
+Hedged requests: duplicate a slow idempotent request and keep the first answer.
+"""
+
+import threading
+from collections import deque
+from typing import Deque, Dict
+from urllib.parse import urlparse
+
+from .retry import RetryBudget
+
+HEDGEABLE_METHODS = frozenset({"GET"})
+
+
+def endpoint_family(url: str) -> str:
+    """Group URLs by their first two path segments (``/v2/crawl/<id>?skip=`` -> ``/v2/crawl``)."""
+    segments = [s for s in urlparse(url).path.split("/") if s]
+    return "/" + "/".join(segments[:2])
+
+
+class HedgePolicy:
+    """
+    Sends a duplicate of an idempotent request that has not answered within an
+    adaptive latency threshold, and uses whichever attempt answers first.
+
+    The threshold is the ``percentile`` of recently observed latencies for the same
+    endpoint family, clamped to ``[min_delay, max_delay]``; ``initial_delay`` is used
+    until ``min_samples`` latencies were observed. Hedges are capped at
+    ``max_extra_load`` times the number of requests, so hedging cannot multiply load
+    when the server itself is slow.
+
+    A policy may be shared between clients.
+
+    Args:
+        percentile: Latency percentile (0-100) after which a hedge is sent
+        initial_delay: Hedge delay in seconds before enough latencies were observed
+        min_delay: Lower bound for the hedge delay
+        max_delay: Upper bound for the hedge delay
+        max_extra_load: Maximum hedges as a fraction of requests
+        window: Number of recent latencies kept per endpoint family
+        min_samples: Latencies needed before the percentile is trusted
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.05,
+        max_delay: float = 10.0,
+        max_extra_load: float = 0.1,
+        window: int = 200,
+        min_samples: int = 20,
+    ):
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if min_delay < 0 or max_delay < min_delay:
+            raise ValueError("min_delay must be non-negative and not above max_delay")
+        if not 0 < max_extra_load <= 1:
+            raise ValueError("max_extra_load must be in (0, 1]")
+        if window < 1 or min_samples < 1:
+            raise ValueError("window and min_samples must be at least 1")
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.max_extra_load = max_extra_load
+        self.window = window
+        self.min_samples = min_samples
+
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = {}
+        # Same token accounting as retries: each request deposits max_extra_load, each hedge withdraws one
+        self._budget = RetryBudget(ratio=max_extra_load, min_retries_per_second=0.0, max_tokens=max(1.0, 10 * max_extra_load))
+
+    def applies_to(self, method: str) -> bool:
+        return method.upper() in HEDGEABLE_METHODS
+
+    def record_request(self) -> None:
+        self._budget.record_request()
+
+    def try_acquire_hedge(self) -> bool:
+        """Reserve one hedge from the extra-load budget."""
+        return self._budget.try_acquire()
+
+    def record_latency(self, url: str, seconds: float) -> None:
+        family = endpoint_family(url)
+        with self._lock:
+            samples = self._latencies.get(family)
+            if samples is None:
+                samples = self._latencies[family] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def delay(self, url: str) -> float:
+        """Seconds to wait for the first attempt before hedging."""
+        with self._lock:
+            samples = list(self._latencies.get(endpoint_family(url), ()))
+        if len(samples) < self.min_samples:
+            threshold = self.initial_delay
+        else:
+            samples.sort()
+            index = min(len(samples) - 1, int(len(samples) * self.percentile / 100))
+            threshold = samples[index]
+        return min(self.max_delay, max(self.min_delay, threshold))
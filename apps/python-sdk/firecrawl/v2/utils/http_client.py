@@ -2,20 +2,151 @@
 HTTP client utilities for v2 API.
 """
 
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import Dict, Any, Optional
 from urllib.parse import urlparse, urlunparse, urljoin
 import requests
+from requests.adapters import HTTPAdapter
 from .get_version import get_version
+from .retry import RetryBudget, RetryPolicy, resolve_retry_policy
+from .rate_limit import RateLimiter
+from . import json_codec
+from .compression import CompressionPolicy, requests_accept_encoding
+from .hedging import HedgePolicy
+from .circuit_breaker import CircuitBreaker, endpoint_key
+from .transport import RequestsTransport, Transport
+from .documents import validate_result_mode
+from ..types import ResultMode
 
 version = get_version()
 
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+
 class HttpClient:
-    """HTTP client with retry logic and error handling."""
+    """HTTP client with retry logic and error handling.
+
+    Requests go through a long-lived ``requests.Session`` so TCP/TLS connections
+    are kept alive and reused across calls instead of being re-established for
+    every scrape or status poll.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str],
+        api_url: str,
+        *,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_idle_timeout: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        compression: Optional[CompressionPolicy] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        transport: Optional[Transport] = None,
+        result_mode: ResultMode = "model",
+    ):
+        """
+        Args:
+            api_key: Firecrawl API key sent as a bearer token
+            api_url: Base URL for the Firecrawl API
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum number of connections kept alive per host
+            pool_idle_timeout: Seconds a pool may sit unused before its connections
+                are dropped and re-established on the next request (None keeps them forever)
+            retry_policy: Default retry policy; individual calls may override it
+            retry_budget: Budget capping retries across all calls made by this client
+            rate_limiter: Optional limiter every attempt waits on before being sent
+            compression: Opt-in request body compression and response encoding negotiation
+            hedge_policy: Opt-in hedging of slow GET requests; hedged attempts run on a
+                small thread pool sized after ``pool_maxsize``
+            circuit_breaker: Opt-in per-endpoint circuit breaker; may be shared with other clients
+            transport: Replaces the network transport, e.g. ``MockTransport`` or ``CassetteTransport``
+            result_mode: How crawl, batch scrape and search results are built (see ``ResultMode``)
+        """
+        if pool_connections < 1:
+            raise ValueError("pool_connections must be at least 1")
+        if pool_maxsize < 1:
+            raise ValueError("pool_maxsize must be at least 1")
+        if pool_idle_timeout is not None and pool_idle_timeout <= 0:
+            raise ValueError("pool_idle_timeout must be positive")
+        validate_result_mode(result_mode)
 
-    def __init__(self, api_key: Optional[str], api_url: str):
         self.api_key = api_key
         self.api_url = api_url
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_idle_timeout = pool_idle_timeout
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_budget = retry_budget or RetryBudget()
+        self.rate_limiter = rate_limiter
+        self.compression = compression
+        self.hedge_policy = hedge_policy
+        self.circuit_breaker = circuit_breaker
+        self.result_mode = result_mode
+
+        self._session_lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+        self._last_used = time.monotonic()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        default_transport = RequestsTransport(self._get_session)
+        if transport is not None:
+            transport.bind(default_transport)
+        self.transport = transport or default_transport
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        # Retries are handled by this client, so the adapter must not retry on its own
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=0,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if self.compression is not None and self.compression.negotiate_responses:
+            session.headers["Accept-Encoding"] = requests_accept_encoding()
+        return session
+
+    def _get_session(self) -> requests.Session:
+        """Return the pooled session, evicting idle connections if needed."""
+        with self._session_lock:
+            now = time.monotonic()
+            if (
+                self._session is not None
+                and self.pool_idle_timeout is not None
+                and (now - self._last_used) > self.pool_idle_timeout
+            ):
+                # Idle connections are likely half-closed by the server or a load balancer
+                self._session.close()
+                self._session = None
+            if self._session is None:
+                self._session = self._create_session()
+            self._last_used = now
+            return self._session
+
+    def close(self) -> None:
+        """Close pooled connections. The client can still be used afterwards."""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+        self.transport.close()
+
+    def __enter__(self) -> "HttpClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def _build_url(self, endpoint: str) -> str:
         base = urlparse(self.api_url)
@@ -53,126 +184,199 @@ class HttpClient:
             
         return headers
     
-    def post(
+    def _request(
         self,
+        method: str,
         endpoint: str,
-        data: Dict[str, Any],
+        *,
         headers: Optional[Dict[str, str]] = None,
+        json: Optional[Dict[str, Any]] = None,
         timeout: Optional[float] = None,
-        retries: int = 3,
-        backoff_factor: float = 0.5
+        retries: Optional[int] = None,
+        backoff_factor: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
     ) -> requests.Response:
-        """Make a POST request with retry logic."""
+        """Send a request, retrying according to the effective retry policy."""
         if headers is None:
             headers = self._prepare_headers()
 
-        data['origin'] = f'python-sdk@{version}'
-            
         url = self._build_url(endpoint)
-        
-        last_exception = None
-        
-        for attempt in range(retries):
+        policy = resolve_retry_policy(self.retry_policy, retry_policy, retries, backoff_factor)
+        kwargs: Dict[str, Any] = {"headers": headers, "timeout": timeout}
+        if json is not None:
+            body = json_codec.dumps(json)
+            extra_headers: Dict[str, str] = {}
+            if not any(k.lower() == "content-type" for k in headers):
+                extra_headers["Content-Type"] = "application/json"
+            if self.compression is not None:
+                body, encoding = self.compression.encode(body)
+                if encoding is not None:
+                    extra_headers["Content-Encoding"] = encoding
+            kwargs["content"] = body
+            if extra_headers:
+                kwargs["headers"] = {**headers, **extra_headers}
+
+        breaker = self.circuit_breaker
+        circuit = endpoint_key(url) if breaker is not None else None
+        self.retry_budget.record_request()
+        attempt = 0
+        while True:
+            if breaker is not None:
+                breaker.before_request(circuit)
             try:
-                response = requests.post(
-                    url,
-                    headers=headers,
-                    json=data,
-                    timeout=timeout
+                response = self._send(method, url, kwargs)
+            except requests.RequestException:
+                if breaker is not None:
+                    breaker.record_failure(circuit)
+                if (
+                    not policy.retry_on_network_errors
+                    or not policy.can_retry(attempt)
+                    or not self.retry_budget.try_acquire()
+                ):
+                    raise
+                time.sleep(policy.backoff(attempt))
+                attempt += 1
+                continue
+
+            if breaker is not None:
+                breaker.record_response(circuit, response.status_code)
+            if policy.is_retryable_status(method, response.status_code) and policy.can_retry(attempt):
+                delay = policy.delay_for_response(attempt, response.headers)
+                if delay is not None and self.retry_budget.try_acquire():
+                    response.close()
+                    time.sleep(delay)
+                    attempt += 1
+                    continue
+
+            return response
+
+    def _send(self, method: str, url: str, kwargs: Dict[str, Any]) -> requests.Response:
+        hedge = self.hedge_policy
+        if hedge is None or not hedge.applies_to(method):
+            return self._send_once(method, url, kwargs)
+        return self._send_hedged(hedge, method, url, kwargs)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._session_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.pool_maxsize,
+                    thread_name_prefix="firecrawl-hedge",
                 )
+            return self._executor
+
+    def _timed_send(self, hedge: HedgePolicy, method: str, url: str, kwargs: Dict[str, Any]) -> requests.Response:
+        started = time.monotonic()
+        response = self._send_once(method, url, kwargs)
+        hedge.record_latency(url, time.monotonic() - started)
+        return response
+
+    def _start_primary(self, hedge: HedgePolicy, method: str, url: str, kwargs: Dict[str, Any]) -> Future:
+        # The first attempt gets its own thread rather than a slot in the hedge executor, so it is
+        # sent right away and the hedge delay never includes time spent queued behind other requests
+        future: Future = Future()
+
+        def run() -> None:
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(self._timed_send(hedge, method, url, kwargs))
+            except BaseException as exc:
+                future.set_exception(exc)
+
+        threading.Thread(target=run, name="firecrawl-request", daemon=True).start()
+        return future
+
+    def _send_hedged(self, hedge: HedgePolicy, method: str, url: str, kwargs: Dict[str, Any]) -> requests.Response:
+        """Send a request and, if it is slower than the hedge delay, race a duplicate against it."""
+        hedge.record_request()
+        primary = self._start_primary(hedge, method, url, kwargs)
+        done, _ = wait([primary], timeout=hedge.delay(url))
+        if done or not hedge.try_acquire_hedge():
+            return primary.result()
+
+        backup = self._get_executor().submit(self._timed_send, hedge, method, url, kwargs)
+        pending = {primary, backup}
+        failed = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    # The slower attempt finishes in the background and returns its connection to the pool
+                    return future.result()
+                failed = future
+        return failed.result()
+
+    def _send_once(self, method: str, url: str, kwargs: Dict[str, Any]) -> requests.Response:
+        limiter = self.rate_limiter
+        if limiter is None:
+            return self.transport.send(method, url, **kwargs)
+        limiter.acquire()
+        try:
+            response = self.transport.send(method, url, **kwargs)
+            limiter.record_response(response.status_code)
+            return response
+        finally:
+            limiter.release()
+
+    def post(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+        backoff_factor: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> requests.Response:
+        """Make a POST request with retry logic."""
+        data['origin'] = f'python-sdk@{version}'
+        return self._request(
+            "POST",
+            endpoint,
+            headers=headers,
+            json=data,
+            timeout=timeout,
+            retries=retries,
+            backoff_factor=backoff_factor,
+            retry_policy=retry_policy,
+        )
 
-                if response.status_code == 502:
-                    if attempt < retries - 1:
-                        time.sleep(backoff_factor * (2 ** attempt))
-                        continue
-                
-                return response
-                
-            except requests.RequestException as e:
-                last_exception = e
-                if attempt == retries - 1:
-                    raise e
-                time.sleep(backoff_factor * (2 ** attempt))
-        
-        # This should never be reached due to the exception handling above
-        raise last_exception or Exception("Unexpected error in POST request")
-    
     def get(
         self,
         endpoint: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
-        retries: int = 3,
-        backoff_factor: float = 0.5
+        retries: Optional[int] = None,
+        backoff_factor: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
     ) -> requests.Response:
         """Make a GET request with retry logic."""
-        if headers is None:
-            headers = self._prepare_headers()
+        return self._request(
+            "GET",
+            endpoint,
+            headers=headers,
+            timeout=timeout,
+            retries=retries,
+            backoff_factor=backoff_factor,
+            retry_policy=retry_policy,
+        )
 
-        url = self._build_url(endpoint)
-        
-        last_exception = None
-        
-        for attempt in range(retries):
-            try:
-                response = requests.get(
-                    url,
-                    headers=headers,
-                    timeout=timeout
-                )
-                
-                if response.status_code == 502:
-                    if attempt < retries - 1:
-                        time.sleep(backoff_factor * (2 ** attempt))
-                        continue
-                
-                return response
-                
-            except requests.RequestException as e:
-                last_exception = e
-                if attempt == retries - 1:
-                    raise e
-                time.sleep(backoff_factor * (2 ** attempt))
-        
-        # This should never be reached due to the exception handling above
-        raise last_exception or Exception("Unexpected error in GET request")
-    
     def delete(
         self,
         endpoint: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
-        retries: int = 3,
-        backoff_factor: float = 0.5
+        retries: Optional[int] = None,
+        backoff_factor: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
     ) -> requests.Response:
         """Make a DELETE request with retry logic."""
-        if headers is None:
-            headers = self._prepare_headers()
-            
-        url = self._build_url(endpoint)
-        
-        last_exception = None
-        
-        for attempt in range(retries):
-            try:
-                response = requests.delete(
-                    url,
-                    headers=headers,
-                    timeout=timeout
-                )
-                
-                if response.status_code == 502:
-                    if attempt < retries - 1:
-                        time.sleep(backoff_factor * (2 ** attempt))
-                        continue
-                
-                return response
-                
-            except requests.RequestException as e:
-                last_exception = e
-                if attempt == retries - 1:
-                    raise e
-                time.sleep(backoff_factor * (2 ** attempt))
-        
-        # This should never be reached due to the exception handling above
-        raise last_exception or Exception("Unexpected error in DELETE request")
\ No newline at end of file
+        return self._request(
+            "DELETE",
+            endpoint,
+            headers=headers,
+            timeout=timeout,
+            retries=retries,
+            backoff_factor=backoff_factor,
+            retry_policy=retry_policy,
+        )
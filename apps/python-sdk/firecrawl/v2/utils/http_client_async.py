@@ -1,29 +1,101 @@
+import asyncio
+import time
 import httpx
 from typing import Optional, Dict, Any
 from .get_version import get_version
+from .retry import RetryBudget, RetryPolicy, resolve_retry_policy
+from .rate_limit import RateLimiter
+from . import json_codec
+from .compression import CompressionPolicy, httpx_accept_encoding
+from .hedging import HedgePolicy
+from .circuit_breaker import CircuitBreaker, endpoint_key
+from .transport import HttpxTransport, Transport
+from .documents import validate_result_mode
+from ..types import ResultMode
 
 version = get_version()
 
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+
 
 class AsyncHttpClient:
-    def __init__(self, api_key: Optional[str], api_url: str):
+    def __init__(
+        self,
+        api_key: Optional[str],
+        api_url: str,
+        *,
+        max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        compression: Optional[CompressionPolicy] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        transport: Optional[Transport] = None,
+        result_mode: ResultMode = "model",
+    ):
+        """
+        Args:
+            api_key: Firecrawl API key sent as a bearer token
+            api_url: Base URL for the Firecrawl API
+            max_connections: Maximum number of concurrent connections (None for no limit)
+            max_keepalive_connections: Maximum number of idle connections kept for reuse
+            keepalive_expiry: Seconds an idle connection is kept before being closed
+            http2: Negotiate HTTP/2 so concurrent requests multiplex over few connections
+                (requires the ``h2`` package, e.g. ``pip install firecrawl-py[http2]``)
+            retry_policy: Default retry policy; individual calls may override it
+            retry_budget: Budget capping retries across all calls made by this client
+            rate_limiter: Optional limiter every attempt waits on before being sent
+            compression: Opt-in request body compression and response encoding negotiation
+            hedge_policy: Opt-in hedging of slow GET requests
+            circuit_breaker: Opt-in per-endpoint circuit breaker; may be shared with other clients
+            transport: Replaces the network transport, e.g. ``MockTransport`` or ``CassetteTransport``
+            result_mode: How crawl, batch scrape and search results are built (see ``ResultMode``)
+        """
+        validate_result_mode(result_mode)
         self.api_key = api_key
         self.api_url = api_url
+        self.http2 = http2
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_budget = retry_budget or RetryBudget()
+        self.rate_limiter = rate_limiter
+        self.compression = compression
+        self.hedge_policy = hedge_policy
+        self.circuit_breaker = circuit_breaker
+        self.result_mode = result_mode
         headers = {
             "Content-Type": "application/json",
         }
 
         if api_key:
             headers["Authorization"] = f"Bearer {api_key}"
+        if compression is not None and compression.negotiate_responses:
+            headers["Accept-Encoding"] = httpx_accept_encoding()
 
         self._client = httpx.AsyncClient(
             base_url=api_url,
             headers=headers,
-            limits=httpx.Limits(max_keepalive_connections=0),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=http2,
         )
+        # Looked up on every call so the underlying httpx client can be swapped
+        default_transport = HttpxTransport(lambda: self._client)
+        if transport is not None:
+            transport.bind(default_transport)
+        self.transport = transport or default_transport
 
     async def close(self) -> None:
         await self._client.aclose()
+        self.transport.close()
 
     def _headers(self, idempotency_key: Optional[str] = None) -> Dict[str, str]:
         headers: Dict[str, str] = {}
@@ -31,20 +103,133 @@ class AsyncHttpClient:
             headers["x-idempotency-key"] = idempotency_key
         return headers
 
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> httpx.Response:
+        policy = resolve_retry_policy(self.retry_policy, retry_policy)
+        kwargs: Dict[str, Any] = {
+            "headers": {**self._headers(), **(headers or {})},
+            "timeout": timeout,
+        }
+        if json is not None:
+            body = json_codec.dumps(json)
+            if self.compression is not None:
+                body, encoding = self.compression.encode(body)
+                if encoding is not None:
+                    kwargs["headers"]["Content-Encoding"] = encoding
+            kwargs["content"] = body
+
+        breaker = self.circuit_breaker
+        circuit = endpoint_key(endpoint) if breaker is not None else None
+        self.retry_budget.record_request()
+        attempt = 0
+        while True:
+            if breaker is not None:
+                breaker.before_request(circuit)
+            try:
+                response = await self._send(method, endpoint, kwargs)
+            except httpx.TransportError:
+                if breaker is not None:
+                    breaker.record_failure(circuit)
+                if (
+                    not policy.retry_on_network_errors
+                    or not policy.can_retry(attempt)
+                    or not self.retry_budget.try_acquire()
+                ):
+                    raise
+                await asyncio.sleep(policy.backoff(attempt))
+                attempt += 1
+                continue
+
+            if breaker is not None:
+                breaker.record_response(circuit, response.status_code)
+            if policy.is_retryable_status(method, response.status_code) and policy.can_retry(attempt):
+                delay = policy.delay_for_response(attempt, response.headers)
+                if delay is not None and self.retry_budget.try_acquire():
+                    await response.aclose()
+                    await asyncio.sleep(delay)
+                    attempt += 1
+                    continue
+
+            return response
+
+    async def _send(self, method: str, endpoint: str, kwargs: Dict[str, Any]) -> httpx.Response:
+        hedge = self.hedge_policy
+        if hedge is None or not hedge.applies_to(method):
+            return await self._send_once(method, endpoint, kwargs)
+        return await self._send_hedged(hedge, method, endpoint, kwargs)
+
+    async def _timed_send(
+        self, hedge: HedgePolicy, method: str, endpoint: str, kwargs: Dict[str, Any]
+    ) -> httpx.Response:
+        started = time.monotonic()
+        response = await self._send_once(method, endpoint, kwargs)
+        hedge.record_latency(endpoint, time.monotonic() - started)
+        return response
+
+    async def _send_hedged(
+        self, hedge: HedgePolicy, method: str, endpoint: str, kwargs: Dict[str, Any]
+    ) -> httpx.Response:
+        """Send a request and, if it is slower than the hedge delay, race a duplicate against it."""
+        hedge.record_request()
+        tasks = [asyncio.ensure_future(self._timed_send(hedge, method, endpoint, kwargs))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedge.delay(endpoint))
+            if done or not hedge.try_acquire_hedge():
+                return await tasks[0]
+
+            tasks.append(asyncio.ensure_future(self._timed_send(hedge, method, endpoint, kwargs)))
+            pending = set(tasks)
+            failed = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    failed = task
+            return failed.result()
+        finally:
+            # Cancel the losing attempt (or everything, if the caller was cancelled)
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _send_once(self, method: str, endpoint: str, kwargs: Dict[str, Any]) -> httpx.Response:
+        limiter = self.rate_limiter
+        if limiter is None:
+            return await self.transport.asend(method, endpoint, **kwargs)
+        await limiter.acquire_async()
+        try:
+            response = await self.transport.asend(method, endpoint, **kwargs)
+            limiter.record_response(response.status_code)
+            return response
+        finally:
+            limiter.release()
+
     async def post(
         self,
         endpoint: str,
         data: Dict[str, Any],
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
     ) -> httpx.Response:
         payload = dict(data)
         payload["origin"] = f"python-sdk@{version}"
-        return await self._client.post(
+        return await self._request(
+            "POST",
             endpoint,
+            headers=headers,
             json=payload,
-            headers={**self._headers(), **(headers or {})},
             timeout=timeout,
+            retry_policy=retry_policy,
         )
 
     async def get(
@@ -52,9 +237,10 @@ class AsyncHttpClient:
         endpoint: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
     ) -> httpx.Response:
-        return await self._client.get(
-            endpoint, headers={**self._headers(), **(headers or {})}, timeout=timeout
+        return await self._request(
+            "GET", endpoint, headers=headers, timeout=timeout, retry_policy=retry_policy
         )
 
     async def delete(
@@ -62,8 +248,8 @@ class AsyncHttpClient:
         endpoint: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
     ) -> httpx.Response:
-        return await self._client.delete(
-            endpoint, headers={**self._headers(), **(headers or {})}, timeout=timeout
+        return await self._request(
+            "DELETE", endpoint, headers=headers, timeout=timeout, retry_policy=retry_policy
         )
-
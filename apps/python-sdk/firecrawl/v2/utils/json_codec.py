@@ -0,0 +1,89 @@
+"""
+Pluggable JSON codec used to encode request bodies and decode API responses.
+
+``orjson`` is used when installed (``pip install firecrawl-py[fast]``); otherwise
+the stdlib ``json`` module is used.
+"""
+
+import json
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+JsonInput = Union[bytes, bytearray, memoryview, str]
+
+
+class JsonCodec:
+    """Stdlib JSON codec. Subclass and override ``dumps``/``loads`` to plug in another backend."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, allow_nan=False).encode("utf-8")
+
+    def loads(self, data: JsonInput) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """Codec backed by ``orjson``, which parses raw response bytes without decoding to ``str`` first."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError("orjson is not installed; install it with `pip install orjson`")
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Integers beyond 64 bits and other types orjson rejects
+            return super().dumps(obj)
+
+    def loads(self, data: JsonInput) -> Any:
+        return orjson.loads(data)
+
+
+def _default_codec() -> JsonCodec:
+    return OrjsonCodec() if orjson is not None else JsonCodec()
+
+
+_codec: JsonCodec = _default_codec()
+
+
+def get_json_codec() -> JsonCodec:
+    """Return the codec currently used by the SDK."""
+    return _codec
+
+
+def set_json_codec(codec: Optional[JsonCodec]) -> None:
+    """Install a codec process-wide; ``None`` restores the default (orjson if available)."""
+    global _codec
+    _codec = codec if codec is not None else _default_codec()
+
+
+def dumps(obj: Any) -> bytes:
+    return _codec.dumps(obj)
+
+
+def loads(data: JsonInput) -> Any:
+    return _codec.loads(data)
+
+
+def decode_response(response: Any) -> Any:
+    """
+    Decode a JSON response body with the active codec.
+
+    Works on the raw body bytes when the response exposes them (``requests`` and
+    ``httpx`` responses) and falls back to ``response.json()`` otherwise.
+    """
+    content = getattr(response, "content", None)
+    if isinstance(content, (bytes, bytearray)):
+        return _codec.loads(content)
+    return response.json()
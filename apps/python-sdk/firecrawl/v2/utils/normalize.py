@@ -1,66 +1,114 @@
 """
-Normalization helpers for v2 API payloads to avoid relying on Pydantic aliases.
+Normalization helpers converting v2 API payloads to the SDK's snake_case keys.
+
+Response documents are normalized before they are validated, and plain-dict results
+use the same keys. Key tables are built once at import.
 """
 
-from typing import Any, Dict, List
+import re
+import sys
+from typing import Any, Dict, Mapping
 from ..types import DocumentMetadata
 
+# DocumentMetadata field names by API (camelCase) key
+_METADATA_KEY_NAMES: Dict[str, str] = {
+    # OpenGraph
+    "ogTitle": "og_title",
+    "ogDescription": "og_description",
+    "ogUrl": "og_url",
+    "ogImage": "og_image",
+    "ogAudio": "og_audio",
+    "ogDeterminer": "og_determiner",
+    "ogLocale": "og_locale",
+    "ogLocaleAlternate": "og_locale_alternate",
+    "ogSiteName": "og_site_name",
+    "ogVideo": "og_video",
+    # Dublin Core and misc
+    "dcTermsCreated": "dc_terms_created",
+    "dcDateCreated": "dc_date_created",
+    "dcDate": "dc_date",
+    "dcTermsType": "dc_terms_type",
+    "dcType": "dc_type",
+    "dcTermsAudience": "dc_terms_audience",
+    "dcTermsSubject": "dc_terms_subject",
+    "dcSubject": "dc_subject",
+    "dcDescription": "dc_description",
+    "dcTermsKeywords": "dc_terms_keywords",
+    "modifiedTime": "modified_time",
+    "publishedTime": "published_time",
+    "articleTag": "article_tag",
+    "articleSection": "article_section",
+    # Response-level
+    "sourceURL": "source_url",
+    "statusCode": "status_code",
+    "scrapeId": "scrape_id",
+    "numPages": "num_pages",
+    "contentType": "content_type",
+    "proxyUsed": "proxy_used",
+    "cacheState": "cache_state",
+    "cachedAt": "cached_at",
+    "creditsUsed": "credits_used",
+    "concurrencyLimited": "concurrency_limited",
+    "concurrencyQueueDurationMs": "concurrency_queue_duration_ms",
+}
+_DOCUMENT_KEY_NAMES = {"rawHtml": "raw_html", "changeTracking": "change_tracking"}
+_BRANDING_KEY_NAMES = {"colorScheme": "color_scheme"}
+_SEARCH_RESULT_KEY_NAMES: Dict[str, Dict[str, str]] = {
+    "images": {"imageUrl": "image_url", "imageWidth": "image_width", "imageHeight": "image_height"},
+    "news": {"imageUrl": "image_url"},
+}
+
+# Words of a camelCase key: "expires|At", "source|URL", "ignore|Invalid|URLs"
+_CAMEL_WORDS = re.compile(r"[A-Z]{2,}s?(?![a-z])|[A-Z]?[a-z0-9]+|[A-Z]+")
+_SNAKE_CASE_KEYS: Dict[str, str] = {}
+_SNAKE_CASE_CACHE_SIZE = 4096
+
+
+def snake_case_key(key: str) -> str:
+    """
+    snake_case form of an API key (``"creditsUsed"`` -> ``"credits_used"``).
+
+    Results are interned and cached, so converting the same key again is a dict lookup.
+    """
+    name = _SNAKE_CASE_KEYS.get(key)
+    if name is None:
+        name = key if key.islower() else "_".join(word.lower() for word in _CAMEL_WORDS.findall(key))
+        name = sys.intern(name)
+        if len(_SNAKE_CASE_KEYS) < _SNAKE_CASE_CACHE_SIZE:
+            _SNAKE_CASE_KEYS[key] = name
+    return name
+
+
+def _translate_keys(data: Mapping[str, Any], names: Mapping[str, str]) -> Dict[str, Any]:
+    """
+    Copy of ``data`` with keys renamed by ``names``; other keys are kept as-is.
+
+    A renamed key never overwrites a key that ``data`` already holds under the new name.
+    """
+    out: Dict[str, Any] = {}
+    for key, value in data.items():
+        out[names.get(key, key)] = value
+    if len(out) < len(data):
+        # Both spellings were present: the snake_case one wins, the API key is kept as-is
+        out = {}
+        for key, value in data.items():
+            name = names.get(key, key)
+            out[key if name != key and name in data else name] = value
+    return out
+
 
 def _map_metadata_keys(md: Dict[str, Any]) -> Dict[str, Any]:
     """
     Convert API v2 camelCase metadata keys to snake_case expected by DocumentMetadata.
     Leaves unknown keys as-is.
     """
-    mapping = {
-        # OpenGraph
-        "ogTitle": "og_title",
-        "ogDescription": "og_description",
-        "ogUrl": "og_url",
-        "ogImage": "og_image",
-        "ogAudio": "og_audio",
-        "ogDeterminer": "og_determiner",
-        "ogLocale": "og_locale",
-        "ogLocaleAlternate": "og_locale_alternate",
-        "ogSiteName": "og_site_name",
-        "ogVideo": "og_video",
-        # Dublin Core and misc
-        "dcTermsCreated": "dc_terms_created",
-        "dcDateCreated": "dc_date_created",
-        "dcDate": "dc_date",
-        "dcTermsType": "dc_terms_type",
-        "dcType": "dc_type",
-        "dcTermsAudience": "dc_terms_audience",
-        "dcTermsSubject": "dc_terms_subject",
-        "dcSubject": "dc_subject",
-        "dcDescription": "dc_description",
-        "dcTermsKeywords": "dc_terms_keywords",
-        "modifiedTime": "modified_time",
-        "publishedTime": "published_time",
-        "articleTag": "article_tag",
-        "articleSection": "article_section",
-        # Response-level
-        "sourceURL": "source_url",
-        "statusCode": "status_code",
-        "scrapeId": "scrape_id",
-        "numPages": "num_pages",
-        "contentType": "content_type",
-        "proxyUsed": "proxy_used",
-        "cacheState": "cache_state",
-        "cachedAt": "cached_at",
-        "creditsUsed": "credits_used",
-        "concurrencyLimited": "concurrency_limited",
-        "concurrencyQueueDurationMs": "concurrency_queue_duration_ms",
-    }
-
-    out: Dict[str, Any] = {}
-    for k, v in md.items():
-        snake = mapping.get(k, k)
-        out[snake] = v
+    out = _translate_keys(md, _METADATA_KEY_NAMES)
 
     # Light coercions where server may send strings/lists
-    if isinstance(out.get("status_code"), str):
+    status_code = out.get("status_code")
+    if isinstance(status_code, str):
         try:
-            out["status_code"] = int(out["status_code"])  # type: ignore
+            out["status_code"] = int(status_code)
         except ValueError:
             pass
 
@@ -68,58 +116,57 @@ def _map_metadata_keys(md: Dict[str, Any]) -> Dict[str, Any]:
     return out
 
 
-def normalize_document_input(doc: Dict[str, Any]) -> Dict[str, Any]:
+def normalize_document_keys(doc: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Normalize a raw Document dict from the API into the Python SDK's expected shape:
+    Copy of a raw Document dict from the API with snake_case keys, as plain dicts:
     - Convert top-level keys rawHtml->raw_html, changeTracking->change_tracking
     - Convert metadata keys from camelCase to snake_case
     - Convert branding.colorScheme to branding.color_scheme
     """
-    normalized = dict(doc)
+    normalized = _translate_keys(doc, _DOCUMENT_KEY_NAMES)
 
-    if "rawHtml" in normalized and "raw_html" not in normalized:
-        normalized["raw_html"] = normalized.pop("rawHtml")
+    md = normalized.get("metadata")
+    if isinstance(md, dict):
+        normalized["metadata"] = _map_metadata_keys(md)
+
+    # Normalize branding top-level camelCase keys
+    branding = normalized.get("branding")
+    if isinstance(branding, dict) and "colorScheme" in branding:
+        normalized["branding"] = _translate_keys(branding, _BRANDING_KEY_NAMES)
+
+    return normalized
 
-    if "changeTracking" in normalized and "change_tracking" not in normalized:
-        normalized["change_tracking"] = normalized.pop("changeTracking")
+
+def normalize_document_input(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize a raw Document dict from the API into the Python SDK's expected shape:
+    snake_case keys (see ``normalize_document_keys``) and a typed ``DocumentMetadata``.
+    """
+    normalized = normalize_document_keys(doc)
 
     md = normalized.get("metadata")
     if isinstance(md, dict):
-        mapped = _map_metadata_keys(md)
         # Construct a typed DocumentMetadata; extras allowed/preserved
         try:
-            normalized["metadata"] = DocumentMetadata.model_validate(mapped)
+            normalized["metadata"] = DocumentMetadata.model_validate(md)
         except Exception:
-            normalized["metadata"] = mapped
-
-    # Normalize branding top-level camelCase keys
-    branding = normalized.get("branding")
-    if isinstance(branding, dict):
-        if "colorScheme" in branding and "color_scheme" not in branding:
-            branding["color_scheme"] = branding.pop("colorScheme")
+            pass
 
     return normalized
 
 
 def _map_search_result_keys(result: Dict[str, Any], result_type: str) -> Dict[str, Any]:
-    if result_type == "images":
-        mapping = {
-            "imageUrl": "image_url",
-            "imageWidth": "image_width",
-            "imageHeight": "image_height",
-        }
-    elif result_type == "news":
-        mapping = {
-            "imageUrl": "image_url",
-        }
-    elif result_type == "web":
-        mapping = {}
-    else:
-        mapping = {}
+    return _translate_keys(result, _SEARCH_RESULT_KEY_NAMES.get(result_type, {}))
 
-    out: Dict[str, Any] = {}
-    for k, v in result.items():
-        snake = mapping.get(k, k)
-        out[snake] = v
 
+def normalize_payload_keys(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy of a response payload with a snake_case entry added for every camelCase key
+    (``expiresAt`` -> ``expires_at``); the original keys are kept.
+    """
+    out = dict(payload)
+    for key, value in payload.items():
+        name = snake_case_key(key)
+        if name != key:
+            out.setdefault(name, value)
     return out
@@ -0,0 +1,507 @@
+"""
+Streaming pagination over crawl and batch scrape status pages.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode, urlparse
+
+from ..types import Document, PaginationConfig, ResultMode
+from .error_handler import handle_response_error
+from .json_codec import decode_response
+from .checkpoint import Checkpoint, CheckpointStore
+from .documents import build_documents, client_result_mode
+from .polling import TERMINAL_STATUSES, next_skip
+
+logger = logging.getLogger("firecrawl")
+
+_DONE = object()
+
+
+class _Failure:
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def _first_page(response: Any, ok: bool, action: str) -> Dict[str, Any]:
+    if not ok:
+        handle_response_error(response, action)
+    page = decode_response(response)
+    if not page.get("success"):
+        raise Exception(page.get("error", "Unknown error occurred"))
+    return page
+
+
+def _following_page(response: Any, ok: bool) -> Optional[Dict[str, Any]]:
+    if not ok:
+        logger.warning("Failed to fetch next page", extra={"status_code": response.status_code})
+        return None
+    page = decode_response(response)
+    return page if page.get("success") else None
+
+
+class _PageLimits:
+    """``PaginationConfig`` limits on follow-up pages and the ``skip`` cursor they must advance."""
+
+    def __init__(self, pagination_config: Optional[PaginationConfig], start_url: Optional[str] = None):
+        self.auto_paginate = pagination_config.auto_paginate if pagination_config else True
+        self.max_pages = pagination_config.max_pages if pagination_config else None
+        self.max_wait_time = pagination_config.max_wait_time if pagination_config else None
+        self.start_time = time.monotonic()
+        self.page_count = 0
+        self.cursor = next_skip(start_url) or 0
+
+    def allows(self, next_url: Optional[str]) -> bool:
+        if not self.auto_paginate or not next_url:
+            return False
+        following = next_skip(next_url)
+        if following is not None:
+            # A running job keeps returning the same cursor until it has new results
+            if following <= self.cursor:
+                return False
+            self.cursor = following
+        if self.max_pages is not None and self.page_count >= self.max_pages:
+            return False
+        if self.max_wait_time is not None and (time.monotonic() - self.start_time) > self.max_wait_time:
+            return False
+        return True
+
+
+def _documents(page: Dict[str, Any]) -> Iterable[Any]:
+    # Take the raw documents out of the page so they are released once consumed
+    return page.pop("data", None) or []
+
+
+def _page_documents(
+    page: Dict[str, Any], mode: ResultMode, max_results: Optional[int], count: int
+) -> Tuple[List[Any], bool]:
+    """A page's documents up to ``max_results``, and whether the page was cut short by it."""
+    raws = [doc for doc in _documents(page) if isinstance(doc, dict)]
+    remaining = None if max_results is None else max_results - count
+    return build_documents(raws, mode, limit=remaining), remaining is not None and len(raws) > remaining
+
+
+def _resume(store: Optional[CheckpointStore], key: Optional[str]) -> Tuple[int, Optional[str]]:
+    if store is None:
+        return 0, None
+    if key is None:
+        raise ValueError("checkpoint_key is required with a checkpoint_store")
+    saved = store.load(key)
+    return (saved.documents, saved.next_url) if saved is not None else (0, None)
+
+
+def _checkpoint(store: Optional[CheckpointStore], key: Optional[str], next_url: Optional[str], count: int) -> None:
+    if store is None:
+        return
+    if next_url:
+        store.save(key, Checkpoint(next_url, count))
+    else:
+        store.delete(key)
+
+
+def iter_status_pages(
+    client: Any,
+    path: str,
+    action: str,
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    request_timeout: Optional[float] = None,
+    start_url: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the decoded status pages of a job, following ``next`` links.
+
+    The first page (``path``, or ``start_url`` when resuming from a saved ``next``
+    link) raises on errors like ``get_*_status``; a failing follow-up page ends the
+    iteration with a warning, matching the list-based pagination helpers.
+    ``max_pages`` and ``max_wait_time`` count follow-up pages only and
+    ``auto_paginate=False`` stops after the first page. A ``next`` link that does
+    not advance the ``skip`` cursor, as returned while a job has no new results
+    yet, also ends the iteration.
+    """
+    response = client.get(start_url or path, timeout=request_timeout)
+    page = _first_page(response, response.ok, action)
+    limits = _PageLimits(pagination_config, start_url)
+    while page is not None:
+        next_url = page.get("next")
+        yield page
+        if not limits.allows(next_url):
+            return
+        # Drop the previous page before fetching the next one so only one is held
+        page = None
+        response = client.get(next_url, timeout=request_timeout)
+        page = _following_page(response, response.ok)
+        limits.page_count += 1
+
+
+def iter_status_documents(
+    client: Any,
+    path: str,
+    action: str,
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    request_timeout: Optional[float] = None,
+    checkpoint_store: Optional[CheckpointStore] = None,
+    checkpoint_key: Optional[str] = None,
+) -> Iterator[Document]:
+    """
+    Yield the documents of a job page by page, stopping after ``max_results`` documents.
+
+    With a ``checkpoint_store``, the ``next`` link and document count are saved under
+    ``checkpoint_key`` each time a page has been consumed, and a later call resumes
+    from the saved link. Documents of a page that was only partly consumed are
+    yielded again on resume. The checkpoint is deleted once the last page was consumed.
+    """
+    max_results = pagination_config.max_results if pagination_config else None
+    mode = client_result_mode(client)
+    count, start_url = _resume(checkpoint_store, checkpoint_key)
+    pages = iter_status_pages(
+        client, path, action, pagination_config, request_timeout=request_timeout, start_url=start_url
+    )
+    for page in pages:
+        next_url = page.get("next")
+        documents, truncated = _page_documents(page, mode, max_results, count)
+        for document in documents:
+            yield document
+            count += 1
+        if truncated:
+            return
+        _checkpoint(checkpoint_store, checkpoint_key, next_url, count)
+        if max_results is not None and count >= max_results:
+            return
+
+
+async def aiter_status_pages(
+    client: Any,
+    path: str,
+    action: str,
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    request_timeout: Optional[float] = None,
+    prefetch: int = 1,
+    start_url: Optional[str] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Async variant of ``iter_status_pages`` keeping up to ``prefetch`` page requests in flight.
+
+    When the first page shows the job has finished, the remaining pages are requested
+    by offset in ``page_size`` chunks (see ``plan_page_slots``), ``prefetch`` at a time,
+    and yielded in listing order with ``next`` links pointing at the following offset.
+    A running job's pages can only be reached through ``next`` links, so they are
+    followed one request at a time while up to ``prefetch`` decoded pages are buffered
+    ahead of the consumer. Background requests are cancelled when the iterator is
+    closed early.
+    """
+    if prefetch < 1:
+        raise ValueError("prefetch must be at least 1")
+    queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=prefetch)
+
+    async def follow_next_links(page: Optional[Dict[str, Any]]) -> None:
+        limits = _PageLimits(pagination_config, start_url)
+        while page is not None:
+            next_url = page.get("next")
+            await queue.put(page)
+            if not limits.allows(next_url):
+                return
+            page = None
+            response = await client.get(next_url, timeout=request_timeout)
+            page = _following_page(response, response.status_code < 400)
+            limits.page_count += 1
+
+    async def fetch_slots(first_page: Dict[str, Any], slots: List[Slot], config: PaginationConfig) -> None:
+        next_url = first_page["next"]
+        total = first_page["total"]
+        deadline = _deadline(config)
+        semaphore = asyncio.Semaphore(prefetch)
+        template = {key: value for key, value in first_page.items() if key not in ("data", "next")}
+        pending: Deque[Tuple[Slot, "asyncio.Future[SlotResult]"]] = deque()
+        remaining = iter(slots)
+
+        def start_next() -> None:
+            slot = next(remaining, None)
+            if slot is not None:
+                fetch = _fetch_slot_async(client, next_url, slot, deadline, request_timeout, semaphore)
+                pending.append((slot, asyncio.ensure_future(fetch)))
+
+        for _ in range(prefetch):
+            start_next()
+        try:
+            await queue.put(first_page)
+            while pending:
+                (skip, end), task = pending.popleft()
+                result = await task
+                start_next()
+                if result is None:
+                    return
+                docs, complete = result
+                following = end if complete else skip + len(docs)
+                page_next = _page_url(next_url, following, config.page_size) if following < total else None
+                await queue.put({**template, "data": docs, "next": page_next})
+                if not complete:
+                    return
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+    async def produce() -> None:
+        try:
+            response = await client.get(start_url or path, timeout=request_timeout)
+            page = _first_page(response, response.status_code < 400, action)
+            config = pagination_config or PaginationConfig()
+            slots = plan_page_slots(page, len(page.get("data") or []), config, concurrency=prefetch)
+            if slots is None:
+                await follow_next_links(page)
+            else:
+                await fetch_slots(page, slots, config)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            await queue.put(_Failure(exc))
+            return
+        await queue.put(_DONE)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        if not producer.done():
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
+
+
+async def aiter_status_documents(
+    client: Any,
+    path: str,
+    action: str,
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    request_timeout: Optional[float] = None,
+    prefetch: int = 1,
+    checkpoint_store: Optional[CheckpointStore] = None,
+    checkpoint_key: Optional[str] = None,
+) -> AsyncIterator[Document]:
+    """Async variant of ``iter_status_documents``; see ``aiter_status_pages`` for ``prefetch``."""
+    max_results = pagination_config.max_results if pagination_config else None
+    mode = client_result_mode(client)
+    count, start_url = _resume(checkpoint_store, checkpoint_key)
+    pages = aiter_status_pages(
+        client,
+        path,
+        action,
+        pagination_config,
+        request_timeout=request_timeout,
+        prefetch=prefetch,
+        start_url=start_url,
+    )
+    try:
+        async for page in pages:
+            next_url = page.get("next")
+            documents, truncated = _page_documents(page, mode, max_results, count)
+            for document in documents:
+                yield document
+                count += 1
+            if truncated:
+                return
+            _checkpoint(checkpoint_store, checkpoint_key, next_url, count)
+            if max_results is not None and count >= max_results:
+                return
+    finally:
+        await pages.aclose()
+
+
+# Page slots: (skip, end) offset ranges of the listing, fetched independently
+Slot = Tuple[int, int]
+# Slot result: raw documents and whether the slot completed; None when skipped
+SlotResult = Optional[Tuple[List[Any], bool]]
+
+
+def _page_url(next_url: str, skip: int, limit: int) -> str:
+    return urlparse(next_url)._replace(query=urlencode({"skip": skip, "limit": limit})).geturl()
+
+
+def plan_page_slots(
+    first_page: Dict[str, Any],
+    fetched: int,
+    pagination_config: Optional[PaginationConfig],
+    concurrency: Optional[int] = None,
+) -> Optional[List[Slot]]:
+    """
+    Offset ranges covering the rest of a finished job's results, or None when the
+    pages must be followed sequentially.
+
+    Only finished jobs are split: their listing no longer grows, so ``total`` bounds
+    the offsets and every range can be requested with explicit ``skip``/``limit``.
+    ``concurrency`` overrides ``max_concurrent_pages``; ranges are only worth planning
+    when at least two can be fetched at once.
+    """
+    if not pagination_config or not pagination_config.auto_paginate:
+        return None
+    if concurrency is None:
+        concurrency = pagination_config.max_concurrent_pages
+    if concurrency is None or concurrency < 2 or first_page.get("status") not in TERMINAL_STATUSES:
+        return None
+    start = next_skip(first_page.get("next"))
+    total = first_page.get("total")
+    # Without a cursor or a total the offsets are unknown
+    if start is None or not isinstance(total, int):
+        return None
+    page_size = pagination_config.page_size
+    slots = [(skip, min(skip + page_size, total)) for skip in range(start, total, page_size)]
+    if pagination_config.max_pages is not None:
+        slots = slots[: pagination_config.max_pages]
+    if pagination_config.max_results is not None:
+        remaining = max(0, pagination_config.max_results - fetched)
+        slots = slots[: -(-remaining // page_size)]
+    return slots
+
+
+def _deadline(pagination_config: PaginationConfig) -> Optional[float]:
+    if pagination_config.max_wait_time is None:
+        return None
+    return time.monotonic() + pagination_config.max_wait_time
+
+
+def _advance(page: Dict[str, Any], skip: int, docs: List[Any]) -> Optional[int]:
+    docs.extend(_documents(page))
+    following = next_skip(page.get("next"))
+    # A page cut short by the response size cap continues at its next offset
+    return following if following is not None and following > skip else None
+
+
+def _fetch_slot(
+    client: Any,
+    next_url: str,
+    slot: Slot,
+    deadline: Optional[float],
+    request_timeout: Optional[float],
+) -> SlotResult:
+    if deadline is not None and time.monotonic() > deadline:
+        return None
+    skip, end = slot
+    docs: List[Any] = []
+    while skip < end:
+        response = client.get(_page_url(next_url, skip, end - skip), timeout=request_timeout)
+        page = _following_page(response, response.ok)
+        if page is None:
+            return docs, False
+        following = _advance(page, skip, docs)
+        if following is None:
+            break
+        skip = following
+    return docs, True
+
+
+async def _fetch_slot_async(
+    client: Any,
+    next_url: str,
+    slot: Slot,
+    deadline: Optional[float],
+    request_timeout: Optional[float],
+    semaphore: asyncio.Semaphore,
+) -> SlotResult:
+    async with semaphore:
+        if deadline is not None and time.monotonic() > deadline:
+            return None
+        skip, end = slot
+        docs: List[Any] = []
+        while skip < end:
+            response = await client.get(_page_url(next_url, skip, end - skip), timeout=request_timeout)
+            page = _following_page(response, response.status_code < 400)
+            if page is None:
+                return docs, False
+            following = _advance(page, skip, docs)
+            if following is None:
+                break
+            skip = following
+        return docs, True
+
+
+def _assemble(
+    documents: List[Document],
+    results: Iterable[SlotResult],
+    pagination_config: PaginationConfig,
+    mode: ResultMode = "model",
+) -> List[Document]:
+    documents = documents.copy()
+    max_results = pagination_config.max_results
+    for result in results:
+        if result is None:
+            break
+        docs, complete = result
+        remaining = None if max_results is None else max_results - len(documents)
+        documents.extend(build_documents(docs, mode, limit=remaining))
+        if max_results is not None and len(documents) >= max_results:
+            return documents
+        # Like sequential pagination, a failed page ends the results
+        if not complete:
+            break
+    return documents
+
+
+def fetch_pages_parallel(
+    client: Any,
+    first_page: Dict[str, Any],
+    documents: List[Document],
+    pagination_config: Optional[PaginationConfig],
+    *,
+    request_timeout: Optional[float] = None,
+    result_mode: Optional[ResultMode] = None,
+) -> Optional[List[Document]]:
+    """
+    Fetch the remaining pages of a finished job concurrently and return all documents
+    in listing order, or None when ``pagination_config`` does not enable it.
+
+    Up to ``max_concurrent_pages`` pages of ``page_size`` results are requested at
+    once; ``max_pages``, ``max_results`` and ``max_wait_time`` are honoured.
+    ``result_mode`` overrides the client's result mode.
+    """
+    slots = plan_page_slots(first_page, len(documents), pagination_config)
+    if slots is None:
+        return None
+    next_url = first_page["next"]
+    deadline = _deadline(pagination_config)
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(pagination_config.max_concurrent_pages, len(slots))),
+        thread_name_prefix="firecrawl-pages",
+    ) as executor:
+        results = list(
+            executor.map(lambda slot: _fetch_slot(client, next_url, slot, deadline, request_timeout), slots)
+        )
+    return _assemble(documents, results, pagination_config, client_result_mode(client, result_mode))
+
+
+async def fetch_pages_parallel_async(
+    client: Any,
+    first_page: Dict[str, Any],
+    documents: List[Document],
+    pagination_config: Optional[PaginationConfig],
+    *,
+    request_timeout: Optional[float] = None,
+    result_mode: Optional[ResultMode] = None,
+) -> Optional[List[Document]]:
+    """Async variant of ``fetch_pages_parallel``."""
+    slots = plan_page_slots(first_page, len(documents), pagination_config)
+    if slots is None:
+        return None
+    next_url = first_page["next"]
+    deadline = _deadline(pagination_config)
+    semaphore = asyncio.Semaphore(pagination_config.max_concurrent_pages)
+    results = await asyncio.gather(
+        *(_fetch_slot_async(client, next_url, slot, deadline, request_timeout, semaphore) for slot in slots)
+    )
+    return _assemble(documents, results, pagination_config, client_result_mode(client, result_mode))
@@ -0,0 +1,286 @@
+"""
+Status polling strategies shared by the crawl and batch scrape wait helpers.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from ..types import Document, ResultMode
+from .error_handler import handle_response_error
+from .json_codec import decode_response
+from .documents import build_documents, client_result_mode
+
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+POLL_MODES = ("full", "counters", "incremental")
+
+
+class PollSession:
+    """Poll timing state of one job; created by ``AdaptivePollScheduler.session``."""
+
+    def __init__(self, scheduler: "AdaptivePollScheduler"):
+        self._scheduler = scheduler
+        self._interval: Optional[float] = None
+        self._last_time: Optional[float] = None
+        self._last_completed: Optional[int] = None
+        self._rate: Optional[float] = None
+
+    def next_interval(self, completed: Optional[int] = None, total: Optional[int] = None) -> float:
+        """Seconds to wait before the next poll, given the latest progress counters (if the job reports any)."""
+        scheduler = self._scheduler
+        now = time.monotonic()
+        if completed is not None and self._last_completed is not None and self._last_time is not None:
+            elapsed = now - self._last_time
+            if elapsed > 0:
+                observed = max(0, completed - self._last_completed) / elapsed
+                self._rate = observed if self._rate is None else (
+                    scheduler.smoothing * observed + (1 - scheduler.smoothing) * self._rate
+                )
+        if completed is not None:
+            self._last_completed = completed
+            self._last_time = now
+
+        remaining = (total - completed) if (total and completed is not None) else None
+        if self._interval is None:
+            interval = scheduler.initial_interval
+        elif remaining is not None and remaining > 0 and self._rate:
+            # Poll a fraction of the estimated time left: rarely in long phases, often near the end
+            interval = scheduler.eta_fraction * remaining / self._rate
+        else:
+            # No counters or no progress: back off geometrically
+            interval = self._interval * scheduler.backoff
+        self._interval = min(scheduler.max_interval, max(scheduler.min_interval, interval))
+        return self._interval
+
+
+class AdaptivePollScheduler:
+    """
+    Chooses poll intervals from a job's progress instead of a fixed ``poll_interval``.
+
+    The completion rate is estimated from successive ``completed`` readings
+    (exponentially smoothed) and the next poll is scheduled after ``eta_fraction``
+    of the estimated time left, so polls are frequent as a job nears completion
+    and sparse during long steady phases. Without progress counters, or while a
+    job makes no progress, the interval grows by ``backoff`` per poll. Intervals
+    always stay within ``[min_interval, max_interval]``.
+
+    One scheduler can be passed to any number of waits; each wait keeps its own state.
+
+    Args:
+        min_interval: Shortest interval between polls, in seconds
+        max_interval: Longest interval between polls, in seconds
+        initial_interval: Interval before the first progress reading
+        eta_fraction: Fraction of the estimated time left to wait
+        backoff: Growth factor of the interval while no progress rate is known
+        smoothing: Weight of the latest rate observation (0-1]
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 0.25,
+        max_interval: float = 30.0,
+        initial_interval: float = 0.5,
+        eta_fraction: float = 0.5,
+        backoff: float = 1.5,
+        smoothing: float = 0.5,
+    ):
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("min_interval must be positive and not above max_interval")
+        if not 0 < eta_fraction <= 1:
+            raise ValueError("eta_fraction must be in (0, 1]")
+        if backoff < 1:
+            raise ValueError("backoff must be at least 1")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in (0, 1]")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.initial_interval = initial_interval
+        self.eta_fraction = eta_fraction
+        self.backoff = backoff
+        self.smoothing = smoothing
+
+    def session(self) -> PollSession:
+        return PollSession(self)
+
+
+def poll_delay(
+    poll_interval: float,
+    session: Optional[PollSession],
+    completed: Optional[int] = None,
+    total: Optional[int] = None,
+) -> float:
+    """Fixed ``poll_interval``, or the adaptive interval when a scheduler session is active."""
+    if session is None:
+        return poll_interval
+    return session.next_interval(completed, total)
+
+
+def start_session(scheduler: Optional[AdaptivePollScheduler]) -> Optional[PollSession]:
+    return scheduler.session() if scheduler is not None else None
+
+
+def validate_poll_mode(poll_mode: str) -> None:
+    if poll_mode not in POLL_MODES:
+        raise ValueError(f"poll_mode must be one of {', '.join(POLL_MODES)}")
+
+
+def status_endpoint(path: str, *, skip: Optional[int] = None, limit: Optional[int] = None) -> str:
+    """Status URL for ``path`` (e.g. ``/v2/crawl/<id>``) with optional ``skip``/``limit`` paging."""
+    params = []
+    if skip:
+        params.append(f"skip={skip}")
+    if limit is not None:
+        params.append(f"limit={limit}")
+    return f"{path}?{'&'.join(params)}" if params else path
+
+
+def next_skip(next_url: Optional[str]) -> Optional[int]:
+    """Cursor (``skip``) encoded in a status page's ``next`` link."""
+    if not next_url:
+        return None
+    values = parse_qs(urlparse(next_url).query).get("skip")
+    try:
+        return int(values[0]) if values else None
+    except ValueError:
+        return None
+
+
+def parse_documents(body: Dict[str, Any], mode: ResultMode = "model") -> List[Document]:
+    return build_documents(body.get("data"), mode)
+
+
+def _check(response: Any, action: str) -> Dict[str, Any]:
+    if not response.ok:
+        handle_response_error(response, action)
+    body = decode_response(response)
+    if not body.get("success"):
+        raise Exception(body.get("error", "Unknown error occurred"))
+    return body
+
+
+def fetch_counters(
+    client: Any, path: str, action: str, request_timeout: Optional[float] = None
+) -> Dict[str, Any]:
+    """One ``limit=0`` status check: status and progress counters without documents."""
+    return _check(client.get(status_endpoint(path, limit=0), timeout=request_timeout), action)
+
+
+async def fetch_counters_async(
+    client: Any, path: str, action: str, request_timeout: Optional[float] = None
+) -> Dict[str, Any]:
+    return _check(await client.get(status_endpoint(path, limit=0), timeout=request_timeout), action)
+
+
+def _timed_out(start: float, timeout: Optional[float]) -> bool:
+    return timeout is not None and (time.monotonic() - start) > timeout
+
+
+def poll_counters(
+    client: Any,
+    path: str,
+    action: str,
+    poll_interval: float,
+    timeout: Optional[float],
+    timeout_message: str,
+    request_timeout: Optional[float] = None,
+    scheduler: Optional[AdaptivePollScheduler] = None,
+) -> Dict[str, Any]:
+    """Poll ``limit=0`` status pages (counters only, no documents) until the job is terminal."""
+    start = time.monotonic()
+    session = start_session(scheduler)
+    while True:
+        body = fetch_counters(client, path, action, request_timeout)
+        if body.get("status") in TERMINAL_STATUSES:
+            return body
+        if _timed_out(start, timeout):
+            raise TimeoutError(timeout_message)
+        time.sleep(poll_delay(poll_interval, session, body.get("completed"), body.get("total")))
+
+
+def poll_incremental(
+    client: Any,
+    path: str,
+    action: str,
+    poll_interval: float,
+    timeout: Optional[float],
+    timeout_message: str,
+    request_timeout: Optional[float] = None,
+    scheduler: Optional[AdaptivePollScheduler] = None,
+) -> Tuple[Dict[str, Any], List[Document]]:
+    """
+    Poll until the job is terminal, downloading every document exactly once.
+
+    Each poll resumes from the ``skip`` cursor of the previous page and drains all
+    pages that are already available before sleeping. Results are ordered by
+    completion time on the server, so the cursor never skips or repeats documents.
+    """
+    start = time.monotonic()
+    session = start_session(scheduler)
+    cursor = 0
+    documents: List[Document] = []
+    while True:
+        response = client.get(status_endpoint(path, skip=cursor), timeout=request_timeout)
+        body = _check(response, action)
+        documents.extend(parse_documents(body, client_result_mode(client)))
+        following = next_skip(body.get("next"))
+        if following is not None and following > cursor:
+            cursor = following
+            continue
+        if body.get("status") in TERMINAL_STATUSES:
+            return body, documents
+        if _timed_out(start, timeout):
+            raise TimeoutError(timeout_message)
+        time.sleep(poll_delay(poll_interval, session, body.get("completed"), body.get("total")))
+
+
+async def poll_counters_async(
+    client: Any,
+    path: str,
+    action: str,
+    poll_interval: float,
+    timeout: Optional[float],
+    timeout_message: str,
+    request_timeout: Optional[float] = None,
+    scheduler: Optional[AdaptivePollScheduler] = None,
+) -> Dict[str, Any]:
+    """Async variant of ``poll_counters``."""
+    start = time.monotonic()
+    session = start_session(scheduler)
+    while True:
+        body = await fetch_counters_async(client, path, action, request_timeout)
+        if body.get("status") in TERMINAL_STATUSES:
+            return body
+        if _timed_out(start, timeout):
+            raise TimeoutError(timeout_message)
+        await asyncio.sleep(poll_delay(poll_interval, session, body.get("completed"), body.get("total")))
+
+
+async def poll_incremental_async(
+    client: Any,
+    path: str,
+    action: str,
+    poll_interval: float,
+    timeout: Optional[float],
+    timeout_message: str,
+    request_timeout: Optional[float] = None,
+    scheduler: Optional[AdaptivePollScheduler] = None,
+) -> Tuple[Dict[str, Any], List[Document]]:
+    """Async variant of ``poll_incremental``."""
+    start = time.monotonic()
+    session = start_session(scheduler)
+    cursor = 0
+    documents: List[Document] = []
+    while True:
+        response = await client.get(status_endpoint(path, skip=cursor), timeout=request_timeout)
+        body = _check(response, action)
+        documents.extend(parse_documents(body, client_result_mode(client)))
+        following = next_skip(body.get("next"))
+        if following is not None and following > cursor:
+            cursor = following
+            continue
+        if body.get("status") in TERMINAL_STATUSES:
+            return body, documents
+        if _timed_out(start, timeout):
+            raise TimeoutError(timeout_message)
+        await asyncio.sleep(poll_delay(poll_interval, session, body.get("completed"), body.get("total")))
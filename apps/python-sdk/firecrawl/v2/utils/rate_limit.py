@@ -0,0 +1,174 @@
+"""
+Client-side rate and concurrency limiting for v2 HTTP clients.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+logger = logging.getLogger("firecrawl")
+
+
+class RateLimiter:
+    """
+    Token bucket plus in-flight cap that makes callers wait locally instead of
+    running into server-side throttling (429s, concurrency-limited queueing).
+
+    One limiter may be shared by any number of threads, sync clients and async
+    clients (on any event loop).
+
+    Args:
+        requests_per_second: Sustained request rate (None for no rate limit)
+        burst: Bucket size, i.e. how many requests may be sent back to back (defaults to the rate, at least 1)
+        max_concurrency: Maximum number of requests in flight (None for no limit)
+        auto_calibrate: Set ``max_concurrency`` from the team's plan limit (``get_concurrency``)
+            before the first request, when the limiter is attached to a Firecrawl client
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        auto_calibrate: bool = False,
+    ):
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+        if burst is not None and burst < 1:
+            raise ValueError("burst must be at least 1")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.requests_per_second = requests_per_second
+        self.burst = burst if burst is not None else max(1, int(requests_per_second or 1))
+        self.max_concurrency = max_concurrency
+        self.auto_calibrate = auto_calibrate
+
+        self._cond = threading.Condition(threading.Lock())
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._in_flight = 0
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]] = []
+        self._calibrator: Optional[Callable[[], Optional[int]]] = None
+        self._calibrated = False
+
+    @property
+    def in_flight(self) -> int:
+        with self._cond:
+            return self._in_flight
+
+    def set_max_concurrency(self, max_concurrency: Optional[int]) -> None:
+        """Change the in-flight cap, waking waiters if it grew."""
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        with self._cond:
+            self.max_concurrency = max_concurrency
+            self._cond.notify_all()
+            waiters = self._drain_async_waiters()
+        self._wake(waiters)
+
+    def set_calibrator(self, calibrator: Callable[[], Optional[int]]) -> None:
+        """Register the callable used to look up the plan's concurrency limit."""
+        self._calibrator = calibrator
+
+    def calibrate(self) -> Optional[int]:
+        """Query the calibrator now and apply its concurrency limit."""
+        if self._calibrator is None:
+            return self.max_concurrency
+        self._calibrated = True
+        limit = self._calibrator()
+        if limit:
+            self._apply_calibration(int(limit))
+            logger.debug("Rate limiter calibrated to plan concurrency %s", limit)
+        return self.max_concurrency
+
+    def _apply_calibration(self, limit: int) -> None:
+        self.set_max_concurrency(limit)
+
+    def record_response(self, status_code: int) -> None:
+        """Feedback hook called with every response status; static limits ignore it."""
+
+    def record_document(self, document: Any) -> None:
+        """Feedback hook called with scraped documents; static limits ignore it."""
+
+    def _maybe_calibrate(self) -> None:
+        if not self.auto_calibrate or self._calibrated or self._calibrator is None:
+            return
+        # Flag first so the calibration request itself does not recurse
+        self._calibrated = True
+        try:
+            self.calibrate()
+        except Exception as exc:
+            logger.warning("Rate limiter calibration failed: %s", exc)
+
+    def _try_reserve(self) -> Tuple[bool, Optional[float]]:
+        """Must hold the lock. Returns (acquired, seconds to wait or None to wait for a release)."""
+        if self.max_concurrency is not None and self._in_flight >= self.max_concurrency:
+            return False, None
+        if self.requests_per_second is not None:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.burst),
+                self._tokens + (now - self._last_refill) * self.requests_per_second,
+            )
+            self._last_refill = now
+            if self._tokens < 1:
+                return False, (1 - self._tokens) / self.requests_per_second
+            self._tokens -= 1
+        self._in_flight += 1
+        return True, None
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        self._maybe_calibrate()
+        with self._cond:
+            while True:
+                acquired, wait = self._try_reserve()
+                if acquired:
+                    return
+                self._cond.wait(timeout=wait)
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a request may be sent."""
+        if self.auto_calibrate and not self._calibrated and self._calibrator is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self._maybe_calibrate)
+        loop = asyncio.get_running_loop()
+        while True:
+            future: Optional["asyncio.Future[None]"] = None
+            with self._cond:
+                acquired, wait = self._try_reserve()
+                if acquired:
+                    return
+                if wait is None:
+                    future = loop.create_future()
+                    self._async_waiters.append((loop, future))
+            if future is not None:
+                await future
+            else:
+                await asyncio.sleep(wait)
+
+    def release(self) -> None:
+        """Return the in-flight slot taken by ``acquire``/``acquire_async``."""
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._cond.notify()
+            waiters = self._drain_async_waiters()
+        self._wake(waiters)
+
+    def _drain_async_waiters(self) -> List[Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]]:
+        waiters, self._async_waiters = self._async_waiters, []
+        return waiters
+
+    @staticmethod
+    def _wake(waiters: List[Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]]) -> None:
+        # Waiters re-contend for the slot, so waking all of them is safe
+        for loop, future in waiters:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_resolve, future)
+
+
+def _resolve(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
@@ -0,0 +1,200 @@
+"""
+Retry policy shared by the sync and async v2 HTTP clients.
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Collection, Optional
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+# Statuses meaning the request was never processed, so replaying a POST is safe.
+# A 504 may arrive after the server already started the job, so it is excluded.
+DEFAULT_POST_RETRY_STATUSES = frozenset({429, 502, 503})
+
+
+class RetryBudget:
+    """
+    Limits retries to a fraction of regular traffic so retries cannot amplify an outage.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one. A small
+    time-based allowance (``min_retries_per_second``) keeps low-traffic clients able
+    to retry at all. The budget is thread-safe and may be shared between clients.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries_per_second: float = 1.0,
+        max_tokens: float = 50.0,
+    ):
+        if ratio < 0:
+            raise ValueError("ratio must be non-negative")
+        if min_retries_per_second < 0:
+            raise ValueError("min_retries_per_second must be non-negative")
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1")
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.max_tokens, self._tokens + elapsed * self.min_retries_per_second)
+
+    def record_request(self) -> None:
+        """Deposit tokens for a first (non-retry) attempt."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_acquire(self) -> bool:
+        """Withdraw one retry token. Returns False when the budget is exhausted."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is retried.
+
+    Args:
+        max_attempts: Total attempts per request, including the first one
+        backoff_factor: Base delay in seconds; attempt ``n`` waits up to ``backoff_factor * 2**n``
+        max_backoff: Upper bound for a single computed backoff delay
+        retry_statuses: HTTP statuses retried for idempotent requests (GET/DELETE)
+        post_retry_statuses: HTTP statuses retried for POST requests
+        retry_on_network_errors: Whether connection errors and timeouts are retried
+        respect_retry_after: Honor the ``Retry-After`` response header when present
+        max_retry_after: Give up instead of waiting when ``Retry-After`` exceeds this many seconds
+        jitter: Use full jitter (a uniform delay between 0 and the backoff) to avoid retry storms
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        retry_statuses: Collection[int] = DEFAULT_RETRY_STATUSES,
+        post_retry_statuses: Collection[int] = DEFAULT_POST_RETRY_STATUSES,
+        retry_on_network_errors: bool = True,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 60.0,
+        jitter: bool = True,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if backoff_factor < 0:
+            raise ValueError("backoff_factor must be non-negative")
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.post_retry_statuses = frozenset(post_retry_statuses)
+        self.retry_on_network_errors = retry_on_network_errors
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.jitter = jitter
+
+    def replace(self, **overrides: Any) -> "RetryPolicy":
+        """Return a copy of this policy with the given fields overridden (None values are ignored)."""
+        fields = dict(
+            max_attempts=self.max_attempts,
+            backoff_factor=self.backoff_factor,
+            max_backoff=self.max_backoff,
+            retry_statuses=self.retry_statuses,
+            post_retry_statuses=self.post_retry_statuses,
+            retry_on_network_errors=self.retry_on_network_errors,
+            respect_retry_after=self.respect_retry_after,
+            max_retry_after=self.max_retry_after,
+            jitter=self.jitter,
+        )
+        fields.update({k: v for k, v in overrides.items() if v is not None})
+        return RetryPolicy(**fields)
+
+    def can_retry(self, attempt: int) -> bool:
+        """Whether another attempt is allowed after the zero-based ``attempt``."""
+        return attempt + 1 < self.max_attempts
+
+    def is_retryable_status(self, method: str, status_code: Any) -> bool:
+        statuses = self.post_retry_statuses if method.upper() == "POST" else self.retry_statuses
+        return status_code in statuses
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retrying after the zero-based ``attempt``."""
+        ceiling = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        if self.jitter:
+            return random.uniform(0, ceiling)
+        return ceiling
+
+    def delay_for_response(self, attempt: int, headers: Any) -> Optional[float]:
+        """
+        Delay before retrying a response with a retryable status.
+
+        Returns None when the server asked us to wait longer than ``max_retry_after``.
+        """
+        if self.respect_retry_after:
+            retry_after = parse_retry_after(_header(headers, "Retry-After"))
+            if retry_after is not None:
+                if retry_after > self.max_retry_after:
+                    return None
+                # Spread clients that all received the same Retry-After value
+                if self.jitter:
+                    return retry_after + random.uniform(0, self.backoff_factor)
+                return retry_after
+        return self.backoff(attempt)
+
+
+def _header(headers: Any, name: str) -> Optional[str]:
+    try:
+        value = headers.get(name)
+    except Exception:
+        return None
+    return value if isinstance(value, str) else None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def resolve_retry_policy(
+    policy: RetryPolicy,
+    override: Optional[RetryPolicy] = None,
+    retries: Optional[int] = None,
+    backoff_factor: Optional[float] = None,
+) -> RetryPolicy:
+    """Apply per-call overrides on top of a client's default policy."""
+    base = override or policy
+    if retries is None and backoff_factor is None:
+        return base
+    return base.replace(max_attempts=retries, backoff_factor=backoff_factor)
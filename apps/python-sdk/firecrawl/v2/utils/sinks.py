@@ -0,0 +1,316 @@
+"""
+Document sinks: write crawl and batch scrape results to disk as they are downloaded.
+
+Sinks receive the raw documents of each result page and write them in batches on a
+background thread, so disk I/O overlaps with downloading the next page and no list
+of ``Document`` objects is built.
+"""
+
+import asyncio
+import queue
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import json_codec
+from .pagination import aiter_status_pages, iter_status_pages
+from ..types import PaginationConfig
+
+_STOP = object()
+
+
+def _split(document: Dict[str, Any]) -> Tuple[Optional[str], Optional[str], bytes, bytes]:
+    """Columns shared by the tabular sinks: url, markdown, metadata JSON and the remaining fields as JSON."""
+    metadata = document.get("metadata") or {}
+    rest = {k: v for k, v in document.items() if k not in ("markdown", "metadata")}
+    url = metadata.get("sourceURL") or metadata.get("url") or document.get("url")
+    return url, document.get("markdown"), json_codec.dumps(metadata), json_codec.dumps(rest)
+
+
+class DocumentSink:
+    """
+    Base class for sinks. Subclasses implement ``_write_batch`` and optionally
+    ``_flush`` and ``_close``; all three run on the writer thread.
+
+    ``write`` hands a page of raw documents to the writer thread and only blocks
+    when ``max_pending_pages`` pages are queued. Errors raised while writing are
+    re-raised by the next ``write``, ``flush`` or ``close``. Use a sink as a
+    context manager or call ``close`` to write the final batch.
+
+    Args:
+        batch_size: Documents collected before a batch is written
+        max_pending_pages: Pages queued for the writer before ``write`` blocks
+    """
+
+    def __init__(self, batch_size: int = 1000, max_pending_pages: int = 16):
+        if batch_size < 1 or max_pending_pages < 1:
+            raise ValueError("batch_size and max_pending_pages must be at least 1")
+        self.batch_size = batch_size
+        self.written = 0
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_pending_pages)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._error: Optional[BaseException] = None
+        self._closed = False
+
+    def _write_batch(self, documents: List[Dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    def _flush(self) -> None:
+        pass
+
+    def _close(self) -> None:
+        pass
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _ensure_thread(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="firecrawl-sink", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        batch: List[Dict[str, Any]] = []
+
+        def write_pending() -> None:
+            if batch and self._error is None:
+                try:
+                    self._write_batch(batch)
+                    self.written += len(batch)
+                except Exception as exc:
+                    self._error = exc
+            batch.clear()
+
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                write_pending()
+                try:
+                    self._close()
+                except Exception as exc:
+                    self._error = self._error or exc
+                return
+            if isinstance(item, threading.Event):
+                write_pending()
+                if self._error is None:
+                    try:
+                        self._flush()
+                    except Exception as exc:
+                        self._error = exc
+                item.set()
+                continue
+            batch.extend(item)
+            if len(batch) >= self.batch_size:
+                write_pending()
+
+    def write(self, documents: List[Dict[str, Any]]) -> None:
+        """Queue a page of raw API documents for writing."""
+        self._raise_error()
+        if self._closed:
+            raise ValueError("write to a closed sink")
+        documents = [doc for doc in documents if isinstance(doc, dict)]
+        if not documents:
+            return
+        self._ensure_thread()
+        self._queue.put(documents)
+
+    def flush(self) -> None:
+        """Write all queued documents and wait until they are written."""
+        if self._thread is not None and not self._closed:
+            done = threading.Event()
+            self._queue.put(done)
+            done.wait()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Write the remaining documents and release the underlying file or database."""
+        if not self._closed:
+            self._closed = True
+            if self._thread is not None:
+                self._queue.put(_STOP)
+                self._thread.join()
+            else:
+                self._close()
+        self._raise_error()
+
+    def __enter__(self) -> "DocumentSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class JsonlSink(DocumentSink):
+    """
+    Appends each raw document as one JSON line.
+
+    Args:
+        path: Output file, created if missing and appended to otherwise
+    """
+
+    def __init__(self, path: str, *, batch_size: int = 1000, max_pending_pages: int = 16):
+        super().__init__(batch_size=batch_size, max_pending_pages=max_pending_pages)
+        self.path = path
+        self._file = None
+
+    def _write_batch(self, documents: List[Dict[str, Any]]) -> None:
+        if self._file is None:
+            self._file = open(self.path, "ab")
+        self._file.write(b"".join(json_codec.dumps(doc) + b"\n" for doc in documents))
+
+    def _flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class SQLiteSink(DocumentSink):
+    """
+    Inserts documents into a SQLite table with ``url``, ``markdown``, ``metadata``
+    (JSON) and ``document`` (JSON of the remaining fields) columns, one transaction per batch.
+
+    Args:
+        path: Database file
+        table: Table name, created if missing
+    """
+
+    def __init__(self, path: str, table: str = "documents", *, batch_size: int = 1000, max_pending_pages: int = 16):
+        if not table.isidentifier():
+            raise ValueError("table must be a valid identifier")
+        super().__init__(batch_size=batch_size, max_pending_pages=max_pending_pages)
+        self.path = path
+        self.table = table
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # Opened on the writer thread, which is the only thread using it
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, timeout=30)
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, url TEXT, markdown TEXT, metadata TEXT, document TEXT)"
+            )
+        return self._conn
+
+    def _write_batch(self, documents: List[Dict[str, Any]]) -> None:
+        conn = self._connection()
+        rows = []
+        for doc in documents:
+            url, markdown, metadata, rest = _split(doc)
+            rows.append((url, markdown, metadata.decode("utf-8"), rest.decode("utf-8")))
+        with conn:
+            conn.executemany(
+                f"INSERT INTO {self.table} (url, markdown, metadata, document) VALUES (?, ?, ?, ?)", rows
+            )
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class ParquetSink(DocumentSink):
+    """
+    Writes documents to a Parquet file, one row group per batch, with ``url``,
+    ``markdown``, ``metadata`` (JSON) and ``document`` (JSON of the remaining
+    fields) string columns.
+
+    Requires ``pyarrow`` (``pip install firecrawl-py[parquet]``).
+
+    Args:
+        path: Output file, overwritten
+        compression: Parquet compression codec
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        compression: str = "zstd",
+        batch_size: int = 10000,
+        max_pending_pages: int = 16,
+    ):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as exc:
+            raise ImportError(
+                "pyarrow is required for ParquetSink; install it with `pip install firecrawl-py[parquet]`"
+            ) from exc
+        super().__init__(batch_size=batch_size, max_pending_pages=max_pending_pages)
+        self.path = path
+        self.compression = compression
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self._schema = pyarrow.schema(
+            [(name, pyarrow.string()) for name in ("url", "markdown", "metadata", "document")]
+        )
+        self._writer = None
+
+    def _write_batch(self, documents: List[Dict[str, Any]]) -> None:
+        columns: Dict[str, List[Optional[str]]] = {"url": [], "markdown": [], "metadata": [], "document": []}
+        for doc in documents:
+            url, markdown, metadata, rest = _split(doc)
+            columns["url"].append(url)
+            columns["markdown"].append(markdown)
+            columns["metadata"].append(metadata.decode("utf-8"))
+            columns["document"].append(rest.decode("utf-8"))
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self.path, self._schema, compression=self.compression)
+        self._writer.write_table(self._pa.Table.from_pydict(columns, schema=self._schema))
+
+    def _close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def write_status_pages(
+    client: Any,
+    path: str,
+    action: str,
+    sink: DocumentSink,
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    request_timeout: Optional[float] = None,
+) -> int:
+    """Stream every result page of a job into ``sink`` and wait until written; returns the documents handed over."""
+    count = 0
+    for page in iter_status_pages(client, path, action, pagination_config, request_timeout=request_timeout):
+        documents = page.pop("data", None) or []
+        sink.write(documents)
+        count += len(documents)
+    sink.flush()
+    return count
+
+
+async def write_status_pages_async(
+    client: Any,
+    path: str,
+    action: str,
+    sink: DocumentSink,
+    pagination_config: Optional[PaginationConfig] = None,
+    *,
+    request_timeout: Optional[float] = None,
+) -> int:
+    """Async variant of ``write_status_pages``; blocking sink calls run in the default executor."""
+    loop = asyncio.get_running_loop()
+    count = 0
+    pages = aiter_status_pages(client, path, action, pagination_config, request_timeout=request_timeout)
+    try:
+        async for page in pages:
+            documents = page.pop("data", None) or []
+            await loop.run_in_executor(None, sink.write, documents)
+            count += len(documents)
+    finally:
+        await pages.aclose()
+    await loop.run_in_executor(None, sink.flush)
+    return count
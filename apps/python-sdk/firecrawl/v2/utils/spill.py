@@ -0,0 +1,234 @@
+"""
+Bounded-memory document storage for large crawl and batch scrape results.
+"""
+
+import asyncio
+import tempfile
+import threading
+from array import array
+from collections import deque
+from collections.abc import Sequence
+from typing import IO, Any, Deque, Iterable, Iterator, List, Optional, Tuple, Union, overload
+
+from . import json_codec
+from .pagination import aiter_status_pages, iter_status_documents
+from .documents import DICT_MODES, CompactDocument, LazyDocument, client_result_mode
+from .polling import parse_documents
+from ..types import Document, ResultMode
+
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+
+# Documents read from disk per read() while iterating
+_READ_CHUNK = 256
+
+
+def _estimate_size(document: Any) -> int:
+    """Approximate in-memory size of a document, dominated by its content strings."""
+    size = 512
+    if isinstance(document, dict):
+        fields = document
+    elif isinstance(document, LazyDocument):
+        # Lazy documents hold their content in the response dict until fields are read
+        fields = document._raw
+    elif isinstance(document, CompactDocument):
+        fields = dict(document._items())
+    else:
+        fields = document.__dict__
+    for value in fields.values():
+        if isinstance(value, str):
+            size += len(value)
+        elif isinstance(value, list):
+            size += sum(len(item) for item in value if isinstance(item, str))
+    return size
+
+
+class SpillingDocumentList(Sequence):
+    """
+    Read-only list of documents keeping at most ``memory_budget`` bytes in memory.
+
+    Documents are appended in order; once the newest documents exceed the budget the
+    oldest ones are serialized to an append-only temporary file and read back (as new
+    ``Document`` objects) when indexed or iterated. Supports ``len``, indexing, slicing
+    and iteration like the ``List[Document]`` it replaces on ``CrawlJob.data`` and
+    ``BatchScrapeJob.data``. Sizes are estimated from the documents' string fields.
+
+    The file is deleted on ``close`` (or when the list is garbage collected).
+
+    Args:
+        documents: Initial documents
+        memory_budget: Approximate bytes of documents kept in memory
+        directory: Directory for the spill file (defaults to the system temp directory)
+        result_mode: With ``"dict"`` or ``"raw"`` the documents are plain dicts and are
+            read back from disk as dicts; with ``"compact"`` they are read back as
+            ``CompactDocument``
+    """
+
+    def __init__(
+        self,
+        documents: Iterable[Document] = (),
+        *,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        directory: Optional[str] = None,
+        result_mode: ResultMode = "model",
+    ):
+        if memory_budget < 0:
+            raise ValueError("memory_budget must not be negative")
+        self.memory_budget = memory_budget
+        self.directory = directory
+        self._dicts = result_mode in DICT_MODES
+        self._compact = result_mode == "compact"
+        self._memory: Deque[Tuple[Document, int]] = deque()
+        self._memory_bytes = 0
+        # Start offset of every spilled document; each ends where the next begins
+        self._offsets = array("Q")
+        self._end = 0
+        self._file: Optional[IO[bytes]] = None
+        self._lock = threading.Lock()
+        self.extend(documents)
+
+    @property
+    def spilled(self) -> int:
+        """Number of documents stored on disk."""
+        return len(self._offsets)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Estimated bytes of the documents held in memory."""
+        return self._memory_bytes
+
+    def append(self, document: Document) -> None:
+        size = _estimate_size(document)
+        with self._lock:
+            self._memory.append((document, size))
+            self._memory_bytes += size
+            while self._memory_bytes > self.memory_budget and self._memory:
+                oldest, oldest_size = self._memory.popleft()
+                self._spill(oldest)
+                self._memory_bytes -= oldest_size
+
+    def extend(self, documents: Iterable[Document]) -> None:
+        for document in documents:
+            self.append(document)
+
+    def _spill(self, document: Document) -> None:
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(dir=self.directory, prefix="firecrawl-spill-")
+        if self._dicts:
+            payload = document
+        elif self._compact:
+            payload = document.to_dict()
+        else:
+            payload = document.model_dump(mode="json", exclude_none=True)
+        data = json_codec.dumps(payload)
+        self._file.seek(self._end)
+        self._file.write(data)
+        self._offsets.append(self._end)
+        self._end += len(data)
+
+    def _read(self, start: int, stop: int) -> List[Document]:
+        """Spilled documents ``start:stop``, read with one contiguous read."""
+        with self._lock:
+            assert self._file is not None
+            offsets = self._offsets[start:stop]
+            end = self._offsets[stop] if stop < len(self._offsets) else self._end
+            self._file.seek(offsets[0])
+            data = self._file.read(end - offsets[0])
+        base = offsets[0]
+        bounds = [offset - base for offset in offsets] + [len(data)]
+        chunks = [data[bounds[i]:bounds[i + 1]] for i in range(len(offsets))]
+        if self._dicts:
+            return [json_codec.loads(chunk) for chunk in chunks]
+        if self._compact:
+            return [CompactDocument.from_api(json_codec.loads(chunk)) for chunk in chunks]
+        # Validated straight from the JSON bytes, without building intermediate dicts
+        return [Document.model_validate_json(chunk) for chunk in chunks]
+
+    def __len__(self) -> int:
+        return len(self._offsets) + len(self._memory)
+
+    @overload
+    def __getitem__(self, index: int) -> Document: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Document]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Document, List[Document]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("document index out of range")
+        with self._lock:
+            spilled = len(self._offsets)
+            if index >= spilled:
+                return self._memory[index - spilled][0]
+        return self._read(index, index + 1)[0]
+
+    def __iter__(self) -> Iterator[Document]:
+        index = 0
+        while True:
+            with self._lock:
+                spilled = len(self._offsets)
+                if index >= spilled:
+                    remaining = [doc for doc, _ in list(self._memory)[index - spilled:]]
+            if index >= spilled:
+                yield from remaining
+                return
+            stop = min(spilled, index + _READ_CHUNK)
+            yield from self._read(index, stop)
+            index = stop
+
+    def close(self) -> None:
+        """Delete the spill file; spilled documents are no longer readable afterwards."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._offsets = array("Q")
+            self._end = 0
+
+    def __enter__(self) -> "SpillingDocumentList":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<SpillingDocumentList {len(self)} documents, {self.spilled} on disk>"
+
+
+def collect_status_documents(
+    client: Any,
+    path: str,
+    action: str,
+    memory_budget: int,
+    *,
+    request_timeout: Optional[float] = None,
+) -> SpillingDocumentList:
+    """Download every result page of a job into a ``SpillingDocumentList``."""
+    documents = SpillingDocumentList(memory_budget=memory_budget, result_mode=client_result_mode(client))
+    documents.extend(iter_status_documents(client, path, action, request_timeout=request_timeout))
+    return documents
+
+
+async def collect_status_documents_async(
+    client: Any,
+    path: str,
+    action: str,
+    memory_budget: int,
+    *,
+    request_timeout: Optional[float] = None,
+) -> SpillingDocumentList:
+    """Async variant of ``collect_status_documents``; parsing and spilling run in the default executor."""
+    loop = asyncio.get_running_loop()
+    mode = client_result_mode(client)
+    documents = SpillingDocumentList(memory_budget=memory_budget, result_mode=mode)
+    pages = aiter_status_pages(client, path, action, request_timeout=request_timeout)
+    try:
+        async for page in pages:
+            await loop.run_in_executor(None, lambda page=page: documents.extend(parse_documents(page, mode)))
+    finally:
+        await pages.aclose()
+    return documents
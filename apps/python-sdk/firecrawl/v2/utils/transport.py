@@ -0,0 +1,373 @@
+"""
+Pluggable transports underneath the v2 HTTP clients.
+
+``HttpClient`` sends through ``RequestsTransport`` and ``AsyncHttpClient`` through
+``HttpxTransport`` unless another transport is passed. ``MockTransport`` answers
+from an in-memory script and ``CassetteTransport`` records real sessions to disk and
+replays them, so SDK-side code can be exercised and profiled offline.
+"""
+
+import base64
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Mapping, NamedTuple, Optional, Pattern, Tuple, Union
+from urllib.parse import urlparse
+
+from requests.structures import CaseInsensitiveDict
+
+from . import json_codec
+
+# Hop-by-hop and encoding headers no longer describe a body that has been decoded
+_DROPPED_RESPONSE_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection"})
+
+
+class TransportRequest(NamedTuple):
+    method: str
+    url: str
+    headers: Mapping[str, str]
+    content: Optional[bytes]
+    timeout: Optional[float]
+
+    @property
+    def target(self) -> str:
+        """Path and query of the request URL, without scheme and host."""
+        parsed = urlparse(self.url)
+        return f"{parsed.path}?{parsed.query}" if parsed.query else parsed.path
+
+    def json(self) -> Any:
+        return json_codec.loads(self.content) if self.content else None
+
+
+class TransportResponse:
+    """Minimal response returned by in-process transports; mirrors the parts of ``requests``/``httpx`` responses the SDK uses."""
+
+    def __init__(
+        self,
+        status_code: int = 200,
+        content: bytes = b"",
+        headers: Optional[Mapping[str, str]] = None,
+        url: str = "",
+    ):
+        self.status_code = status_code
+        self.content = content
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.url = url
+
+    @classmethod
+    def from_json(cls, data: Any, status_code: int = 200, headers: Optional[Mapping[str, str]] = None) -> "TransportResponse":
+        merged = {"Content-Type": "application/json", **(headers or {})}
+        return cls(status_code, json_codec.dumps(data), merged)
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def is_success(self) -> bool:
+        return 200 <= self.status_code < 300
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json_codec.loads(self.content)
+
+    def close(self) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+    def __repr__(self) -> str:
+        return f"<TransportResponse [{self.status_code}]>"
+
+
+class Transport:
+    """
+    Sends one HTTP request and returns the response.
+
+    Sync transports implement ``send``, async transports implement ``asend``; in-process
+    transports implement both so one instance can serve sync and async clients.
+    Network failures should be raised as ``requests.RequestException`` (sync) or
+    ``httpx.TransportError`` (async) so the clients' retry policy applies.
+    """
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        content: Optional[bytes] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        raise NotImplementedError(f"{type(self).__name__} does not support synchronous requests")
+
+    async def asend(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Mapping[str, str],
+        content: Optional[bytes] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        raise NotImplementedError(f"{type(self).__name__} does not support asynchronous requests")
+
+    def bind(self, default: "Transport") -> None:
+        """Called by a client with its default network transport; wrapping transports may delegate to it."""
+
+    def close(self) -> None:
+        pass
+
+
+class RequestsTransport(Transport):
+    """Sends through a ``requests.Session`` obtained from ``get_session`` on every call."""
+
+    def __init__(self, get_session: Callable[[], Any]):
+        self._get_session = get_session
+
+    def send(self, method, url, *, headers, content=None, timeout=None):
+        kwargs: Dict[str, Any] = {"headers": headers, "timeout": timeout}
+        if content is not None:
+            kwargs["data"] = content
+        return getattr(self._get_session(), method.lower())(url, **kwargs)
+
+
+class HttpxTransport(Transport):
+    """Sends through an ``httpx.AsyncClient`` obtained from ``get_client`` on every call."""
+
+    def __init__(self, get_client: Callable[[], Any]):
+        self._get_client = get_client
+
+    async def asend(self, method, url, *, headers, content=None, timeout=None):
+        kwargs: Dict[str, Any] = {"headers": headers, "timeout": timeout}
+        if content is not None:
+            kwargs["content"] = content
+        return await self._get_client().request(method, url, **kwargs)
+
+
+class UnmatchedRequestError(LookupError):
+    """Raised by in-process transports when no scripted or recorded response matches a request."""
+
+    def __init__(self, request: TransportRequest):
+        super().__init__(f"No response for {request.method} {request.target}")
+        self.request = request
+
+
+Handler = Callable[[TransportRequest], Any]
+ResponseSpec = Union[TransportResponse, Handler]
+
+
+class MockTransport(Transport):
+    """
+    In-memory transport answering from scripted routes, for tests and offline benchmarks.
+
+    Routes match on method and on the request path (a string also containing ``?`` is
+    compared with path and query and takes precedence; a compiled regex is full-matched
+    against path and query). Routes are tried in registration order; a route added with ``times`` is
+    used that many times, otherwise it answers indefinitely. ``handler`` answers
+    requests no route matched. Every request is kept in ``requests``.
+
+    Example:
+        transport = MockTransport()
+        transport.add("POST", "/v2/crawl", json={"success": True, "id": "c1", "url": "..."})
+        transport.add("GET", "/v2/crawl/c1", json={"status": "completed", "data": []})
+        client = FirecrawlClient(api_key="test", transport=transport)
+    """
+
+    def __init__(self, handler: Optional[Handler] = None):
+        self.handler = handler
+        self.requests: List[TransportRequest] = []
+        self._routes: List[List[Any]] = []
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        method: str,
+        path: Union[str, Pattern[str]],
+        *,
+        json: Any = None,
+        content: bytes = b"",
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        response: Optional[ResponseSpec] = None,
+        times: Optional[int] = None,
+    ) -> "MockTransport":
+        """Register a route answering with ``response`` (a response or a callable), ``json`` or raw ``content``."""
+        if response is None:
+            if json is not None:
+                response = TransportResponse.from_json(json, status_code, headers)
+            else:
+                response = TransportResponse(status_code, content, headers)
+        with self._lock:
+            self._routes.append([method.upper(), path, response, times])
+        return self
+
+    def _match(self, request: TransportRequest) -> Optional[ResponseSpec]:
+        target = request.target
+        path = urlparse(request.url).path
+        with self._lock:
+            self.requests.append(request)
+            candidates = [r for r in self._routes if r[0] == request.method.upper() and r[3] != 0]
+            # Routes naming the exact path and query win over path-only routes
+            exact = [r for r in candidates if isinstance(r[1], str) and "?" in r[1] and r[1] == target]
+            for route in exact or candidates:
+                pattern = route[1]
+                if isinstance(pattern, str):
+                    matched = pattern == (target if "?" in pattern else path)
+                else:
+                    matched = pattern.fullmatch(target) is not None
+                if matched:
+                    if route[3] is not None:
+                        route[3] -= 1
+                    return route[2]
+        return self.handler
+
+    def _respond(self, request: TransportRequest) -> Any:
+        spec = self._match(request)
+        if spec is None:
+            raise UnmatchedRequestError(request)
+        result = spec(request) if callable(spec) else spec
+        if result is None:
+            raise UnmatchedRequestError(request)
+        if not hasattr(result, "status_code"):
+            result = TransportResponse.from_json(result)
+        return result
+
+    def send(self, method, url, *, headers, content=None, timeout=None):
+        return self._respond(TransportRequest(method, url, headers, content, timeout))
+
+    async def asend(self, method, url, *, headers, content=None, timeout=None):
+        return self._respond(TransportRequest(method, url, headers, content, timeout))
+
+
+def _encode_body(content: bytes) -> Dict[str, str]:
+    try:
+        return {"text": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"base64": base64.b64encode(content).decode("ascii")}
+
+
+def _decode_body(body: Mapping[str, str]) -> bytes:
+    if "base64" in body:
+        return base64.b64decode(body["base64"])
+    return body.get("text", "").encode("utf-8")
+
+
+class CassetteTransport(Transport):
+    """
+    Records real request/response pairs to a JSON Lines file and replays them offline.
+
+    Modes:
+        ``"record"``: send through the wrapped transport and append every interaction
+        ``"replay"``: answer only from the cassette, never touching the network
+        ``"auto"``: replay when the cassette file exists, otherwise record
+
+    Only the method, path and query of requests are stored (no host, headers or API
+    keys). Replay answers requests with the same method and path+query in recorded
+    order; once a request's recordings are used up the last one is repeated, so
+    status polling replays to its final state.
+
+    Args:
+        path: Cassette file
+        mode: ``"record"``, ``"replay"`` or ``"auto"``
+        inner: Transport used while recording (defaults to the client's network transport)
+    """
+
+    def __init__(self, path: str, mode: str = "auto", inner: Optional[Transport] = None):
+        if mode not in ("record", "replay", "auto"):
+            raise ValueError("mode must be 'record', 'replay' or 'auto'")
+        if mode == "auto":
+            try:
+                with open(path, "rb"):
+                    mode = "replay"
+            except FileNotFoundError:
+                mode = "record"
+        self.path = path
+        self.mode = mode
+        self.inner = inner
+        self._sync_default: Optional[Transport] = None
+        self._async_default: Optional[Transport] = None
+        self._lock = threading.Lock()
+        self._recordings: Dict[Tuple[str, str], Deque[Dict[str, Any]]] = {}
+        self._last: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        if mode == "replay":
+            self._load()
+        else:
+            open(path, "wb").close()
+
+    def bind(self, default: Transport) -> None:
+        # One cassette may sit under both transports of AsyncFirecrawlClient
+        if type(default).send is not Transport.send:
+            self._sync_default = default
+        if type(default).asend is not Transport.asend:
+            self._async_default = default
+
+    def _load(self) -> None:
+        with open(self.path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json_codec.loads(line)
+                key = (entry["request"]["method"], entry["request"]["target"])
+                self._recordings.setdefault(key, deque()).append(entry["response"])
+
+    def _replay(self, request: TransportRequest) -> TransportResponse:
+        key = (request.method.upper(), request.target)
+        with self._lock:
+            queue = self._recordings.get(key)
+            if queue:
+                recorded = self._last[key] = queue.popleft()
+            else:
+                recorded = self._last.get(key)
+        if recorded is None:
+            raise UnmatchedRequestError(request)
+        return TransportResponse(
+            recorded["status_code"],
+            _decode_body(recorded["body"]),
+            recorded["headers"],
+            url=request.url,
+        )
+
+    def _record(self, request: TransportRequest, response: Any) -> None:
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_RESPONSE_HEADERS}
+        entry = {
+            "request": {
+                "method": request.method.upper(),
+                "target": request.target,
+                "body": _encode_body(request.content) if request.content else None,
+            },
+            "response": {
+                "status_code": response.status_code,
+                "headers": headers,
+                "body": _encode_body(response.content),
+            },
+        }
+        line = json_codec.dumps(entry) + b"\n"
+        with self._lock:
+            with open(self.path, "ab") as f:
+                f.write(line)
+
+    def _require_inner(self, asynchronous: bool) -> Transport:
+        inner = self.inner or (self._async_default if asynchronous else self._sync_default)
+        if inner is None:
+            raise RuntimeError("CassetteTransport in record mode needs a transport to record from")
+        return inner
+
+    def send(self, method, url, *, headers, content=None, timeout=None):
+        request = TransportRequest(method, url, headers, content, timeout)
+        if self.mode == "replay":
+            return self._replay(request)
+        response = self._require_inner(False).send(method, url, headers=headers, content=content, timeout=timeout)
+        self._record(request, response)
+        return response
+
+    async def asend(self, method, url, *, headers, content=None, timeout=None):
+        request = TransportRequest(method, url, headers, content, timeout)
+        if self.mode == "replay":
+            return self._replay(request)
+        response = await self._require_inner(True).asend(method, url, headers=headers, content=content, timeout=timeout)
+        self._record(request, response)
+        return response
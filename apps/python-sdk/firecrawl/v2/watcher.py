@@ -8,20 +8,24 @@ Usage:
 """
 
 import asyncio
-import json
 import threading
 from typing import Callable, List, Optional, Literal, Union, Dict, Any
 
 import websockets
 
-from .types import CrawlJob, BatchScrapeJob, Document
-from .utils.normalize import normalize_document_input
+from .types import CrawlJob, BatchScrapeJob
+from .utils.documents import attach_documents, build_documents, client_result_mode
+from .utils import json_codec
 
 
 JobKind = Literal["crawl", "batch"]
 JobType = Union[CrawlJob, BatchScrapeJob]
 
 
+def _document_dict(document: Any) -> Dict[str, Any]:
+    return document if isinstance(document, dict) else document.model_dump()
+
+
 class Watcher:
     def __init__(
         self,
@@ -43,6 +47,7 @@ class Watcher:
         http_client = getattr(client, "http_client", None)
         self._api_url: Optional[str] = getattr(http_client, "api_url", None)
         self._api_key: Optional[str] = getattr(http_client, "api_key", None)
+        self._result_mode = client_result_mode(http_client)
 
         # v1-parity state and event handlers
         self.status: str = "scraping"
@@ -123,7 +128,7 @@ class Watcher:
                         return
 
                     try:
-                        body = json.loads(msg)
+                        body = json_codec.loads(msg)
                     except Exception:
                         continue
 
@@ -170,11 +175,7 @@ class Watcher:
                         self.dispatch_event("done", {"status": self.status, "data": self.data, "id": self._job_id})
                         self._sent_done = True
                         # Emit a final completed snapshot for listeners and break immediately
-                        docs: List[Document] = []
-                        for doc in self.data:
-                            if isinstance(doc, dict):
-                                d = normalize_document_input(doc)
-                                docs.append(Document(**d))
+                        docs = build_documents(self.data, self._result_mode)
                         if self._kind == "crawl":
                             job = CrawlJob(
                                 status="completed",
@@ -183,8 +184,8 @@ class Watcher:
                                 credits_used=raw_payload.get("creditsUsed", 0),
                                 expires_at=raw_payload.get("expiresAt"),
                                 next=raw_payload.get("next"),
-                                data=docs,
                             )
+                            attach_documents(job, docs)
                         else:
                             job = BatchScrapeJob(
                                 status="completed",
@@ -193,8 +194,8 @@ class Watcher:
                                 credits_used=raw_payload.get("creditsUsed", 0),
                                 expires_at=raw_payload.get("expiresAt"),
                                 next=raw_payload.get("next"),
-                                data=docs,
                             )
+                            attach_documents(job, docs)
                         self._emit(job)
                         break
 
@@ -206,11 +207,7 @@ class Watcher:
                     status_str = payload.get("status", body.get("status", self.status))
 
                     if self._kind == "crawl":
-                        docs = []
-                        for doc in payload.get("data", []):
-                            if isinstance(doc, dict):
-                                d = normalize_document_input(doc)
-                                docs.append(Document(**d))
+                        docs = build_documents(payload.get("data", []), self._result_mode)
                         job = CrawlJob(
                             status=status_str,
                             completed=payload.get("completed", 0),
@@ -218,8 +215,8 @@ class Watcher:
                             credits_used=payload.get("creditsUsed", 0),
                             expires_at=payload.get("expiresAt"),
                             next=payload.get("next"),
-                            data=docs,
                         )
+                        attach_documents(job, docs)
                         self._emit(job)
                         if status_str in ("completed", "failed", "cancelled"):
                             # Ensure done/error dispatched even if server didn't send explicit event type
@@ -231,11 +228,7 @@ class Watcher:
                                 self._sent_error = True
                             break
                     else:
-                        docs = []
-                        for doc in payload.get("data", []):
-                            if isinstance(doc, dict):
-                                d = normalize_document_input(doc)
-                                docs.append(Document(**d))
+                        docs = build_documents(payload.get("data", []), self._result_mode)
                         job = BatchScrapeJob(
                             status=status_str,
                             completed=payload.get("completed", 0),
@@ -243,8 +236,8 @@ class Watcher:
                             credits_used=payload.get("creditsUsed"),
                             expires_at=payload.get("expiresAt"),
                             next=payload.get("next"),
-                            data=docs,
                         )
+                        attach_documents(job, docs)
                         self._emit(job)
                         if status_str in ("completed", "failed", "cancelled"):
                             if status_str == "completed" and not self._sent_done:
@@ -276,10 +269,10 @@ class Watcher:
         self._emit(job)
         if job.status in ("completed", "failed", "cancelled"):
             if job.status == "completed" and not self._sent_done:
-                self.dispatch_event("done", {"status": job.status, "data": [d.model_dump() for d in job.data], "id": self._job_id})
+                self.dispatch_event("done", {"status": job.status, "data": [_document_dict(d) for d in job.data], "id": self._job_id})
                 self._sent_done = True
             if job.status == "failed" and not self._sent_error:
-                self.dispatch_event("error", {"status": job.status, "data": [d.model_dump() for d in job.data], "id": self._job_id})
+                self.dispatch_event("error", {"status": job.status, "data": [_document_dict(d) for d in job.data], "id": self._job_id})
                 self._sent_error = True
             return True
         return False
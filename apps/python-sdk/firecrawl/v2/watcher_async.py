@@ -8,15 +8,15 @@ Usage:
 
 import asyncio
 import inspect
-import json
 import time
 from typing import AsyncIterator, Dict, List, Literal, Optional
 
 import websockets
 from websockets.exceptions import ConnectionClosed, ConnectionClosedOK, ConnectionClosedError
 
-from .types import BatchScrapeJob, CrawlJob, Document
-from .utils.normalize import normalize_document_input
+from .types import BatchScrapeJob, CrawlJob
+from .utils.documents import attach_documents, build_documents, client_result_mode
+from .utils import json_codec
 
 JobKind = Literal["crawl", "batch"]
 
@@ -38,6 +38,7 @@ class AsyncWatcher:
         self._poll_interval: float = max(0.0, float(poll_interval))  # Guard against negative values
 
         http_client = getattr(client, "http_client", None)
+        self._result_mode = client_result_mode(http_client)
         if http_client is not None:
             self._api_url = getattr(http_client, "api_url", None)
             self._api_key = getattr(http_client, "api_key", None)
@@ -112,7 +113,7 @@ class AsyncWatcher:
                                 return
                             await asyncio.sleep(1)
                     try:
-                        body = json.loads(msg)
+                        body = json_codec.loads(msg)
                     except Exception:
                         continue
 
@@ -214,30 +215,26 @@ class AsyncWatcher:
             return None
 
     def _make_snapshot(self, *, status: str, payload: Dict, docs_override: Optional[List[Dict]] = None):
-        docs = []
         source_docs = docs_override if docs_override is not None else payload.get("data", []) or []
-        for doc in source_docs:
-            if isinstance(doc, dict):
-                d = normalize_document_input(doc)
-                docs.append(Document(**d))
+        docs = build_documents(source_docs, self._result_mode)
 
         if self._kind == "crawl":
-            return CrawlJob(
+            job = CrawlJob(
                 status=status,
                 completed=payload.get("completed", 0),
                 total=payload.get("total", 0),
                 credits_used=payload.get("creditsUsed", 0),
                 expires_at=payload.get("expiresAt"),
                 next=payload.get("next"),
-                data=docs,
             )
-        return BatchScrapeJob(
-            status=status,
-            completed=payload.get("completed", 0),
-            total=payload.get("total", 0),
-            credits_used=payload.get("creditsUsed"),
-            expires_at=payload.get("expiresAt"),
-            next=payload.get("next"),
-            data=docs,
-        )
+        else:
+            job = BatchScrapeJob(
+                status=status,
+                completed=payload.get("completed", 0),
+                total=payload.get("total", 0),
+                credits_used=payload.get("creditsUsed"),
+                expires_at=payload.get("expiresAt"),
+                next=payload.get("next"),
+            )
+        return attach_documents(job, docs)
 
@@ -36,6 +36,12 @@ setup(
         'pydantic>=2.0',
         'aiohttp'
     ],
+    extras_require={
+        'http2': ['httpx[http2]'],
+        'fast': ['orjson'],
+        'compression': ['brotli', 'zstandard'],
+        'parquet': ['pyarrow'],
+    },
     python_requires=">=3.8",
     classifiers=[
         "Development Status :: 5 - Production/Stable",
@@ -2,6 +2,7 @@
 Integration tests for agent method with mocked requests.
 """
 
+import json
 import unittest
 from unittest.mock import patch, MagicMock
 from pydantic import BaseModel, Field
@@ -23,8 +24,8 @@ class FoundersSchema(BaseModel):
 class TestAgent(unittest.TestCase):
     """Integration tests for agent method."""
 
-    @patch('firecrawl.v2.utils.http_client.requests.post')
-    @patch('firecrawl.v2.utils.http_client.requests.get')
+    @patch('firecrawl.v2.utils.http_client.requests.Session.post')
+    @patch('firecrawl.v2.utils.http_client.requests.Session.get')
     def test_agent_basic(self, mock_get, mock_post):
         """Test basic agent call."""
         # Mock start agent response
@@ -70,7 +71,7 @@ class TestAgent(unittest.TestCase):
         assert "/v2/agent" in str(post_url)
         
         # Check request body
-        request_body = post_call_args[1]["json"]
+        request_body = json.loads(post_call_args[1]["data"])
         assert request_body["prompt"] == "Find the founders of Firecrawl"
         assert "schema" in request_body
         assert request_body["schema"]["type"] == "object"
@@ -83,7 +84,7 @@ class TestAgent(unittest.TestCase):
         assert result.status == "completed"
         assert result.data is not None
 
-    @patch('firecrawl.v2.utils.http_client.requests.post')
+    @patch('firecrawl.v2.utils.http_client.requests.Session.post')
     def test_agent_with_urls(self, mock_post):
         """Test agent call with URLs."""
         mock_response = MagicMock()
@@ -105,11 +106,11 @@ class TestAgent(unittest.TestCase):
         
         # Check request body includes URLs
         post_call_args = mock_post.call_args
-        request_body = post_call_args[1]["json"]
+        request_body = json.loads(post_call_args[1]["data"])
         assert request_body["urls"] == ["https://example.com", "https://test.com"]
         assert request_body["prompt"] == "Extract information"
 
-    @patch('firecrawl.v2.utils.http_client.requests.post')
+    @patch('firecrawl.v2.utils.http_client.requests.Session.post')
     def test_agent_with_dict_schema(self, mock_post):
         """Test agent call with dict schema."""
         mock_response = MagicMock()
@@ -138,10 +139,10 @@ class TestAgent(unittest.TestCase):
         
         # Check request body includes schema
         post_call_args = mock_post.call_args
-        request_body = post_call_args[1]["json"]
+        request_body = json.loads(post_call_args[1]["data"])
         assert request_body["schema"] == schema
 
-    @patch('firecrawl.v2.utils.http_client.requests.post')
+    @patch('firecrawl.v2.utils.http_client.requests.Session.post')
     def test_agent_with_all_params(self, mock_post):
         """Test agent call with all parameters."""
         mock_response = MagicMock()
@@ -171,7 +172,7 @@ class TestAgent(unittest.TestCase):
         
         # Check all parameters are in request body
         post_call_args = mock_post.call_args
-        request_body = post_call_args[1]["json"]
+        request_body = json.loads(post_call_args[1]["data"])
         assert request_body["prompt"] == "Complete test"
         assert request_body["urls"] == urls
         assert request_body["schema"] == schema
@@ -179,7 +180,7 @@ class TestAgent(unittest.TestCase):
         assert request_body["maxCredits"] == 50
         assert request_body["strictConstrainToURLs"] is True
 
-    @patch('firecrawl.v2.utils.http_client.requests.post')
+    @patch('firecrawl.v2.utils.http_client.requests.Session.post')
     def test_agent_pydantic_schema_normalization(self, mock_post):
         """Test that Pydantic schemas are properly normalized."""
         mock_response = MagicMock()
@@ -200,7 +201,7 @@ class TestAgent(unittest.TestCase):
         
         # Check that schema was normalized to JSON schema format
         post_call_args = mock_post.call_args
-        request_body = post_call_args[1]["json"]
+        request_body = json.loads(post_call_args[1]["data"])
         assert "schema" in request_body
         schema = request_body["schema"]
         assert schema["type"] == "object"
@@ -208,8 +209,8 @@ class TestAgent(unittest.TestCase):
         assert "founders" in schema["properties"]
         assert schema["properties"]["founders"]["type"] == "array"
 
-    @patch('firecrawl.v2.utils.http_client.requests.post')
-    @patch('firecrawl.v2.utils.http_client.requests.get')
+    @patch('firecrawl.v2.utils.http_client.requests.Session.post')
+    @patch('firecrawl.v2.utils.http_client.requests.Session.get')
     def test_agent_url_construction(self, mock_get, mock_post):
         """Test that agent requests are sent to correct URL."""
         # Mock start agent response
@@ -238,7 +239,7 @@ class TestAgent(unittest.TestCase):
         app = FirecrawlApp(api_key="test-api-key", api_url="https://api.firecrawl.dev")
         result = app.agent(prompt="Test prompt")
         
-        # Check POST URL - requests.post is called with url as keyword arg
+        # Check POST URL - Session.post is called with url as keyword arg
         post_call_args = mock_post.call_args
         post_url = post_call_args[1].get("url") if "url" in post_call_args[1] else post_call_args[0][0]
         assert "/v2/agent" in str(post_url)
@@ -248,7 +249,7 @@ class TestAgent(unittest.TestCase):
         get_url = get_call_args[1].get("url") if "url" in get_call_args[1] else get_call_args[0][0]
         assert "/v2/agent/test-agent-123" in str(get_url)
 
-    @patch('firecrawl.v2.utils.http_client.requests.post')
+    @patch('firecrawl.v2.utils.http_client.requests.Session.post')
     def test_agent_headers(self, mock_post):
         """Test that agent requests include correct headers."""
         mock_response = MagicMock()